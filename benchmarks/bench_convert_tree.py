@@ -0,0 +1,52 @@
+"""
+Times convertLanguageTree on generated DefInjected / Keyed trees of growing size, with the peak traced memory
+of the converting process, which should stay flat as the trees grow, since the rows are streamed.
+
+usage: python benchmarks/bench_convert_tree.py [nodes ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+
+
+def writeTree(root, nodes, nodesPerFile=500):
+    """An annotated Korean tree: one class per 20 files, a tenth of the nodes in Keyed."""
+    for start in range(0, nodes, nodesPerFile):
+        number = start // nodesPerFile
+        folder = 'Keyed' if number % 10 == 9 else f"DefInjected/ThingDef{number // 20}"
+        os.makedirs(os.path.join(root, 'Languages', 'Korean', folder), exist_ok=True)
+        with open(os.path.join(root, 'Languages', 'Korean', folder, f"File{number}.xml"), 'w',
+                  encoding='UTF8') as fout:
+            fout.write('<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n')
+            for i in range(start, min(start + nodesPerFile, nodes)):
+                fout.write(f"  <!-- EN: thing {i} &amp; more -->\n  <Thing{i}.label>물건 {i}</Thing{i}.label>\n")
+            fout.write('</LanguageData>')
+
+
+def main(sizes):
+    print(f"{'nodes':>8} {'files':>6} {'seconds':>8} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as workDir:
+        workDir = workDir.replace('\\', '/')
+        for nodes in sizes:
+            root = f"{workDir}/Mod{nodes}"
+            writeTree(root, nodes)
+            start = time.perf_counter()
+            _, converted, _, unreadFiles, _, error = AlphaExtractor.convertLanguageTree(root, workDir)
+            seconds = time.perf_counter() - start
+            assert not error and not unreadFiles and converted == nodes, (error, unreadFiles, converted)
+
+            tracemalloc.start()  # again, as tracing slows the run down
+            AlphaExtractor.convertLanguageTree(root, workDir)
+            _, size = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{nodes:>8} {-(-nodes // 500):>6} {seconds:>8.2f} {size / 2 ** 20:>8.1f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 50000, 200000])
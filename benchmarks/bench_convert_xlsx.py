@@ -0,0 +1,83 @@
+"""
+Times the xlsx to xml conversion of several translated RimWaldo sheets, one file after another and in the process pool,
+and compares the peak memory of converting one sheet with the conversion it replaced.
+
+usage: python benchmarks/bench_convert_xlsx.py [files] [rows per file]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+
+
+def writeSheet(filename, modName, rows):
+    """A translated sheet in the layout of exportXlsx."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    configColumn = ["Configs [Not chosen]", "pakageID", f"bench.{modName}", "modName (folderName)", modName]
+    ws.append(["Class+Node [(Identifier (Key)]", "Class [Not chosen]", "Node [Not chosen]", "EN [Source string]",
+               "KO [Translation]", configColumn[0]])
+    for i in range(1, rows + 1):
+        className = 'Keyed' if i % 10 == 0 else f"ThingDef{i % 40}"
+        row = [f"{className}+Thing{i}.label", className, f"Thing{i}.label", f"thing {i}", f"물건 {i}"]
+        ws.append(row + [configColumn[i]] if i < len(configColumn) else row)
+    wb.save(filename)
+
+
+def loadWhole(filename):
+    """The rows as convertXLSX2XML read them before streaming: a copy of the file, then a dict of every class."""
+    from openpyxl import load_workbook
+
+    with open(filename, "rb") as f:
+        ioFile = io.BytesIO(f.read())
+    ws = load_workbook(ioFile, read_only=True).active
+    xmlDict = {}
+    for className, nodeName, _, translation in ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True):
+        if className and nodeName and translation:
+            xmlDict.setdefault(className, {})[nodeName] = translation
+    return xmlDict
+
+
+def peak(function, *args):
+    tracemalloc.start()
+    function(*args)
+    _, size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main(files=4, rows=20000):
+    with tempfile.TemporaryDirectory() as workDir:
+        workDir = workDir.replace('\\', '/')
+        filenames = [f"{workDir}/Mod{i}.xlsx" for i in range(files)]
+        for i, filename in enumerate(filenames):
+            writeSheet(filename, f"Mod{i}", rows)
+
+        print(f"{'peak MB':>8} {'whole':>8} {'streamed':>8}")
+        print(f"{'':>8} {peak(loadWhole, filenames[0]) / 2 ** 20:>8.1f} "
+              f"{peak(AlphaExtractor.convertXlsxFile, filenames[0], f'{workDir}/peak') / 2 ** 20:>8.1f}")
+
+        jobs = os.cpu_count() or 1
+        print(f"{'mode':>8} {'files':>6} {'rows':>8} {'seconds':>8}")
+        start = time.perf_counter()
+        for filename in filenames:
+            assert not AlphaExtractor.convertXlsxFile(filename, f"{workDir}/serial")[-1]
+        print(f"{'serial':>8} {files:>6} {files * rows:>8} {time.perf_counter() - start:>8.2f}")
+
+        start = time.perf_counter()
+        for _, result in AlphaExtractor.runInPool(AlphaExtractor.convertXlsxFile, filenames, jobs, None,
+                                                  f"{workDir}/pool"):
+            assert not result[-1], result
+        print(f"{f'pool {jobs}':>8} {files:>6} {files * rows:>8} {time.perf_counter() - start:>8.2f}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
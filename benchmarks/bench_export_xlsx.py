@@ -0,0 +1,61 @@
+"""
+Compares the in-memory and the write-only xlsx export.
+Each mode runs in its own process, so the peak memory of one does not hide the other.
+
+usage: python benchmarks/bench_export_xlsx.py [rows ...]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def fillNodes(rows):
+    AlphaExtractor.dict_class.clear()
+    for i in range(rows):
+        className = f"ThingDef{i % 50}"
+        AlphaExtractor.dict_class.add(className, f"Thing{i}.label", 'label', f"thing number {i}")
+    AlphaExtractor.Config.tagSort = AlphaExtractor.TagClassification(includes=['label'])
+
+
+def runMode(rows, writeOnly, workDir, queue):
+    AlphaExtractor.Config = AlphaExtractor.Configures(os.path.join(workDir, 'config.dat'), headless=True)
+    AlphaExtractor.Config.collisionOption.set(1)
+    AlphaExtractor.Config.useTranslationMemory.set(0)
+    AlphaExtractor.Config.exportDirName.set(workDir.replace('\\', '/'))
+    AlphaExtractor.Config.exportFileName.set(f"{rows}_{writeOnly}")
+    fillNodes(rows)
+
+    start = time.perf_counter()
+    result = AlphaExtractor.exportXlsx(writeOnly=writeOnly)
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024 if resource else 0
+    queue.put((result, seconds, peak))
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as workDir:
+        queue = multiprocessing.Queue()
+        print(f"{'rows':>8} {'mode':>10} {'seconds':>8} {'peak MB':>8}")
+        for rows in sizes:
+            for writeOnly in (False, True):
+                process = multiprocessing.Process(target=runMode, args=(rows, writeOnly, workDir, queue))
+                process.start()
+                result, seconds, peak = queue.get()
+                process.join()
+                assert result == 0, result
+                print(f"{rows:>8} {'write-only' if writeOnly else 'in-memory':>10} {seconds:>8.2f} {peak:>8}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000])
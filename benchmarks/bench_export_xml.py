@@ -0,0 +1,51 @@
+"""
+Times exportXml on many DefInjected classes, with one writer thread and with EXPORT_THREADS,
+overwriting and then merging into the files of the previous run.
+
+usage: python benchmarks/bench_export_xml.py [classes] [nodes per class]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+
+
+def fillNodes(classes, nodes):
+    AlphaExtractor.dict_class.clear()
+    AlphaExtractor.dict_keyed.clear()
+    for i in range(classes):
+        for j in range(nodes):
+            AlphaExtractor.dict_class.add(f"Class{i}Def", f"Thing{j}.label", 'label', f"thing {j} &amp; {i}")
+            AlphaExtractor.dict_class.add(f"Class{i}Def", f"Thing{j}.defName", 'defName', f"Thing{j}")
+    for j in range(nodes):
+        AlphaExtractor.dict_keyed[f"Key{j}"] = f"keyed {j} & <b>"
+    AlphaExtractor.Config.tagSort = AlphaExtractor.TagClassification(['defName'], includes=['label'])
+
+
+def main(classes=400, nodes=200):
+    threads = AlphaExtractor.EXPORT_THREADS
+    with tempfile.TemporaryDirectory() as workDir:
+        AlphaExtractor.Config = AlphaExtractor.Configures(os.path.join(workDir, 'config.dat'), headless=True)
+        AlphaExtractor.Config.exportType.set(AlphaExtractor.EXPORT_XML_ANNOTATION)
+        AlphaExtractor.Config.useTranslationMemory.set(0)
+        AlphaExtractor.Config.exportFileName.set('bench')
+        fillNodes(classes, nodes)
+
+        print(f"{'threads':>8} {'collision':>10} {'files':>6} {'seconds':>8}")
+        for AlphaExtractor.EXPORT_THREADS in (1, threads):
+            AlphaExtractor.Config.exportDirName.set(f"{workDir}/{AlphaExtractor.EXPORT_THREADS}".replace('\\', '/'))
+            for collision in (1, 2):
+                AlphaExtractor.Config.collisionOption.set(collision)
+                start = time.perf_counter()
+                result, saved = AlphaExtractor.exportXml()
+                seconds = time.perf_counter() - start
+                assert result == 0, (result, saved)
+                print(f"{AlphaExtractor.EXPORT_THREADS:>8} {collision:>10} {len(saved):>6} {seconds:>8.2f}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,87 @@
+"""
+Compares the memory of the extracted nodes held as the old dict of tuples with lists of texts per tag,
+and as NodeStore with counted texts per tag. Measured with tracemalloc after the extraction, so the parsed
+trees are not counted.
+
+usage: python benchmarks/bench_node_store.py [mod folder ...]
+Without folders, a synthetic mod is generated. Give RimWorld/Data/Core and the DLC folders to measure the game.
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+from genmod import generateMod  # noqa: E402
+
+
+def resolvedExtracts(modPaths):
+    jobs = []
+    for modPath in modPaths:
+        for folder, isPatch in (('Defs', False), ('Patches', True)):
+            for root, _, files in os.walk(os.path.join(modPath, folder)):
+                jobs.extend((os.path.join(root, name), isPatch) for name in files if name.endswith('.xml'))
+    results = AlphaExtractor.extractFiles(sorted(jobs))
+    resolver = AlphaExtractor.InheritanceResolver()
+    for _, _, named, _ in results:
+        resolver.add(named)
+    return [list(resolver.resolve(extracts)) for extracts, _, _, _ in results]
+
+
+def addToDicts(extracts, classes, tagsText):
+    """The layout before NodeStore."""
+    for extract in extracts:
+        if not extract:
+            continue
+        className, lastTag, tag, text = extract
+        classes.setdefault(className, {})[tag] = (lastTag, text)
+        tagsText.setdefault(lastTag, []).append(text)
+
+
+def measure(fileExtracts, build):
+    """Returns the bytes still allocated by build after the extracts are dropped, and the node count."""
+    gc.collect()
+    tracemalloc.start()
+    # the extracts are copied inside the measurement, like the strings a worker process sends back
+    stored = build([[tuple(''.join(part) if isinstance(part, str) else part for part in extract)
+                     if extract else extract for extract in extracts] for extracts in fileExtracts])
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, stored
+
+
+def buildDicts(fileExtracts):
+    classes, tagsText = {}, {}
+    for extracts in fileExtracts:
+        addToDicts(extracts, classes, tagsText)
+    return sum(len(tags) for tags in classes.values()), (classes, tagsText)
+
+
+def buildStore(fileExtracts):
+    classes, tagsText = AlphaExtractor.NodeStore(), {}
+    for extracts in fileExtracts:
+        AlphaExtractor.addExtracts(extracts, classes, tagsText)
+    classes.compact()
+    return len(classes), (classes, tagsText)
+
+
+def main(modPaths):
+    with tempfile.TemporaryDirectory() as workDir:
+        if not modPaths:
+            modPaths = [os.path.join(workDir, 'synthetic')]
+            generateMod(modPaths[0], defs=10000, depth=3, chain=6)
+        fileExtracts = resolvedExtracts(modPaths)
+
+    AlphaExtractor.diagnostics.records.clear()
+    print(f"{'layout':>10} {'nodes':>9} {'MB':>8} {'bytes/node':>10}")
+    for name, build in (('dict', buildDicts), ('NodeStore', buildStore)):
+        size, (nodes, _) = measure(fileExtracts, build)
+        print(f"{name:>10} {nodes:>9} {size / 2 ** 20:>8.1f} {size / max(nodes, 1):>10.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
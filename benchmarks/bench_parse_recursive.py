@@ -0,0 +1,75 @@
+"""
+Compares parse_recursive with the recursive generator it replaced, on deep and wide synthetic Defs.
+Both must yield the same nodes; the best of the repeats is reported.
+
+usage: python benchmarks/bench_parse_recursive.py [repeat]
+"""
+import os
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as et
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+from genmod import generateMod  # noqa: E402
+
+SHAPES = {  # name: generateMod arguments
+    'deep': dict(defs=300, depth=10, lists=2),
+    'wide': dict(defs=300, depth=1, lists=300),
+    'default': dict(defs=2000, depth=2, lists=3),
+}
+
+
+def recursiveParse(parent, className, tag, lastTag=None, unKnownLiNo=False):
+    """parse_recursive before the stack walker."""
+    if list(parent):
+        num_list = 0
+        for child in list(parent):
+            if child.tag == 'li':
+                if 'TKey' in child.attrib:
+                    yield from recursiveParse(child, className, tag + '.' + child.attrib['TKey'], lastTag)
+                elif unKnownLiNo:
+                    yield from recursiveParse(child, className, tag + '.???', lastTag)
+                else:
+                    yield from recursiveParse(child, className, tag + '.' + str(num_list), lastTag)
+                num_list += 1
+            else:
+                yield from recursiveParse(child, className, tag + '.' + child.tag, child.tag)
+    elif parent.text and parent.text.replace('\n', '').replace('\t', '').replace(' ', '') and lastTag and tag:
+        yield className, lastTag, tag, (parent.text.replace('&', '&amp;').replace('<', '&lt;') if parent.text else "")
+
+
+def best(function, items, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            for _ in function(item, 'ThingDef', 'defName'):
+                pass
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(repeat):
+    print(f"{'shape':>8} {'defs':>6} {'nodes':>8} {'recursive ms':>13} {'stack ms':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as workDir:
+        for name, shape in SHAPES.items():
+            generateMod(os.path.join(workDir, name), patches={}, keyed=0, strings=0, **shape)
+            items = [item for root, _, files in os.walk(os.path.join(workDir, name, 'Defs'))
+                     for fileName in sorted(files) for item in et.parse(os.path.join(root, fileName)).getroot()]
+            for unKnownLiNo in (False, True):
+                old = [node for item in items for node in recursiveParse(item, 'ThingDef', 'defName', 'x', unKnownLiNo)]
+                new = [node for item in items
+                       for node in AlphaExtractor.parse_recursive(item, 'ThingDef', 'defName', 'x', unKnownLiNo)]
+                assert old == new, f"{name}: outputs differ"
+
+            before = best(recursiveParse, items, repeat)
+            after = best(AlphaExtractor.parse_recursive, items, repeat)
+            print(f"{name:>8} {len(items):>6} {len(old):>8} {before * 1000:>13.1f} {after * 1000:>9.1f} "
+                  f"{before / after:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
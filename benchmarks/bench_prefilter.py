@@ -0,0 +1,69 @@
+"""
+Times extractNodes with and without the raw-byte prefilter, on a synthetic mod with a share of Defs files that hold
+no included tag. Both must give the same nodes of the included tags.
+
+usage: python benchmarks/bench_prefilter.py [text defs] [plain defs] [repeat]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+from genmod import generateMod  # noqa: E402
+
+INCLUDES = ['label', 'description', 'reportString', 'text', 'label0', 'label1', 'label2']
+
+
+def writePlainDefs(root, defs, defsPerFile=50):
+    """Defs with numbers and paths only, as in the stats and graphics files of most mods, half of them inheriting."""
+    os.makedirs(os.path.join(root, 'Defs', 'Plain'), exist_ok=True)
+    for start in range(0, defs, defsPerFile):
+        with open(os.path.join(root, 'Defs', 'Plain', f'Plain_{start // defsPerFile:04d}.xml'), 'w',
+                  encoding='UTF8') as fout:
+            fout.write('<Defs>\n')
+            for i in range(start, min(start + defsPerFile, defs)):
+                name = f' Name="PlainBase{i}"' if i % 2 else f' ParentName="PlainBase{i - 1}"' if i else ''
+                fout.write(f'  <ThingDef{name}><defName>Plain_{i}</defName><graphicData><texPath>Things/Plain{i}'
+                           f'</texPath><drawSize>(1, 1)</drawSize></graphicData><statBases><MaxHitPoints>{i}'
+                           f'</MaxHitPoints><Mass>0.{i}</Mass></statBases><stackLimit>75</stackLimit></ThingDef>\n')
+            fout.write('</Defs>\n')
+
+
+def includedNodes():
+    includes = AlphaExtractor.Config.tagSort.tagSet(AlphaExtractor.TAG_INCLUDE)
+    return sorted((className, tag, text) for className in AlphaExtractor.dict_class
+                  for tag, lastTag, text in AlphaExtractor.dict_class.items(className) if lastTag in includes)
+
+
+def extract(modPath, prefilter):
+    AlphaExtractor.dict_class.clear()
+    start = time.perf_counter()
+    result = AlphaExtractor.extractNodes([f"{modPath}/Defs"], prefilter=prefilter)
+    seconds = time.perf_counter() - start
+    assert result[0] == 0, result
+    AlphaExtractor.classifyTags([], INCLUDES)
+    return seconds, AlphaExtractor.Config.prefilteredFiles
+
+
+def main(textDefs=2000, plainDefs=8000, repeat=3):
+    with tempfile.TemporaryDirectory() as workDir:
+        AlphaExtractor.Config = AlphaExtractor.Configures(os.path.join(workDir, 'config.dat'), headless=True)
+        modPath = f"{workDir}/mod".replace('\\', '/')
+        generateMod(modPath, defs=textDefs, patches={}, keyed=0, strings=0)
+        writePlainDefs(modPath, plainDefs)
+
+        print(f"{'prefilter':>10} {'skipped':>8} {'nodes':>8} {'seconds':>8}")
+        nodes = None
+        for prefilter in (None, AlphaExtractor.compilePrefilter(INCLUDES)):
+            seconds, skipped = min(extract(modPath, prefilter) for _ in range(repeat))
+            found = includedNodes()
+            assert nodes is None or found == nodes, "the prefilter changed the included nodes"
+            nodes = found
+            print(f"{'on' if prefilter else 'off':>10} {skipped:>8} {len(found):>8} {seconds:>8.2f}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,75 @@
+"""
+Measures the cold start of the extractor: the module import, and the time to the first drawn window.
+Each sample is a fresh interpreter. The window sample needs a display and is skipped without one.
+
+usage: python benchmarks/bench_startup.py [samples]
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+WINDOW_TIMEOUT_S = 30
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+IMPORT_PROBE = f"""
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {SRC!r})
+import AlphaExtractor
+print(time.perf_counter() - start, *(name in sys.modules for name in ('openpyxl', 'urllib.request')))
+"""
+
+
+def sampleImport():
+    out = subprocess.run([sys.executable, '-c', IMPORT_PROBE], capture_output=True, text=True, check=True).stdout
+    seconds, openpyxl, urllib = out.split()
+    return float(seconds), openpyxl == 'True', urllib == 'True'
+
+
+def sampleWindow(workDir):
+    """
+    Starts the extractor with --timings and waits for the timings file it writes once the first window is drawn.
+    Returns the seconds from the process start to that file, or None if the extractor exits first (no display).
+    """
+    timingsFile = os.path.join(workDir, 'startup.json')
+    if os.path.exists(timingsFile):
+        os.remove(timingsFile)
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(SRC, 'AlphaExtractor.py'), '--timings', timingsFile],
+                               cwd=workDir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while process.poll() is None and time.perf_counter() - start < WINDOW_TIMEOUT_S:
+            try:
+                with open(timingsFile, encoding='UTF8') as fin:
+                    if 'firstWindow' in json.load(fin)['phases']:
+                        return time.perf_counter() - start
+            except (OSError, ValueError, KeyError):
+                pass
+            time.sleep(0.005)
+        return None
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main(samples):
+    imports = [sampleImport() for _ in range(samples)]
+    print(f"import          {statistics.median(seconds for seconds, _, _ in imports) * 1000:7.1f} ms (median)")
+    print(f"  openpyxl loaded: {imports[0][1]}, urllib.request loaded: {imports[0][2]}")
+
+    with tempfile.TemporaryDirectory() as workDir:
+        shutil.copy(os.path.join(SRC, 'icon.ico'), workDir)
+        windows = [sampleWindow(workDir) for _ in range(samples)]
+    if None in windows:
+        print("first window    skipped (no display)")
+    else:
+        print(f"first window    {statistics.median(windows) * 1000:7.1f} ms (median, process start to drawn window)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if sys.argv[1:] else 5)
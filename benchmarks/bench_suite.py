@@ -0,0 +1,151 @@
+"""
+Micro and macro benchmarks of the extraction, filter and export paths on synthetic mods of several sizes.
+Runs headless. Each benchmark is repeated with the garbage collector off and the minimum is reported,
+so numbers stay comparable from release to release on the same machine.
+
+usage: python benchmarks/bench_suite.py [--sizes small,medium] [--repeat N] [--json FILE]
+"""
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as et
+from copy import copy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+from genmod import generateMod  # noqa: E402
+
+SIZES = {
+    'small': dict(defs=200, depth=2, lists=3, chain=3),
+    'medium': dict(defs=2000, depth=2, lists=3, chain=4),
+    'large': dict(defs=10000, depth=3, lists=3, chain=6),
+}
+
+QUERIES = [("label", ""), ("", "text"), ("", "synthetic_1"), ("desc", "things"), ("l", "")]
+
+
+def measure(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            samples.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(samples), statistics.median(samples)
+
+
+def prepare(modPath):
+    """Parses the mod once and fills the extractor's globals the way extractNodes would."""
+    defRoots = [et.parse(path).getroot() for path in sorted(glob.glob(f"{modPath}/Defs/**/*.xml", recursive=True))]
+    patchRoots = [et.parse(path).getroot() for path in sorted(glob.glob(f"{modPath}/Patches/*.xml"))]
+    defItems = [(item, item.find('defName').text) for root in defRoots for item in root
+                if item.find('defName') is not None]
+    operations = [item for root in patchRoots for item in root]
+    xpaths = [node.text for root in patchRoots for node in root.iter('xpath')]
+
+    resolver = AlphaExtractor.InheritanceResolver()
+    extracts = []
+    for root in defRoots:
+        named = []
+        extracts.extend(AlphaExtractor.extractDefs(root, named))
+        resolver.add(named)
+    for root in patchRoots:
+        extracts.extend(AlphaExtractor.extractPatches(root))
+    AlphaExtractor.diagnostics.records.clear()
+
+    AlphaExtractor.dict_class.clear()
+    AlphaExtractor.Config.dict_tags_text = {}
+    AlphaExtractor.addExtracts(resolver.resolve(extracts), AlphaExtractor.dict_class,
+                               AlphaExtractor.Config.dict_tags_text)
+    AlphaExtractor.dict_keyed.clear()
+    for path in glob.glob(f"{modPath}/Languages/English/Keyed/*.xml"):
+        for node in et.parse(path).getroot():
+            AlphaExtractor.dict_keyed[node.tag] = node.text or ""
+    AlphaExtractor.classifyTags([], ['label', 'description', 'reportString', 'text', 'label0', 'label1'])
+    return defRoots, defItems, operations, xpaths
+
+
+def runSize(name, workDir, repeat):
+    modPath = os.path.join(workDir, name)
+    generateMod(modPath, **SIZES[name])
+    defRoots, defItems, operations, xpaths = prepare(modPath)
+    tagFilter = AlphaExtractor.TagFilter(AlphaExtractor.Config.dict_tags_text)
+    nodes = len(AlphaExtractor.dict_class)
+
+    def exportXml():
+        assert AlphaExtractor.exportXml()[0] == 0
+
+    def exportXlsx():
+        assert AlphaExtractor.exportXlsx() == 0
+
+    def searchAll():
+        for tagSearch, textSearch in QUERIES:
+            copy(tagFilter).search(tagSearch, textSearch)  # a fresh filter, without the previous query to narrow
+
+    def analyse():
+        for operation in operations:
+            for _ in AlphaExtractor.analysisOperation(operation, []):
+                pass
+        AlphaExtractor.diagnostics.records.clear()
+
+    AlphaExtractor.Config.exportDirName.set(os.path.join(workDir, f"{name}_out").replace('\\', '/'))
+    AlphaExtractor.Config.exportFileName.set(name)
+    benchmarks = [
+        ('parse_recursive', len(defItems), lambda: [list(AlphaExtractor.parse_recursive(item, 'ThingDef', defName))
+                                                    for item, defName in defItems]),
+        ('extractDefs', len(defItems), lambda: [list(AlphaExtractor.extractDefs(root, [])) for root in defRoots]),
+        ('compileXpath', len(xpaths), lambda: [AlphaExtractor.compileXpath.__wrapped__(xpath) for xpath in xpaths]),
+        ('analysisOperation', len(operations), analyse),
+        ('TagFilter build', len(AlphaExtractor.Config.dict_tags_text),
+         lambda: AlphaExtractor.TagFilter(AlphaExtractor.Config.dict_tags_text)),
+        ('TagFilter search', len(QUERIES), searchAll),
+        ('exportXml', nodes, exportXml),
+        ('exportXlsx', nodes, exportXlsx),
+    ]
+
+    results = []
+    for bench, items, function in benchmarks:
+        best, median = measure(function, repeat)
+        results.append({'size': name, 'benchmark': bench, 'items': items, 'min': best, 'median': median})
+        print(f"{name:>7} {bench:>18} {items:>8} {best * 1000:10.2f} {median * 1000:10.2f} "
+              f"{best / max(items, 1) * 1e6:10.2f}", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--sizes', default='small,medium', help=f"comma separated, of {', '.join(SIZES)}")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workDir:
+        AlphaExtractor.Config = AlphaExtractor.Configures(os.path.join(workDir, 'config.dat'), headless=True)
+        AlphaExtractor.Config.collisionOption.set(1)
+        AlphaExtractor.Config.useTranslationMemory.set(0)
+        AlphaExtractor.Config.exportType.set(AlphaExtractor.EXPORT_XML_PLAIN)
+        print(f"{'size':>7} {'benchmark':>18} {'items':>8} {'min ms':>10} {'median ms':>10} {'us/item':>10}")
+        results = []
+        for name in args.sizes.split(','):
+            results.extend(runSize(name, workDir, args.repeat))
+
+    if args.json:
+        with open(args.json, 'w', encoding='UTF8') as fout:
+            json.dump({'extractor': AlphaExtractor.EXTRACTOR_VERSION, 'python': platform.python_version(),
+                       'machine': platform.machine(), 'repeat': args.repeat, 'results': results}, fout, indent=1)
+
+
+if __name__ == '__main__':
+    main()
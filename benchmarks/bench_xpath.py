@@ -0,0 +1,79 @@
+"""
+Measures compileXpath over the xpaths of real patches, uncached and through its LRU cache.
+Without arguments a built-in corpus of common RimWorld patch xpaths is used.
+
+usage: python benchmarks/bench_xpath.py [mod directory ...]
+"""
+import collections
+import glob
+import os
+import sys
+import time
+import xml.etree.ElementTree as et
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AlphaExtractor  # noqa: E402
+
+CORPUS = [
+    'Defs/ThingDef[defName="Wall"]/label',
+    '/Defs/ThingDef[defName = "Wall"]/description',
+    '/Defs/ThingDef[defName="Gun_Revolver"]/verbs/li/label',
+    'Defs/ThingDef[defName="Gun_Revolver"]/tools/li[1]/label',
+    '/Defs/ThingDef[defName="Human"]/comps/li[@Class="CompProperties_Lactating"]/label',
+    'Defs/ThingDef[defName="Human"]/comps',
+    'Defs/ThingDef[defName="Beer" or defName="Ambrosia" or defName="Smokeleaf"]/ingestible/ingestCommandString',
+    "Defs/RecipeDef[defName='Make_Beer']/jobString",
+    'Defs/ResearchProjectDef[defName="Electricity"]/description',
+    'Defs/PawnKindDef[defName="Villager"]/labelPlural',
+    'Defs/RulePackDef[defName="NamerPersonTribal"]/rulePack/rulesStrings',
+    'Defs/AlienRace.ThingDef_AlienRace[defName="Alien_Example"]/alienRace/generalSettings/label',
+    'Defs/ThingDef[defName="Wall"]/comps/li[text()="CompProperties_Glower"]',
+    'Defs/ThingDef[@Name="BuildingBase"]/comps',
+    'Defs/ThingDef[defName="Wall"]/../label',
+    'Defs/ThingDef[contains(defName, "Wall")]/label',
+    'Defs/ThingDef[defName!="Wall"]/label',
+    'Defs/ThingDef[defName="Wall"]//label',
+    'Defs/*[defName="Wall"]/label',
+]
+
+
+def harvest(modPaths):
+    xpaths = []
+    for modPath in modPaths:
+        for path in glob.glob(os.path.join(modPath, '**', 'Patches', '**', '*.xml'), recursive=True):
+            try:
+                xpaths.extend(node.text for node in et.parse(path).iter('xpath') if node.text)
+            except et.ParseError:
+                pass
+    return xpaths
+
+
+def main(modPaths):
+    xpaths = harvest(modPaths) if modPaths else CORPUS * 50
+    distinct = set(xpaths)
+    rounds = max(1, 100000 // len(xpaths))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for xpath in xpaths:
+            AlphaExtractor.compileXpath.__wrapped__(xpath)
+    uncached = (time.perf_counter() - start) / (rounds * len(xpaths))
+
+    AlphaExtractor.compileXpath.cache_clear()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for xpath in xpaths:
+            AlphaExtractor.compileXpath(xpath)
+    cached = (time.perf_counter() - start) / (rounds * len(xpaths))
+
+    reasons = collections.Counter(AlphaExtractor.compileXpath(xpath).reason for xpath in xpaths)
+    print(f"{len(xpaths)} xpaths, {len(distinct)} distinct")
+    print(f"uncached {uncached * 1e6:8.2f} us/xpath")
+    print(f"cached   {cached * 1e6:8.2f} us/xpath ({AlphaExtractor.compileXpath.cache_info()})")
+    print("supported" if reasons[0] == len(xpaths) else "by reason (0 = supported):",
+          ', '.join(f"{reason}: {count}" for reason, count in sorted(reasons.items())))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
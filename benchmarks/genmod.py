@@ -0,0 +1,136 @@
+"""
+Generates a synthetic RimWorld mod for the benchmarks. The same arguments always give the same files.
+
+usage: python benchmarks/genmod.py OUT [--defs N] [--depth N] [--lists N] [--chain N] [--add N] ...
+"""
+import argparse
+import os
+import random
+
+PATCH_CLASSES = ['Add', 'Replace', 'Insert', 'Remove', 'Sequence', 'FindMod']
+
+
+def defXml(name, depth, lists, parent, rng):
+    """One ThingDef with depth levels of nested li and lists of lists items at every level."""
+    def nested(level):
+        if level >= depth:
+            return f"<text>text {name} {level} {rng.randrange(1000)}</text>"
+        items = ''.join(f"<li><label>{name} {level} {i}</label>{nested(level + 1)}</li>" for i in range(lists))
+        return f"<stages>{items}</stages>"
+
+    parentName = f' ParentName="{parent}"' if parent else ''
+    return (f'  <ThingDef{parentName}><defName>{name}</defName><label>{name} label</label>'
+            f'<description>description of {name} &amp; &lt;things&gt;</description>'
+            f'<comps><li Class="CompProperties_{name}"><reportString>report {name}</reportString></li></comps>'
+            f'{nested(0)}</ThingDef>\n')
+
+
+def patchXml(kind, target, i):
+    xpath = f'Defs/ThingDef[defName="{target}"]'
+    if kind == 'Add':
+        return (f'<Operation Class="PatchOperationAdd"><xpath>{xpath}/comps</xpath>'
+                f'<value><li><label>added {i}</label></li></value></Operation>')
+    if kind == 'Replace':
+        return (f'<Operation Class="PatchOperationReplace"><xpath>/{xpath}/label</xpath>'
+                f'<value><label>replaced {i}</label></value></Operation>')
+    if kind == 'Insert':
+        return (f'<Operation Class="PatchOperationInsert"><xpath>{xpath}/comps/li[1]</xpath>'
+                f'<value><li><label>inserted {i}</label></li></value></Operation>')
+    if kind == 'Remove':
+        return f'<Operation Class="PatchOperationRemove"><xpath>{xpath}/description</xpath></Operation>'
+    if kind == 'Sequence':
+        return (f'<Operation Class="PatchOperationSequence"><operations>'
+                f'<li Class="PatchOperationAdd"><xpath>{xpath}/comps</xpath><value><li><label>seq {i}</label></li>'
+                f'</value></li><li Class="PatchOperationReplace"><xpath>{xpath}/description</xpath>'
+                f'<value><description>seq {i}</description></value></li></operations></Operation>')
+    return (f'<Operation Class="PatchOperationFindMod"><mods><li>Other Mod</li></mods>'
+            f'<match Class="PatchOperationAdd"><xpath>{xpath}/comps</xpath>'
+            f'<value><li><label>found {i}</label></li></value></match></Operation>')
+
+
+def generateMod(root, defs=1000, defsPerFile=50, depth=2, lists=3, chain=3, patches=None,
+                keyed=2, keyedEntries=200, strings=2, stringsLines=200, seed=1):
+    """
+    Writes a mod with defs ThingDefs, each under an abstract parent chain of the given length,
+    patches[kind] operations of each PatchOperation kind, keyed Keyed files and strings Strings files.
+    Returns the list of generated defNames.
+    """
+    rng = random.Random(seed)
+    patches = patches if patches is not None else {kind: defs // 20 for kind in PATCH_CLASSES}
+    for sub in ['About', 'Defs/Things', 'Patches', 'Languages/English/Keyed', 'Languages/English/Strings/Names']:
+        os.makedirs(os.path.join(root, sub), exist_ok=True)
+    with open(os.path.join(root, 'About', 'About.xml'), 'w', encoding='UTF8') as fout:
+        fout.write(f'<ModMetaData><name>Synthetic {defs}</name><packageId>bench.synthetic{defs}</packageId>'
+                   f'</ModMetaData>')
+
+    bases = []
+    with open(os.path.join(root, 'Defs', 'Things', 'Bases.xml'), 'w', encoding='UTF8') as fout:
+        fout.write('<Defs>\n')
+        for family in range(10):
+            for level in range(chain):
+                name = f'Base{family}_{level}'
+                parent = f' ParentName="Base{family}_{level - 1}"' if level else ''
+                fout.write(f'  <ThingDef Name="{name}"{parent} Abstract="True"><label{level}>{name}</label{level}>'
+                           f'<description>base {name}</description><tools><li><label>tool {name}</label></li>'
+                           f'</tools></ThingDef>\n')
+                bases.append(name)
+        fout.write('</Defs>\n')
+
+    names = [f'Synthetic_{i}' for i in range(defs)]
+    for start in range(0, defs, defsPerFile):
+        with open(os.path.join(root, 'Defs', 'Things', f'Things_{start // defsPerFile:04d}.xml'), 'w',
+                  encoding='UTF8') as fout:
+            fout.write('<Defs>\n')
+            for name in names[start:start + defsPerFile]:
+                fout.write(defXml(name, depth, lists, rng.choice(bases) if bases else None, rng))
+            fout.write('</Defs>\n')
+
+    operations = [(kind, i) for kind in PATCH_CLASSES for i in range(patches.get(kind, 0))]
+    for start in range(0, len(operations), 50):
+        with open(os.path.join(root, 'Patches', f'Patches_{start // 50:04d}.xml'), 'w', encoding='UTF8') as fout:
+            fout.write('<Patch>\n')
+            for kind, i in operations[start:start + 50]:
+                fout.write(patchXml(kind, rng.choice(names), i) + '\n')
+            fout.write('</Patch>\n')
+
+    for k in range(keyed):
+        with open(os.path.join(root, 'Languages', 'English', 'Keyed', f'Keyed_{k}.xml'), 'w',
+                  encoding='UTF8') as fout:
+            fout.write('<LanguageData>\n')
+            fout.write(''.join(f'  <Key{k}_{i}>keyed text {i} {{0}}</Key{k}_{i}>\n' for i in range(keyedEntries)))
+            fout.write('</LanguageData>\n')
+
+    for k in range(strings):
+        with open(os.path.join(root, 'Languages', 'English', 'Strings', 'Names', f'Names_{k}.txt'), 'w',
+                  encoding='UTF8') as fout:
+            fout.write(''.join(f'Name {k} {i}\n' for i in range(stringsLines)))
+
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates a synthetic RimWorld mod for the benchmarks.")
+    parser.add_argument('out', help="mod folder to create")
+    parser.add_argument('--defs', type=int, default=1000, help="number of ThingDefs")
+    parser.add_argument('--defs-per-file', type=int, default=50)
+    parser.add_argument('--depth', type=int, default=2, help="nesting depth of li lists inside each def")
+    parser.add_argument('--lists', type=int, default=3, help="li items per list")
+    parser.add_argument('--chain', type=int, default=3, help="length of the ParentName chains")
+    for kind in PATCH_CLASSES:
+        parser.add_argument(f'--{kind.lower()}', type=int, help=f"PatchOperation{kind} count (default: defs / 20)")
+    parser.add_argument('--keyed', type=int, default=2, help="Keyed files")
+    parser.add_argument('--keyed-entries', type=int, default=200)
+    parser.add_argument('--strings', type=int, default=2, help="Strings files")
+    parser.add_argument('--strings-lines', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    patches = {kind: getattr(args, kind.lower()) for kind in PATCH_CLASSES}
+    patches = {kind: args.defs // 20 if count is None else count for kind, count in patches.items()}
+    names = generateMod(args.out, args.defs, args.defs_per_file, args.depth, args.lists, args.chain, patches,
+                        args.keyed, args.keyed_entries, args.strings, args.strings_lines, args.seed)
+    print(f"{len(names)} defs, {sum(patches.values())} patch operations written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,31 @@
+import collections
 import glob
+import hashlib
+import html
 import io
+import json
+import mmap
 import os
+import pickle
+import queue
+import re
 import shutil
+import sqlite3
 import sys
-import urllib.request
+import tempfile
+import threading
+import time
 import xml.etree.ElementTree as et
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import repeat
+from multiprocessing import freeze_support
 from pathlib import Path
 from tkinter import StringVar, IntVar, Grid, Entry, Label, Listbox, Toplevel, Text, Button, Radiobutton, Frame, Tk, \
     filedialog, messagebox, font, Checkbutton
 
-from openpyxl import load_workbook, Workbook
-from openpyxl.styles import PatternFill
-
 RIMWORLD_VERSION = '1.3'
 LANGUAGE = 'Korean (한국어)'
 
@@ -32,55 +46,103 @@ FRAME_MOD_SELECT = 2
 FRAME_NODE_CLASSIFICATION = 3
 FRAME_EXPORT_OPTION = 4
 
+TAG_EXCLUDE = 0
+TAG_DEFAULT = 1
+TAG_INCLUDE = 2
+
+PARALLEL_MIN_FILES = 32
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_TIMEOUT_S = 30
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+SEARCH_DEBOUNCE_MS = 150
+EXPORT_THREADS = 4
+
+DIAG_REMOVE = 'remove'
+DIAG_MOD_DEPENDENT = 'modDependent'
+DIAG_EXCEPTION = 'exception'
+UPDATE_TIMEOUT_S = 3
+UPDATE_CHECK_INTERVAL_S = 6 * 60 * 60
+XPATH_CACHE_SIZE = 4096
+
+XPATH_TOKEN = re.compile(r"""\s*(?:(?P<literal>"[^"]*"|'[^']*')|(?P<number>\d+)|(?P<name>[A-Za-z_][\w\-]*(?:\.[A-Za-z_][\w\-]*)*)"""
+                         r"""|(?P<op>//|/|\.\.|!=|<=|>=|[\[\]=()@*,|<>.+\-]))\s*""")
+NAME_ATTRIBUTE = re.compile(rb"""\b(Parent)?Name\s*=\s*["']([^"']*)""")  # Name and ParentName in raw Defs bytes
+
+dict_keyed = {}
+list_strings = []
+
+Config = None
+
+
+class PlainVar:
+    """Stands in for StringVar/IntVar when the configs are used without a window."""
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
 
 class Configures:
-    def __init__(self, fileName='config.dat'):
+    def __init__(self, fileName='config.dat', headless=False):
+        self.headless = headless
+        self.fileName = fileName
+
+        # Volatile Configs
+        self.extractPathList = []
+        self.modName = ""
+        self.pakageID = ""
+        self.tagSort = TagClassification()
+        self.exportDirName = self.var(StringVar, "")
+        self.exportFileName = self.var(StringVar, "")
+        self.dict_tags_text = {}
+        self.list_strings = []
+        self.rememberTagSort = self.var(IntVar, 1)
+        self.parallelExtract = self.var(IntVar, 1)
+        self.useExtractCache = self.var(IntVar, 1)
+        self.useTranslationMemory = self.var(IntVar, 1)
+        self.prefilterExtract = self.var(IntVar, 0)
+        self.prefilteredFiles = 0
+
         if not os.path.exists(fileName):
-            self.write(isReset=True)
+            self.write(isReset=True, fileName=fileName)
             return
 
         with open(fileName, 'r', encoding='UTF8') as fin:
             configs = fin.read().split('\n')
 
         if CONFIG_VERSION != int(configs[3]):
+            if headless:
+                raise ValueError("config.dat 파일의 형식이 변경되었습니다. 프로그램을 실행해 설정을 초기화해 주세요.")
             if messagebox.askyesno("사용자 설정 초기화",
                                    "config.dat 파일의 형식이 변경되어 설정 초기화가 필요합니다.\n" +
                                    "초기화 진행 시 사용자가 변경한 설정이 유실됩니다.\n" +
                                    "필요할 경우 초기화를 진행하기 전에 백업해 주세요.\n설정 초기화를 진행할까요?"):
-                self.write(isReset=True)
+                self.write(isReset=True, fileName=fileName)
                 return
             else:
                 exit(0)
 
         # Saved Configs
-        self.gameDir = StringVar(value=configs[5])
-        self.modDir = StringVar(value=configs[7])
+        self.gameDir = self.var(StringVar, configs[5])
+        self.modDir = self.var(StringVar, configs[7])
         self.definedExcludes = configs[9].replace(' ', '').split('/')
         self.definedIncludes = configs[11].replace(' ', '').split('/')
-        self.exportType = IntVar(value=int(configs[13]))
-        self.collisionOption = IntVar(value=int(configs[15]))
+        self.exportType = self.var(IntVar, int(configs[13]))
+        self.collisionOption = self.var(IntVar, int(configs[15]))
 
-        # Volatile Configs
-        self.extractPathList = []
-        self.modName = ""
-        self.pakageID = ""
-        self.excludes = []
-        self.defaults = []
-        self.includes = []
-        self.excludeHide = []
-        self.defaultHide = []
-        self.includeHide = []
-        self.exportDirName = StringVar()
-        self.exportFileName = StringVar()
-        self.dict_tags_text = {}
-        self.list_strings = []
-        self.rememberTagSort = IntVar()
-        self.rememberTagSort.set(1)
+    def var(self, varType, value):
+        return PlainVar(value) if self.headless else varType(value=value)
 
-    def write(self, isReset=False, fileName='config.dat'):
+    def write(self, isReset=False, fileName=None):
+        fileName = fileName or self.fileName
         if isReset:
-            self.gameDir = StringVar(value="C:/Program Files (x86)/Steam/steamapps/common/RimWorld")
-            self.modDir = StringVar(value="C:/Program Files (x86)/Steam/steamapps/workshop/content/294100")
+            self.gameDir = self.var(StringVar, "C:/Program Files (x86)/Steam/steamapps/common/RimWorld")
+            self.modDir = self.var(StringVar, "C:/Program Files (x86)/Steam/steamapps/workshop/content/294100")
             self.definedExcludes = []
             self.definedIncludes = "label/description/customLabel/rulesStrings/slateRef/reportString/jobString/verb/labelNoun" \
                                    "/gerund/helpText/letterText/labelFemale/labelPlural/text/labelShort/letterLabel" \
@@ -97,8 +159,8 @@ class Configures:
                                    "/discoveredLetterText/discoveredLetterTitle/instantlyPermanentLabel/letter/adjective" \
                                    "/labelFemalePlural/successfullyRemovedHediffMessage/offMessage/ingestReportStringEat" \
                                    "/renounceTitleMessage/royalFavorLabel/letterTitle".split('/')
-            self.exportType = IntVar(value=0)
-            self.collisionOption = IntVar(value=0)
+            self.exportType = self.var(IntVar, 0)
+            self.collisionOption = self.var(IntVar, 0)
 
         configs = f"""Alpha's Extractor Configure file
 DO NOT EDIT THIS FILE MANUALLY
@@ -236,69 +298,366 @@ def report(text):
         fout.write('\n')
 
 
-def convertXML2XLSX(dirname):
-    if dirname or dirname == "":
-        messagebox.showinfo("미지원", "현재 지원하지 않는 기능입니다.")
-        return
+class Diagnostics:
+    """
+    Buffered records of the patch operations the extraction skipped or could not read fully,
+    written to error_report.txt once per run.
+    A record is (file, operation class, xpath, reason, message); reason is a compileXpath reason code or a DIAG_* kind.
+    """
+    labels = {DIAG_REMOVE: "노드를 제거하는 패치", DIAG_MOD_DEPENDENT: "모드 의존성과 함께 노드를 변경하는 패치 (추출은 진행)",
+              DIAG_EXCEPTION: "처리 중 오류가 발생한 패치"}
+
+    def __init__(self):
+        self.file = None
+        self.records = []
+        self.lastCounts = collections.Counter()
+
+    def add(self, operation, xpath, reason, message=''):
+        self.records.append((self.file, operation, xpath, reason, message))
+
+    def take(self, start=0):
+        records = self.records[start:]
+        del self.records[start:]
+        return records
+
+    def counts(self):
+        return collections.Counter(reason for _, _, _, reason, _ in self.records)
+
+    def summary(self, counts):
+        lines = [f"진단된 패치 {sum(counts.values())}개"]
+        for reason, count in sorted(counts.items(), key=lambda item: str(item[0])):
+            lines.append(f"  {self.labels.get(reason, f'xpath {reason}번 사유')}: {count}개")
+        return lines
+
+    def flush(self, fileName="error_report.txt"):
+        self.lastCounts = self.counts()
+        if not self.records:
+            return
+        with open(fileName, 'a', encoding='UTF8') as fout:
+            for file, operation, xpath, reason, message in self.records:
+                label = self.labels.get(reason, f'xpath {reason}번 사유로 파싱할 수 없음')
+                fout.write(f"[{label}] {operation} | {file} | {xpath}{' | ' + message if message else ''}\n")
+            fout.write('\n'.join(self.summary(self.lastCounts)) + '\n')
+        self.records.clear()
+
+
+diagnostics = Diagnostics()
+
+
+class Timings:
+    """
+    Wall time, call count and bytes of each phase of a run, and of each file, reported as JSON.
+    Disabled, record() returns at once, so instrumented code pays one perf_counter call per phase.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()  # the export threads add concurrently
+        self.reset()
+
+    def reset(self):
+        self.started = time.time()
+        self.phases = {}
+        self.files = []
+
+    def add(self, phase, seconds, size=0, path=None):
+        with self.lock:
+            stat = self.phases.setdefault(phase, [0.0, 0, 0])
+            stat[0] += seconds
+            stat[1] += 1
+            stat[2] += size
+            if path:
+                self.files.append((path, phase, seconds, size))
+
+    def record(self, phase, start, path=None, size=None):
+        """Adds the time since start (a perf_counter value). Without size, the size of the file at path is counted."""
+        if not self.enabled:
+            return
+        seconds = time.perf_counter() - start
+        if size is None:
+            try:
+                size = os.path.getsize(path) if path else 0
+            except OSError:
+                size = 0
+        self.add(phase, seconds, size, path)
 
-    with open(dirname, "rb") as f:
-        ioFile = io.BytesIO(f.read())
-    ws = load_workbook(ioFile, read_only=True).active
-    xmlDict = {}
-    for className, nodeName, _, translation in ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True):
-        if translation:
-            if className not in xmlDict:
-                xmlDict[className] = {nodeName: translation}
-            else:
-                xmlDict[className][nodeName] = translation
-
-    for className, nodeDict in xmlDict.items():
-        saveDir = '/'.join(dirname.split('/')[:-1]) + f'/Languages/{LANGUAGE}/DefInjected/{className}'
-        Path(saveDir).mkdir(parents=True, exist_ok=True)
-        with open(f"{saveDir}/{dirname.split('/')[-1].split('.')[0] + '.xml'}", 'w', encoding='UTF8') as fout:
-            fout.write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
-            for nodeName, translation in nodeDict.items():
-                fout.write(f'  <{nodeName}>{translation}</{nodeName}>\n')
-            fout.write("</LanguageData>")
+    def report(self, **info):
+        return dict(info, extractor=EXTRACTOR_VERSION, started=time.strftime('%Y-%m-%dT%H:%M:%S',
+                                                                            time.localtime(self.started)),
+                    seconds=time.time() - self.started,
+                    phases={phase: {'seconds': seconds, 'calls': calls, 'bytes': size}
+                            for phase, (seconds, calls, size) in sorted(self.phases.items(), key=lambda x: -x[1][0])},
+                    files=[{'path': path, 'phase': phase, 'seconds': seconds, 'bytes': size}
+                           for path, phase, seconds, size in sorted(self.files, key=lambda x: -x[2])])
 
-    messagebox.showinfo("작업 완료", "XML 변환이 완료되었습니다.")
+    def write(self, fileName, **info):
+        with open(fileName, 'w', encoding='UTF8') as fout:
+            json.dump(self.report(**info), fout, ensure_ascii=False, indent=1)
 
 
-def convertXLSX2XML(filename):
-    with open(filename, "rb") as f:
-        ioFile = io.BytesIO(f.read())
-    ws = load_workbook(ioFile, read_only=True).active
-    xmlDict = {}
-    for className, nodeName, _, translation in ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True):
-        # _ == original text
-        if className and nodeName and translation:
-            if className not in xmlDict:
-                xmlDict[className] = {nodeName: translation}
-            else:
-                xmlDict[className][nodeName] = translation
+timings = Timings()
 
-    modName = ws.cell(row=5, column=6).value
-    modName = "".join(filter(lambda ch: ch not in "\\/:*?\"<>|", modName)) if modName else \
-        filename.split('/')[-1].split('.')[0]
 
-    for className, nodeDict in xmlDict.items():
+def showError(title, message):
+    if Config.headless:
+        report(f"{title}: {message}")
+    else:
+        messagebox.showerror(title, message)
+
 
-        if className == 'Keyed':
-            saveDir = f'{modName}/Languages/{LANGUAGE}/Keyed'
+def readLanguageRows(className, fileName):
+    """
+    Returns the rows (class, tag, source text, translation) of a DefInjected or Keyed file, escaped as in an export,
+    and the error message if the file cannot be read. The source is the comment before a node
+    (readLanguageData), and the translation of a TODO node is None.
+    The li of a list node become the rows tag.0, tag.1 and so on. Runs in a worker process of convertLanguageTree.
+    """
+    try:
+        nodes = readLanguageData(fileName)
+    except (et.ParseError, UnicodeDecodeError) as e:
+        return [], str(e)
+    rows = []
+    for tag, source, text in nodes:
+        if isinstance(text, list):
+            rows.extend((className, f"{tag}.{i}", None, escapeText(li)) for i, li in enumerate(text))
+        else:
+            rows.append((className, tag, source, None if text == "TODO" else escapeText(text)))
+    return rows, ""
+
+
+def languageFiles(path, listings=None):
+    """(class, file name) of the DefInjected and Keyed files under path, listed through walkFiles with listings."""
+    fileNames = []
+    for fileName in walkFiles(path, '.xml', {} if listings is None else listings):
+        parts = fileName.split('/')
+        if len(parts) > 2 and parts[-3] == 'DefInjected':
+            fileNames.append((parts[-2], fileName))
+        elif 'Keyed' in parts[:-1]:
+            fileNames.append(('Keyed', fileName))
+    return fileNames
+
+
+def convertLanguageTree(path, outDir='.', jobs=None):
+    """
+    Writes the DefInjected and Keyed files under path, the folder of one translated language, as
+    <outDir>/<mod name>.xlsx in the layout of exportXlsx. For a Languages folder, or a mod holding one, the language
+    is the LANGUAGE folder, or the only language there. The mod is the folder holding Languages, or path itself.
+    The files are parsed by a pool of jobs worker processes and their rows go to a write-only workbook in file order,
+    with at most two parsed files per worker waiting, so the memory stays flat however many nodes the tree has.
+    Returns the xlsx file name, the number of nodes and classes, the number of unreadable files,
+    the elapsed seconds and the error message if the tree failed.
+    """
+    start = time.perf_counter()
+    path = path.replace('\\', '/').rstrip('/')
+    modPath = path.split('/Languages')[0]
+    modName = modPath.split('/')[-1]
+    filename = f"{outDir}/{modName}.xlsx"
+    listings = {}  # not dirListings, which the interface thread uses
+    if path.endswith('/Languages') or os.path.isdir(path + '/Languages'):
+        languagesPath = path if path.endswith('/Languages') else path + '/Languages'
+        try:
+            languages = scanDir(languagesPath, listings)[0]
+        except OSError:
+            languages = []
+        if LANGUAGE in languages or len(languages) != 1:
+            path = f"{languagesPath}/{LANGUAGE}"
         else:
-            saveDir = f'{modName}/Languages/{LANGUAGE}/DefInjected/{className}'
-        Path(saveDir).mkdir(parents=True, exist_ok=True)
-        with open(f"{saveDir}/{modName}.xml", 'w', encoding='UTF8') as fout:
-            fout.write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
-            for nodeName, translation in nodeDict.items():
-                fout.write(f'  <{nodeName}>{translation}</{nodeName}>\n')
+            path = f"{languagesPath}/{languages[0]}"
+        if not os.path.isdir(path):
+            return filename, 0, 0, 0, time.perf_counter() - start, \
+                f"Languages 폴더에 {LANGUAGE} 폴더가 없습니다. 변환할 언어의 폴더를 선택해 주세요."
+    try:  # the load folder written by convertXlsxFile, or the mod itself
+        pakageID = et.parse(modPath + '/AddThisLoadFolders.xml').getroot().get('IfModActive')
+    except (OSError, et.ParseError):
+        try:
+            pakageID = et.parse(modPath + '/About/About.xml').getroot().findtext('packageId')
+        except (OSError, et.ParseError):
+            pakageID = None
+
+    fileNames = languageFiles(path, listings)
+    if not fileNames:
+        return filename, 0, 0, 0, time.perf_counter() - start, "DefInjected 혹은 Keyed 파일이 없습니다."
+
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(fileNames)))
+    nodes = 0
+    classes = set()
+    unreadFiles = []
+
+    def rows():
+        nonlocal nodes
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque()
+            for i, (className, fileName) in enumerate(fileNames):
+                pending.append((className, fileName, pool.submit(readLanguageRows, className, fileName)))
+                while pending and (len(pending) > 2 * workers or i == len(fileNames) - 1):
+                    className, fileName, future = pending.popleft()
+                    fileRows, error = future.result()
+                    if error:
+                        report(f"XLSX 변환: {fileName}: {error}")
+                        unreadFiles.append(fileName)
+                    nodes += len(fileRows)
+                    if fileRows:
+                        classes.add(className)
+                    yield from fileRows
+
+    try:
+        Path(outDir).mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        return filename, 0, 0, 0, time.perf_counter() - start, f"출력 폴더를 만들지 못했습니다: {e}"
+    wb = writeOnlyWorkbook(rows(), pakageID, modName)
+    try:
+        wb.save(filename)
+    except OSError as e:
+        wb.worksheets[0].close()  # finish the streamed sheet, or its writer fails on a closed file when collected
+        return filename, nodes, len(classes), len(unreadFiles), time.perf_counter() - start, \
+            "엑셀 파일이 열려있어(혹은 쓰기 금지되어) 저장에 실패하였습니다." if isinstance(e, PermissionError) else \
+            f"엑셀 파일을 저장하지 못했습니다: {e}"
+    return filename, nodes, len(classes), len(unreadFiles), time.perf_counter() - start, ""
+
+
+def formatTreeResult(filename, nodes, classes, unreadFiles, seconds, error):
+    if error:
+        return f"실패 {filename}: {error}"
+    return (f"{filename}: 노드 {nodes}개, 클래스 {classes}개, {seconds:.2f}초" +
+            (f", 읽지 못한 파일 {unreadFiles}개 (error_report.txt)" if unreadFiles else ""))
+
+
+def convertXML2XLSX(window, dirname, outDir='.'):
+    """Converts a translated language folder through convertLanguageTree on a worker thread."""
+    def run(_):
+        yield dirname, convertLanguageTree(dirname, outDir)
+
+    batchInBackground(window, "XLSX로 변환 중", "XLSX 변환 완료", [dirname], run, formatTreeResult, noun="폴더", verb="변환")
+
+
+def xlsxModName(ws, filename):
+    """The mod folder name of a RimWaldo sheet: its modName cell without the characters not allowed in a folder name."""
+    modName = ws.cell(row=5, column=6).value
+    return "".join(filter(lambda ch: ch not in "\\/:*?\"<>|", modName)) if modName else \
+        filename.replace('\\', '/').split('/')[-1].split('.')[0]
+
+
+def claimModName(claimDir, modName, filename):
+    """
+    Claims modName for filename in claimDir, atomically, so that only one file of a run writes the folder of a mod.
+    Returns the file name that claimed it first, or None if filename now holds it.
+    """
+    claim = f"{claimDir}/{modName.lower()}"
+    try:
+        fd = os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        with open(claim, 'r', encoding='UTF8') as fin:
+            return fin.read() or "다른"
+    with os.fdopen(fd, 'w', encoding='UTF8') as fout:
+        fout.write(os.path.basename(filename))
+    return None
+
+
+def convertXlsxFile(filename, outDir='.', claimDir=None):
+    """
+    Writes the translated rows of a RimWaldo xlsx as the DefInjected and Keyed files of its mod under outDir.
+    The rows are read straight from the file and each goes to the open file of its class, so the sheet is never held
+    whole. A node repeated in a class takes its last translation: only the classes with repeated nodes are read
+    from the sheet a second time. With claimDir, the mod is claimed there first (claimModName) and the file fails
+    if another file of the run has it. Runs in a worker process of convertXlsxFiles.
+    Returns the mod name, the number of nodes and classes written, the number of repeated nodes,
+    the elapsed seconds and the error message if the file failed.
+    """
+    from openpyxl import load_workbook
+
+    start = time.perf_counter()
+    wb = load_workbook(filename, read_only=True)
+    writers = {}
+    lastRows = {}  # class: {node: index of its last row}
+    repeatedClasses = set()
+    repeated = 0
+    try:
+        ws = wb.active
+        modName = xlsxModName(ws, filename)
+        if claimDir and (first := claimModName(claimDir, modName, filename)):
+            return modName, 0, 0, 0, time.perf_counter() - start, \
+                f"모드 이름이 {first} 파일과 같아 변환하지 않았습니다. 따로 변환해 주세요."
+        pakageID = ws.cell(row=3, column=6).value
+
+        def translatedRows():
+            for i, (className, nodeName, _, translation) in enumerate(
+                    ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True)):  # _ == original text
+                if className and nodeName and translation:
+                    yield i, className, nodeName, translation
+
+        def openWriter(className):
+            if className == 'Keyed':
+                saveDir = f'{outDir}/{modName}/Languages/{LANGUAGE}/Keyed'
+            else:
+                saveDir = f'{outDir}/{modName}/Languages/{LANGUAGE}/DefInjected/{className}'
+            Path(saveDir).mkdir(parents=True, exist_ok=True)
+            writers[className] = open(f"{saveDir}/{modName}.xml.{os.getpid()}.tmp", 'w', encoding='UTF8')
+            writers[className].write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
+
+        for i, className, nodeName, translation in translatedRows():
+            if className not in writers:
+                openWriter(className)
+                lastRows[className] = {}
+            if nodeName in lastRows[className]:
+                repeated += 1
+                repeatedClasses.add(className)
+            else:
+                writers[className].write(f'  <{nodeName}>{translation}</{nodeName}>\n')
+            lastRows[className][nodeName] = i
+
+        if repeatedClasses:  # written again with the last translation of each node, in the order of the last rows
+            for className in repeatedClasses:
+                writers[className].close()
+                os.remove(writers[className].name)
+                openWriter(className)
+            for i, className, nodeName, translation in translatedRows():
+                if className in repeatedClasses and lastRows[className][nodeName] == i:
+                    writers[className].write(f'  <{nodeName}>{translation}</{nodeName}>\n')
+
+        for fout in writers.values():
             fout.write("</LanguageData>")
+            fout.close()
+            os.replace(fout.name, fout.name.rsplit('.', 2)[0])
+        if pakageID:
+            Path(f"{outDir}/{modName}").mkdir(parents=True, exist_ok=True)
+            with open(f"{outDir}/{modName}/AddThisLoadFolders.xml", 'w', encoding='UTF8') as fout:
+                fout.write(f"""<li IfModActive="{pakageID}">{modName}</li>""")
+    finally:
+        wb.close()
+        for fout in writers.values():
+            if not fout.closed:
+                fout.close()
+                os.remove(fout.name)
+
+    nodes = sum(map(len, lastRows.values()))
+    return modName, nodes, len(writers), repeated, time.perf_counter() - start, ""
+
+
+def formatConvertResult(modName, nodes, classes, repeated, seconds, error):
+    if error:
+        return f"실패 {modName}: {error}"
+    return (f"{modName}: 노드 {nodes}개, 클래스 {classes}개, {seconds:.2f}초" +
+            (f", 중복된 노드 {repeated}개 (마지막 번역을 사용)" if repeated else ""))
+
+
+def convertXlsxFiles(filenames, outDir='.', jobs=None, cancel=None):
+    """
+    Yields (file name, result of convertXlsxFile) for the xlsx files, converted in parallel by runInPool.
+    Two files of one mod would write the same files at once, so the workers claim the mods in a folder of this run:
+    the first file of a mod is converted and the others fail.
+    """
+    claimDir = tempfile.mkdtemp(prefix='xlsx_claims_')
+    try:
+        yield from runInPool(convertXlsxFile, filenames, jobs or os.cpu_count() or 1, cancel, outDir, claimDir)
+    finally:
+        shutil.rmtree(claimDir, ignore_errors=True)
 
-    if pakageID := ws.cell(row=3, column=6).value:
-        with open(f"{modName}/AddThisLoadFolders.xml", 'w', encoding='UTF8') as fout:
-            fout.write(f"""<li IfModActive="{pakageID}">{modName}</li>""")
 
-    messagebox.showinfo("작업 완료", "XML 변환이 완료되었습니다.")
+def convertXLSX2XML(window, filenames, outDir='.'):
+    """Converts the xlsx files through convertXlsxFiles, listing the result of each file."""
+    batchInBackground(window, "XML로 변환 중", "XML 변환 완료", filenames,
+                      lambda cancel: convertXlsxFiles(filenames, outDir, cancel=cancel),
+                      formatConvertResult, noun="파일", verb="변환")
 
 
 def loadSelectLocations(window):
@@ -353,6 +712,185 @@ def loadSelectLocations(window):
     btn2.grid(row=2, column=3, padx=5)
 
 
+def readModInfo(modPath, isCore=False):
+    """Returns the mod list code, display name, default export name and pakageID of a mod folder."""
+    try:
+        about = et.parse(modPath + '/About/About.xml').getroot()
+    except (FileNotFoundError, ValueError, et.ParseError):
+        about = None
+
+    if isCore:
+        try:
+            pakageID = about.find('packageId').text
+        except AttributeError:
+            pakageID = "NULL"
+        return "    CORE   ", modPath.split('/')[-1], f"{modPath.split('/')[-1]}", pakageID
+
+    try:
+        with open(modPath + '/About/PublishedFileId.txt') as fin:
+            code = f"{int(fin.read().replace(WORD_NEWLINE, '')):11d}"
+    except (FileNotFoundError, ValueError):
+        try:
+            code = f"{int(modPath.split('/')[-1]):11d}"
+        except (FileNotFoundError, ValueError):
+            code = " ??????????"
+    try:
+        pakageID = about.find('packageId').text
+    except AttributeError:
+        pakageID = "NULL(About.xml ERROR)"
+    try:
+        name = about.find('name').text
+    except AttributeError:
+        name = "#UNKNOWN# (About.xml ERROR)"
+    return code, name, f"{name} - {code.replace(' ', '')}", pakageID
+
+
+class ModCatalog:
+    """
+    Mod list of the mod-select screen, kept in fileName between runs.
+    A mod folder is only read again when the folder itself, its About.xml or its PublishedFileId.txt changes.
+    """
+
+    def __init__(self, fileName='mod_catalog.dat'):
+        self.fileName = fileName
+        try:
+            with open(fileName, 'r', encoding='UTF8') as fin:
+                self.mods = json.load(fin)
+        except (FileNotFoundError, ValueError):
+            self.mods = {}
+
+    @staticmethod
+    def signature(modPath, isCore):
+        stamps = [isCore]
+        for path in [modPath, modPath + '/About/About.xml', modPath + '/About/PublishedFileId.txt']:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+        return stamps
+
+    def scan(self, corePathList, modPathList):
+        """Returns {modPath: readModInfo(modPath)} for every folder. Changed folders are read in parallel."""
+        mods = {}
+        stale = []
+        for modPath, isCore in [(p, True) for p in corePathList] + [(p, False) for p in modPathList]:
+            signature = self.signature(modPath, isCore)
+            if modPath in self.mods and self.mods[modPath][0] == signature:
+                mods[modPath] = self.mods[modPath]
+            else:
+                stale.append((modPath, isCore, signature))
+
+        if stale:
+            with ThreadPoolExecutor() as pool:
+                for (modPath, _, signature), info in zip(stale, pool.map(lambda x: readModInfo(*x[:2]), stale)):
+                    mods[modPath] = [signature, *info]
+
+        if stale or len(mods) != len(self.mods):
+            self.mods = mods
+            with open(self.fileName, 'w', encoding='UTF8') as fout:
+                json.dump(mods, fout, ensure_ascii=False)
+        return {modPath: tuple(info[1:]) for modPath, info in mods.items()}
+
+
+dirListings = {}
+
+
+def scanDir(path, listings=dirListings):
+    """
+    (sub folder names, file names) of a folder, without hidden entries and sorted case-insensitively.
+    A listing is kept in listings, by default for the session, until the mod list is opened again.
+    Raises OSError if path is not a folder.
+    """
+    try:
+        return listings[path]
+    except KeyError:
+        pass
+    dirs, files = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.'):
+                (dirs if entry.is_dir() else files).append(entry.name)
+    listings[path] = listing = sorted(dirs, key=str.lower), sorted(files, key=str.lower)
+    return listing
+
+
+def subDirs(path):
+    try:
+        return [f"{path}/{name}" for name in scanDir(path)[0]]
+    except OSError:
+        return []
+
+
+def walkFiles(path, suffix, listings=dirListings):
+    """
+    Paths of the files ending with suffix (or one of a tuple of suffixes, in lower case) under path,
+    the files of a folder before those of its sub folders.
+    The folders are listed through scanDir with listings.
+    """
+    files = []
+    folders = [path]
+    while folders:
+        folder = folders.pop()
+        try:
+            dirs, names = scanDir(folder, listings)
+        except OSError:
+            continue
+        files.extend(f"{folder}/{name}" for name in names if name.lower().endswith(suffix))
+        folders.extend(f"{folder}/{name}" for name in reversed(dirs))
+    return files
+
+
+def folderName(path):
+    return path.replace('\\', '/').rstrip('/').split('/')[-1]
+
+
+def findExtractableDirs(modPath):
+    """Returns the extractable folders of a mod, their display names and the indices selected by default."""
+    extractableDirPathList = []
+    extractableDirNameList = []
+    autoSelectIndices = []
+    try:
+        modVersionNodeList = list(et.parse(f'{modPath}/LoadFolders.xml').getroot())
+        for eachVersionNode in modVersionNodeList:
+            for eachLoad in list(eachVersionNode):
+                load = (eachLoad.text or "").strip().replace('\\', '/').strip('/')
+                path = f"{modPath}/{load}" if load else modPath
+                try:
+                    attr = eachLoad.attrib['IfModActive']
+                except KeyError:
+                    attr = ""
+                try:
+                    types = scanDir(path)[0]
+                except OSError:  # a load folder the mod does not ship
+                    continue
+                for eachType in types:
+                    if eachType in EXTRACTABLE_DIRS:
+                        extractableDirPathList.append(f"{path}/{eachType}")
+                        if eachType == "Languages":
+                            eachType = "Keyed/Strings"
+                        name = f"{eachVersionNode.tag} - {eachType}"
+                        if attr:
+                            name = f"{name} [모드 의존성: {attr}]"
+                        extractableDirNameList.append(name)
+                        if RIMWORLD_VERSION in eachVersionNode.tag or 'default' in eachVersionNode.tag:
+                            autoSelectIndices.append(len(extractableDirNameList) - 1)
+
+    except (FileNotFoundError, et.ParseError):
+        for eachLoad in [modPath] + subDirs(modPath):
+            if os.path.isdir(eachLoad):
+                for eachType in scanDir(eachLoad)[0]:
+                    if eachType in EXTRACTABLE_DIRS:
+                        extractableDirPathList.append(f"{eachLoad}/{eachType}")
+                        ver = folderName(eachLoad) if eachLoad != modPath else "default"
+                        if eachType == "Languages":
+                            eachType = "Keyed/Strings"
+                        extractableDirNameList.append(f"{ver} - {eachType}")
+                        if RIMWORLD_VERSION in ver or 'default' in ver:
+                            autoSelectIndices.append(len(extractableDirNameList) - 1)
+
+    return extractableDirPathList, extractableDirNameList, autoSelectIndices
+
+
 def loadSelectMod(window):
     frame = Toplevel(window)
     frame.geometry("800x400+100+100")
@@ -368,11 +906,11 @@ def loadSelectMod(window):
     Grid.columnconfigure(frame, 0, weight=2)
     Grid.columnconfigure(frame, 1, weight=1)
 
-    textLabel1 = Label(frame, text="추출할 모드를 선택하세요")
+    textLabel1 = Label(frame, text="추출할 모드를 선택하세요 (Ctrl/Shift로 여러 모드 선택)")
     textLabel1.grid(row=0, column=0, sticky='NSWE', padx=5, pady=5)
 
     modListBoxValue = StringVar()
-    modListBox = Listbox(frame, selectborderwidth=3, listvariable=modListBoxValue,
+    modListBox = Listbox(frame, selectmode='extended', selectborderwidth=3, listvariable=modListBoxValue,
                          font=font.Font(family="Courier", size=10))
     modListBox.grid(row=1, column=0, sticky='NSWE')
 
@@ -389,9 +927,17 @@ def loadSelectMod(window):
     extractButton = Button(frame, text="선택한 폴더의 노드 추출")
     extractButton.grid(row=2, column=1)
 
-    corePathList = [p.replace('\\', '/') for p in glob.glob(Config.gameDir.get() + '/Data/*') if os.path.isdir(p)]
-    manualModPathList = [p.replace('\\', '/') for p in glob.glob(Config.gameDir.get() + '/Mods/*') if os.path.isdir(p)]
-    workshopModPathList = [p.replace('\\', '/') for p in glob.glob(Config.modDir.get() + '/*') if os.path.isdir(p)]
+    optionFrame = Frame(frame)
+    optionFrame.grid(row=3, column=1)
+    Checkbutton(optionFrame, text="모든 CPU 코어로 병렬 추출하기", variable=Config.parallelExtract).grid(row=0, column=0)
+    Checkbutton(optionFrame, text="변경되지 않은 파일은 캐시에서 불러오기", variable=Config.useExtractCache).grid(row=1, column=0)
+    Checkbutton(optionFrame, text="출력할 태그가 없는 Defs 파일은 읽지 않기 (빠른 추출)",
+                variable=Config.prefilterExtract).grid(row=2, column=0)
+
+    dirListings.clear()  # a mod may have changed since the list was last opened
+    corePathList = subDirs(Config.gameDir.get().replace('\\', '/').rstrip('/') + '/Data')
+    manualModPathList = subDirs(Config.gameDir.get().replace('\\', '/').rstrip('/') + '/Mods')
+    workshopModPathList = subDirs(Config.modDir.get().replace('\\', '/').rstrip('/'))
 
     if not (corePathList + manualModPathList + workshopModPathList):  # If No Mod
         messagebox.showerror("모드 폴더 찾을 수 없음", "선택한 폴더에 어떤 하위 폴더도 존재하지 않습니다.\n프로그램을 종료합니다.")
@@ -399,30 +945,10 @@ def loadSelectMod(window):
 
     modsNameDict = {}
     sep = ' | '
-    for modPath in corePathList:
-        try:
-            pakageID = et.parse(modPath + '/About/About.xml').getroot().find('packageId').text
-        except (FileNotFoundError, ValueError, AttributeError, et.ParseError):
-            pakageID = "NULL"
-        modsNameDict[f"    CORE   {sep}{modPath.split('/')[-1]}"] = modPath, f"{modPath.split('/')[-1]}", pakageID
-    for modPath in manualModPathList + workshopModPathList:
-        try:
-            with open(modPath + '/About/PublishedFileId.txt') as fin:
-                code = f"{int(fin.read().replace(WORD_NEWLINE, '')):11d}"
-        except (FileNotFoundError, ValueError):
-            try:
-                code = f"{int(modPath.split('/')[-1]):11d}"
-            except (FileNotFoundError, ValueError):
-                code = " ??????????"
-        try:
-            pakageID = et.parse(modPath + '/About/About.xml').getroot().find('packageId').text
-        except (FileNotFoundError, ValueError, AttributeError, et.ParseError):
-            pakageID = "NULL(About.xml ERROR)"
-        try:
-            name = et.parse(modPath + '/About/About.xml').getroot().find('name').text
-        except (FileNotFoundError, ValueError, AttributeError, et.ParseError):
-            name = "#UNKNOWN# (About.xml ERROR)"
-        modsNameDict[f"{code}{sep}{name}"] = modPath, f"{name} - {code.replace(' ', '')}", pakageID
+    modInfos = ModCatalog().scan(corePathList, manualModPathList + workshopModPathList)
+    for modPath in corePathList + manualModPathList + workshopModPathList:
+        code, name, modName, pakageID = modInfos[modPath]
+        modsNameDict[f"{code}{sep}{name}"] = modPath, modName, pakageID
     modsNameDictKeys = list(modsNameDict.keys())
     modsNameDictKeys.sort(key=lambda x: x.split(sep)[1])
     modListBoxValue.set(modsNameDictKeys)
@@ -432,52 +958,29 @@ def loadSelectMod(window):
 
     modName = ""
     pakageID = ""
+    selectedModPaths = []
 
     def onModSelect(evt):
-        try:
-            nonlocal modName, pakageID
-            modPath, modName, pakageID = modsNameDict[evt.widget.get(int(evt.widget.curselection()[0]))]
-        except IndexError:
+        selection = evt.widget.curselection()
+        if not selection:  # the selection moved to the folder list
             return
+        selectedModPaths[:] = [modsNameDict[evt.widget.get(idx)][0] for idx in selection]
+        if len(selection) > 1:
+            extractableDirPathList.clear()
+            extractableDirNameList.clear()
+            dirList.set([])
+            textLabel2.configure(text="모드마다 자동 선택되는 폴더를 추출합니다")
+            extractButton.configure(text=f"선택한 모드 {len(selection)}개 일괄 추출 * 출력")
+            return
+        textLabel2.configure(text="추출할 버전 및 폴더들을 선택하세요")
+        extractButton.configure(text="선택한 폴더의 노드 추출")
 
-        extractableDirPathList.clear()
-        extractableDirNameList.clear()
-        autoSelectIndices = []
-        try:
-            modVersionNodeList = list(et.parse(f'{modPath}/LoadFolders.xml').getroot())
-            for eachVersionNode in modVersionNodeList:
-                for eachLoad in list(eachVersionNode):
-                    if not eachLoad.text:
-                        eachLoad.text = ""
-                    path = os.path.join(modPath, eachLoad.text) if eachLoad.text != '/' else modPath
-                    try:
-                        attr = eachLoad.attrib['IfModActive']
-                    except KeyError:
-                        attr = ""
-                    for eachType in os.listdir(path):
-                        if eachType in EXTRACTABLE_DIRS:
-                            extractableDirPathList.append(os.path.join(path, eachType))
-                            if eachType == "Languages":
-                                eachType = "Keyed/Strings"
-                            name = f"{eachVersionNode.tag} - {eachType}"
-                            if attr:
-                                name = f"{name} [모드 의존성: {attr}]"
-                            extractableDirNameList.append(name)
-                            if RIMWORLD_VERSION in eachVersionNode.tag or 'default' in eachVersionNode.tag:
-                                autoSelectIndices.append(len(extractableDirNameList) - 1)
-
-        except (FileNotFoundError, et.ParseError):
-            for eachLoad in [modPath] + glob.glob(f"{modPath}/*"):
-                if os.path.isdir(eachLoad):
-                    for eachType in os.listdir(eachLoad):
-                        if eachType in EXTRACTABLE_DIRS:
-                            extractableDirPathList.append(os.path.join(eachLoad, eachType))
-                            ver = eachLoad.split('\\')[-1] if eachLoad != modPath else "default"
-                            if eachType == "Languages":
-                                eachType = "Keyed/Strings"
-                            extractableDirNameList.append(f"{ver} - {eachType}")
-                            if RIMWORLD_VERSION in ver or 'default' in ver:
-                                autoSelectIndices.append(len(extractableDirNameList) - 1)
+        nonlocal modName, pakageID
+        modPath, modName, pakageID = modsNameDict[evt.widget.get(selection[0])]
+
+        pathList, nameList, autoSelectIndices = findExtractableDirs(modPath)
+        extractableDirPathList[:] = pathList
+        extractableDirNameList[:] = nameList
 
         dirList.set(extractableDirNameList)
         for i in autoSelectIndices:
@@ -486,13 +989,17 @@ def loadSelectMod(window):
     modListBox.bind('<<ListboxSelect>>', onModSelect)
 
     def onExtract():
+        if len(selectedModPaths) > 1:  # exported in worker processes, the nodes extracted here are kept
+            window.deiconify()
+            frame.destroy()
+            batchExtractInBackground(window, list(selectedModPaths))
+            return
+
         if dict_class or dict_keyed or list_strings:
             if messagebox.askyesno("추출 노드 초기화",
                                    "본 프로그램에서 추출된 기존 노드가 존재합니다. 계속 진행할 경우 추출된 기존 노드와 분류 작업이 폐기되고 " +
                                    "현재 선택된 모드의 노드가 새로 추출됩니다. 정말 진행할까요?"):
-                dict_class.clear()
-                dict_keyed.clear()
-                list_strings.clear()
+                clearExtraction()
             else:
                 return
 
@@ -508,91 +1015,24 @@ def loadSelectMod(window):
         window.deiconify()
         frame.destroy()
 
-        for extractPath in Config.extractPathList:
-            if extractPath.split('\\')[-1] == 'Defs':
-                GoExtractLists = glob.glob(extractPath + "/**/*.xml", recursive=True)
-                for path in GoExtractLists:
-                    try:
-                        extracts = extractDefs(et.parse(path).getroot())
-                    except ValueError as e:
-                        messagebox.showerror("에러 발생", str(e) + "\n파일명: " + path)
-                        return
-
-                    for className, lastTag, tag, text in extracts:
-                        if className == 'ScenarioDef' and tag != lastTag and 'scenario' not in tag:
-                            tag = tag.split('.')
-                            tag.insert(1, 'scenario')
-                            tag = '.'.join(tag)
-                        if className in dict_class:
-                            dict_class[className][tag] = (lastTag, text)
-                        else:
-                            dict_class[className] = {tag: (lastTag, text)}
-                        if lastTag in Config.dict_tags_text:
-                            Config.dict_tags_text[lastTag].append(text)
-                        else:
-                            Config.dict_tags_text[lastTag] = [text]
-
-            elif extractPath.split('\\')[-1] == 'Languages':
-                GoExtractLists = glob.glob(extractPath + "\\English\\Keyed\\**\\*.xml", recursive=True)
-                for path in GoExtractLists:
-                    try:
-                        nodes = list(et.parse(path).getroot())
-                    except ValueError as e:
-                        messagebox.showerror("에러 발생", str(e) + "\n파일명: " + path)
-                        return
-                    for node in nodes:
-                        dict_keyed[node.tag] = node.text if node.text else ""
-                Config.list_strings = glob.glob(extractPath + "\\English\\Strings\\**\\*.txt", recursive=True)
-
-            elif extractPath.split('\\')[-1] == 'Patches':
-                GoExtractLists = glob.glob(extractPath + "/**/*.xml", recursive=True)
-                for path in GoExtractLists:
-                    try:
-                        extracts = extractPatches(et.parse(path).getroot())
-                    except ValueError as e:
-                        messagebox.showerror("에러 발생", str(e) + "\n파일명: " + path)
-                        return
-                    for extract in extracts:
-                        if extract:
-                            className, lastTag, tag, text = extract
-                        else:
-                            continue
-                        if className == 'ScenarioDef' and tag != lastTag and 'scenario' not in tag:
-                            tag = tag.split('.')
-                            tag.insert(1, 'scenario')
-                            tag = '.'.join(tag)
-                        if className in dict_class:
-                            dict_class[className][tag] = (lastTag, text)
-                        else:
-                            dict_class[className] = {tag: (lastTag, text)}
-                        if lastTag in Config.dict_tags_text:
-                            Config.dict_tags_text[lastTag].append(text)
-                        else:
-                            Config.dict_tags_text[lastTag] = [text]
-            else:
-                messagebox.showerror("에러 발생", "Defs, Patches, Keyed, Strings 이외의 폴더는 아직 추출할 수 없습니다.\n자동으로 제외합니다.")
+        timings.reset()
+        extractInBackground(window, Config.extractPathList, onExtracted)
 
-        Config.excludes = []
-        Config.defaults = sorted(Config.dict_tags_text.keys())
-        Config.includes = []
-
-        while Config.defaults:
-            candidate = Config.defaults.pop(0)
-            try:
-                int(candidate)
-                Config.excludes.append(candidate)
-            except ValueError:
-                Config.defaults.insert(0, candidate)
-                break
+    def onExtracted(result):
+        if result[0] in (1, 2):  # nothing of an earlier extraction may be left beside the empty nodes
+            clearExtraction()
+            updateText()
+        if result[0] == 1:
+            messagebox.showerror("에러 발생", f"{result[1][1]}\n파일명: {result[1][0]}")
+            return
+        if result[0] == 2:
+            messagebox.showinfo("추출 취소", "추출을 취소했습니다. 추출된 노드는 없습니다.")
+            return
+        if result[1]:
+            messagebox.showerror("에러 발생", "Defs, Patches, Keyed, Strings 이외의 폴더는 아직 추출할 수 없습니다.\n자동으로 제외합니다.")
 
-        for _ in range(len(Config.defaults)):
-            candidate = Config.defaults.pop(0)
-            if candidate in Config.definedExcludes:
-                Config.excludes.append(candidate)
-            elif candidate in Config.definedIncludes:
-                Config.includes.append(candidate)
-            else:
-                Config.defaults.append(candidate)
+        classifyTags(Config.definedExcludes, Config.definedIncludes)
+        updateText()
 
     extractButton.configure(command=onExtract)
 
@@ -611,33 +1051,238 @@ def loadSelectMod(window):
     searchMod.bind("<KeyRelease>", onSearch)
 
 
-def parse_recursive(parent, className, tag, lastTag=None, unKnownLiNo=False):
-    if list(parent):
-        num_list = 0
-        for child in list(parent):
-            if child.tag == 'li':
-                if 'TKey' in child.attrib:
-                    yield from parse_recursive(child, className, tag + '.' + child.attrib['TKey'], lastTag)
-                elif unKnownLiNo:
-                    yield from parse_recursive(child, className, tag + '.???', lastTag)
-                else:
-                    yield from parse_recursive(child, className, tag + '.' + str(num_list), lastTag)
-                num_list += 1
+def extractInBackground(window, extractPathList, onFinish):
+    """
+    Runs extractNodes on a worker thread behind a progress window with a cancel button.
+    The worker reports through a queue polled with after(), and onFinish(result) is called on the Tk thread.
+    """
+    frame = Toplevel(window)
+    frame.title("노드 추출 중")
+    frame.geometry("500x120+150+150")
+    frame.iconbitmap(resource_path('icon.ico'))
+    frame.transient(window)
+    frame.grab_set()
+    Grid.columnconfigure(frame, 0, weight=1)
+
+    progressVar = StringVar(value="추출할 파일을 찾는 중...")
+    Label(frame, textvariable=progressVar, justify='left', anchor='w', wraplength=480).grid(
+        row=0, column=0, sticky='NSWE', padx=10, pady=10)
+    cancelButton = Button(frame, text="취소")
+    cancelButton.grid(row=1, column=0, pady=5)
+
+    events = queue.Queue()
+    cancel = threading.Event()
+    parallel = Config.parallelExtract.get()
+    useCache = Config.useExtractCache.get()
+    prefilter = compilePrefilter(Config.definedIncludes) if Config.prefilterExtract.get() else None
+
+    def work():
+        try:
+            events.put(('done', extractNodes(extractPathList, parallel=parallel, useCache=useCache,
+                                             progress=lambda *args: events.put(('progress', args)), cancel=cancel,
+                                             prefilter=prefilter)))
+        except Exception as e:
+            events.put(('error', e))
+
+    def onCancel():
+        cancel.set()
+        cancelButton.configure(text="취소하는 중...", state='disabled')
+
+    def poll():
+        latest = None
+        while True:
+            try:
+                kind, value = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest = value
+                continue
+            frame.grab_release()
+            frame.destroy()
+            if kind == 'error':
+                raise value
+            onFinish(value)
+            return
+        if latest:
+            done, total, nodes, path = latest
+            progressVar.set(f"{done}/{total}개 파일, 노드 {nodes}개\n{path}")
+        frame.after(100, poll)
+
+    cancelButton.configure(command=onCancel)
+    frame.protocol("WM_DELETE_WINDOW", onCancel)
+    threading.Thread(target=work, daemon=True).start()
+    frame.after(100, poll)
+
+
+def batchExtractInBackground(window, modPaths, outDir='.'):
+    """
+    Extracts and exports several mods at once through batchExtractAll, with the export type and collision option
+    of the main window. Each mod goes to its own folder under outDir, named after its mod name.
+    """
+    options = dict(exportType=Config.exportType.get(), collisionOption=Config.collisionOption.get(),
+                   useCache=Config.useExtractCache.get(), timed=timings.enabled,
+                   useMemory=Config.useTranslationMemory.get(), prefilter=Config.prefilterExtract.get())
+    batchInBackground(window, "여러 모드 일괄 추출 중", "일괄 추출 완료", modPaths,
+                      lambda cancel: batchExtractAll(modPaths, outDir, os.cpu_count() or 1, cancel, **options),
+                      formatBatchResult, noun="모드", verb="출력")
+
+
+def batchInBackground(window, title, doneTitle, items, run, formatResult, noun, verb):
+    """
+    Runs run(cancel event), a generator of (item, result) like batchExtractAll, on a worker thread.
+    Lists the state of every item as it finishes with formatResult(*result), and the failures at the end.
+    The noun of the items and the verb of the work are used in the messages.
+    """
+    frame = Toplevel(window)
+    frame.title(title)
+    frame.geometry("700x300+150+150")
+    frame.iconbitmap(resource_path('icon.ico'))
+    frame.transient(window)
+    frame.grab_set()
+    Grid.rowconfigure(frame, 1, weight=1)
+    Grid.columnconfigure(frame, 0, weight=1)
+
+    progressVar = StringVar(value=f"0/{len(items)}개 {noun} 완료")
+    Label(frame, textvariable=progressVar).grid(row=0, column=0, sticky='NSWE', padx=10, pady=5)
+    statusBox = Listbox(frame, font=font.Font(family="Courier", size=10))
+    statusBox.grid(row=1, column=0, sticky='NSWE', padx=10)
+    for item in items:
+        statusBox.insert('end', f"대기 중 {item}")
+    cancelButton = Button(frame, text="취소")
+    cancelButton.grid(row=2, column=0, pady=5)
+
+    events = queue.Queue()
+    cancel = threading.Event()
+
+    def work():
+        try:
+            for item, result in run(cancel):
+                events.put(('item', (item, result)))
+            events.put(('done', None))
+        except Exception as e:
+            events.put(('error', e))
+
+    def onCancel():
+        cancel.set()
+        cancelButton.configure(text=f"진행 중인 {noun}를 마치는 중...", state='disabled')
+
+    finished = set()
+    failures = []
+
+    def poll():
+        while True:
+            try:
+                kind, value = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'item':
+                item, result = value
+                finished.add(item)
+                if result[-1]:
+                    failures.append(f"{result[0]}: {result[-1]}")
+                idx = items.index(item)
+                statusBox.delete(idx)
+                statusBox.insert(idx, formatResult(*result))
+                if result[-1]:
+                    statusBox.itemconfigure(idx, foreground='red')
+                progressVar.set(f"{len(finished)}/{len(items)}개 {noun} 완료")
+                continue
+
+            frame.grab_release()
+            if kind == 'error':
+                frame.destroy()
+                raise value
+            for idx, item in enumerate(items):
+                if item not in finished:
+                    statusBox.delete(idx)
+                    statusBox.insert(idx, f"취소됨 {item}")
+            cancelButton.configure(text="닫기", state='normal', command=frame.destroy)
+            frame.protocol("WM_DELETE_WINDOW", frame.destroy)
+            summary = f"{len(finished) - len(failures)}/{len(items)}개 {noun}를 {verb}하였습니다."
+            if failures:
+                messagebox.showerror(doneTitle, summary + f"\n\n실패한 {noun}:\n" + '\n'.join(failures),
+                                     parent=frame)
             else:
-                yield from parse_recursive(child, className, tag + '.' + child.tag, child.tag)
-    elif parent.text and parent.text.replace('\n', '').replace('\t', '').replace(' ', '') and lastTag and tag:
-        yield className, lastTag, tag, (parent.text.replace('&', '&amp;').replace('<', '&lt;') if parent.text else "")
+                messagebox.showinfo(doneTitle, summary, parent=frame)
+            return
+        frame.after(100, poll)
+
+    cancelButton.configure(command=onCancel)
+    frame.protocol("WM_DELETE_WINDOW", onCancel)
+    threading.Thread(target=work, daemon=True).start()
+    frame.after(100, poll)
+
+
+def escapeText(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;')
 
 
-def extractDefs(root):
+def parse_recursive(parent, className, tag, lastTag=None, unKnownLiNo=False):
+    """
+    Yields (className, lastTag, tag, text) of every leaf under parent that has text. The tag of a leaf is its path
+    from parent, with the TKey or the index of li in place of 'li', and lastTag is the nearest tag that is not li.
+    If unKnownLiNo, the li right under parent are numbered '???'.
+    Walks the tree with a stack of child iterators and joins the path only for the leaves it yields.
+    """
+    if not len(parent):
+        text = parent.text
+        if text and lastTag and tag and text.strip('\n\t '):
+            yield className, lastTag, tag, escapeText(text)
+        return
+
+    children = [iter(parent)]
+    path = [tag]
+    lastTags = [lastTag]
+    liNumbers = [0]
+    while children:
+        child = next(children[-1], None)
+        if child is None:
+            children.pop()
+            path.pop()
+            lastTags.pop()
+            liNumbers.pop()
+            continue
+
+        if child.tag == 'li':
+            if 'TKey' in child.attrib:
+                segment = child.attrib['TKey']
+            elif unKnownLiNo and len(children) == 1:
+                segment = '???'
+            else:
+                segment = str(liNumbers[-1])
+            liNumbers[-1] += 1
+            childLastTag = lastTags[-1]
+        else:
+            segment = childLastTag = child.tag
+
+        if len(child):
+            children.append(iter(child))
+            path.append(segment)
+            lastTags.append(childLastTag)
+            liNumbers.append(0)
+        else:
+            text = child.text
+            if text and childLastTag and text.strip('\n\t '):
+                path.append(segment)
+                yield className, childLastTag, '.'.join(path), escapeText(text)
+                path.pop()
+
+
+def extractDefs(root, named=None):
+    """
+    Yields the nodes of the defs under root. A def with a ParentName first yields (className, defName, ParentName),
+    which InheritanceResolver expands into the inherited nodes once every selected folder is read.
+    Named defs are appended to named as (Name, ParentName, nodes relative to the def).
+    """
     if 'value' != root.tag and 'Defs' != root.tag:
         raise ValueError("첫 태그가 Defs가 아닙니다. 오류를 발생시킨 모드 이름을 Alpha에게 제보해주세요.")
 
-    for item in list(root):
-        try:
-            parentDefs[item.attrib['Name']] = item
-        except KeyError:
-            pass
+    for item in root:
+        relatives = None
+        if 'Name' in item.attrib and named is not None:
+            relatives = [extract[1:] for extract in parse_recursive(item, None, '')]
+            named.append((item.attrib['Name'], item.attrib.get('ParentName'), relatives))
         try:
             if item.attrib['Abstract'].lower() == 'true':
                 continue
@@ -656,113 +1301,878 @@ def extractDefs(root):
             else:
                 raise ValueError("Def임에도 불구하고 클래스 이름이 없습니다. 오류를 발생시킨 모드 이름과 파일명을 Alpha에게 제보해주세요.")
 
-        if 'ParentName' in item.attrib and item.attrib['ParentName'] in parentDefs:
-            yield from parse_recursive(parentDefs[item.attrib['ParentName']], className, defName)
-
-        yield from parse_recursive(item, className, defName)
-
-
-def xpathAnalysis(xpath):
-    className = ""
-    if '..' in xpath:
-        return False, 1
-    if '(' in xpath:
-        return False, 2
-    defNameIndex = -1
-    xpath = xpath.split('/')
-    for i in range(len(xpath)):
-        if '[' in xpath[i]:
-            if 'defName' in xpath[i]:
-                defNameIndex = i
-                className, xpath[i] = xpath[i].split('[')
-                xpath[i] = xpath[i].split(']')[0]
-                if '!=' in xpath[i] or xpath[i].count('=') > 1:
-                    return False, 3
-                isThereDefName = False
-                defName = None
-                for elem in xpath[i].split('='):
-                    if elem.replace(' ', '') == 'defName':
-                        isThereDefName = True
-                    else:
-                        defName = eval(elem)
-                if not isThereDefName or not defName:
-                    return False, 4
-                xpath[i] = defName
-            elif 'li' in xpath[i]:
-                xpath[i] = xpath[i].split('[')[1].split(']')[0]
-                if '!=' in xpath[i] or xpath[i].count('=') > 1:
-                    return False, 5
-                for elem in xpath[i].split('='):
-                    if '\"' in elem or '\'' in elem:
-                        xpath[i] = eval(elem)
-            elif defNameIndex != -1:
-                return False, 6
-    if defNameIndex == -1:
-        return False, 7
-    if not className:
-        return False, -1
-    return className, xpath[defNameIndex:]
-
-
-def analysisOperation(node, modDepend):
+        if 'ParentName' in item.attrib:
+            yield className, defName, item.attrib['ParentName']
+
+        if relatives is None:
+            yield from parse_recursive(item, className, defName)
+        else:
+            for lastTag, tag, text in relatives:
+                yield className, lastTag, defName + tag, text
+
+
+class InheritanceResolver:
+    """
+    Name/ParentName graph of the Named defs of every selected folder.
+    The nodes a def inherits are flattened once per Name, through every level of ParentName, and reused by each child.
+    A Name defined twice resolves to the later definition, as folders and files are read in order.
+    """
+
+    def __init__(self):
+        self.defs = {}
+        self.flattened = {}
+
+    def add(self, named):
+        for name, parentName, relatives in named:
+            self.defs[name] = parentName, relatives
+        self.flattened.clear()
+
+    def flatten(self, name):
+        """Returns {tag relative to the def: (lastTag, text)} of name and all its ancestors, nearer ones winning."""
+        chain = []
+        while name in self.defs and name not in self.flattened and name not in chain:  # a cycle ends at its start
+            chain.append(name)
+            name = self.defs[name][0]
+        nodes = self.flattened.get(name, {})
+        for name in reversed(chain):
+            nodes = dict(nodes)
+            for lastTag, tag, text in self.defs[name][1]:
+                nodes[tag] = lastTag, text
+            self.flattened[name] = nodes
+        return nodes
+
+    def resolve(self, extracts):
+        for extract in extracts:
+            if len(extract) == 3:
+                className, defName, parentName = extract
+                for tag, (lastTag, text) in self.flatten(parentName).items():
+                    yield className, lastTag, defName + tag, text
+            else:
+                yield extract
+
+
+class XpathSelector:
+    """
+    Compiled patch xpath: the class of the patched defs and one tag path (defName, tags below the def...) per defName.
+    False if the xpath cannot be extracted; reason then tells why.
+    """
+    __slots__ = ('className', 'paths', 'reason')
+
+    def __init__(self, className='', paths=(), reason=0):
+        self.className = className
+        self.paths = paths
+        self.reason = reason
+
+    def __bool__(self):
+        return not self.reason
+
+
+def tokenizeXpath(xpath):
+    """Splits xpath into (kind, value) tokens, kind being literal, number, name or op. Returns None on unknown syntax."""
+    tokens = []
+    pos = 0
+    while pos < len(xpath):
+        match = XPATH_TOKEN.match(xpath, pos)
+        if not match or match.end() == pos:
+            return None
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        tokens.append((kind, value[1:-1] if kind == 'literal' else value))
+    return tokens
+
+
+def splitXpathSteps(tokens):
+    """Splits tokens into steps of (follows '//', node test, [predicate tokens...]). Returns None on unknown syntax."""
+    steps = []
+    descendant = False
+    i = 0
+    while i < len(tokens):
+        kind, value = tokens[i]
+        if value in ('/', '//') and kind == 'op':
+            descendant = value == '//'
+            i += 1
+            continue
+        test = value
+        predicates = []
+        i += 1
+        while i < len(tokens) and tokens[i] == ('op', '['):
+            depth = 1
+            start = i + 1
+            while depth:
+                i += 1
+                if i >= len(tokens):
+                    return None
+                depth += {('op', '['): 1, ('op', ']'): -1}.get(tokens[i], 0)
+            predicates.append(tokens[start:i])
+            i += 1
+        if i < len(tokens) and tokens[i] not in (('op', '/'), ('op', '//')):
+            return None
+        steps.append((descendant, test, predicates))
+        descendant = False
+    return steps
+
+
+def parseDefNames(predicate):
+    """Reads defName="A" or defName="B" ... Returns the defNames, or the reason code if the predicate is not like that."""
+    if ('op', '(') in predicate:
+        return 2
+    defNames = []
+    for i in range(0, len(predicate), 4):
+        comparison = predicate[i:i + 3]
+        if ('op', '!=') in comparison:
+            return 3
+        if len(comparison) != 3 or comparison[1] != ('op', '='):
+            return 4
+        if comparison[0] == ('name', 'defName') and comparison[2][0] == 'literal':
+            defNames.append(comparison[2][1])
+        elif comparison[2] == ('name', 'defName') and comparison[0][0] == 'literal':
+            defNames.append(comparison[0][1])
+        else:
+            return 4
+        if i + 3 < len(predicate) and predicate[i + 3] != ('name', 'or'):
+            return 3 if predicate[i + 3][1] in ('=', '!=') else 4
+    return defNames if defNames and all(defNames) else 4
+
+
+def parseListHandle(predicate):
+    """Reads li[1], li[@Class="X"], li[defName="X"], li[text()="X"] ... Returns the handle, or None."""
+    if len(predicate) == 1 and predicate[0][0] in ('number', 'literal'):
+        return predicate[0][1]
+    operand, value = predicate[:-2], predicate[-2:]
+    if value[:1] != [('op', '=')] or value[1][0] != 'literal':
+        return None
+    if operand in ([('op', '@'), operand[-1]], [operand[-1]]) and operand[-1][0] == 'name' \
+            or operand == [('name', 'text'), ('op', '('), ('op', ')')]:
+        return value[1][1]
+    return None
+
+
+@lru_cache(maxsize=XPATH_CACHE_SIZE)
+def compileXpath(xpath):
+    """
+    Compiles the subset of XPath that RimWorld patches use to reach a def, once per distinct xpath.
+    Reasons: 1 parent step, 2 functions other than the text() of li[text()="X"] or unknown syntax,
+    3 != or chained comparison on defName,
+    4 no literal defName, 5 li predicate other than a position or a single comparison,
+    6 predicate, wildcard or // below the def, 7 no defName, -1 no def class.
+    """
+    tokens = tokenizeXpath(xpath)
+    if tokens is None:
+        return XpathSelector(reason=2)
+    if ('op', '..') in tokens:
+        return XpathSelector(reason=1)
+    if any(token == ('op', '(') and (i == 0 or tokens[i - 1] != ('name', 'text')) for i, token in enumerate(tokens)):
+        return XpathSelector(reason=2)
+    steps = splitXpathSteps(tokens)
+    if steps is None:
+        return XpathSelector(reason=2)
+
+    className = ''
+    defNames = None
+    tags = []
+    for descendant, test, predicates in steps:
+        if defNames is None:
+            defPredicates = [predicate for predicate in predicates if ('name', 'defName') in predicate]
+            if not defPredicates:
+                continue
+            if len(defPredicates) > 1:
+                return XpathSelector(reason=3)
+            defNames = parseDefNames(defPredicates[0])
+            if isinstance(defNames, int):
+                return XpathSelector(reason=defNames)
+            className = test
+            continue
+        if descendant or test in ('*', '@', '.'):
+            return XpathSelector(reason=6)
+        if test == 'text' and predicates == []:
+            return XpathSelector(reason=2)
+        if not predicates:
+            tags.append(test)
+            continue
+        handle = parseListHandle(predicates[0]) if test == 'li' and len(predicates) == 1 else None
+        if handle is not None:
+            tags.append(handle)
+        elif any(('op', '(') in predicate for predicate in predicates):  # text() anywhere else
+            return XpathSelector(reason=2)
+        else:
+            return XpathSelector(reason=5 if test == 'li' else 6)
+
+    if defNames is None:
+        return XpathSelector(reason=7)
+    if not className or className == '*':
+        return XpathSelector(reason=-1)
+    return XpathSelector(className, tuple((defName, *tags) for defName in defNames))
+
+
+def analysisOperation(node, modDepend, named=None):
     if (operation := node.attrib['Class']) == 'PatchOperationFindMod':
         modDepend.extend([li.text for li in list(node.find('mods'))])
         try:
-            yield from analysisOperation(node.find('match'), modDepend)
+            yield from analysisOperation(node.find('match'), modDepend, named)
         except AttributeError:
-            yield from analysisOperation(node.find('nomatch'), modDepend)
+            yield from analysisOperation(node.find('nomatch'), modDepend, named)
     elif operation == 'PatchOperationSequence':
         for li in list(node.find('operations')):
-            yield from analysisOperation(li, modDepend)
+            yield from analysisOperation(li, modDepend, named)
     elif operation == 'PatchOperationInsert':
+        xpath = None
         try:
             xpath = node.find('xpath').text
-            className, tagList = xpathAnalysis(xpath)
-            if not className:
-                report(f'다음 xpath는 {tagList}번 사유로 파싱할 수 없음: {xpath}')
+            selector = compileXpath(xpath)
+            if not selector:
+                diagnostics.add(operation, xpath, selector.reason)
                 return
-            yield from parse_recursive(node.find('value'), className, '.'.join(tagList[:-1]), lastTag=tagList[-2],
-                                       unKnownLiNo=True)
+            for tagList in selector.paths:
+                yield from parse_recursive(node.find('value'), selector.className, '.'.join(tagList[:-1]),
+                                           lastTag=tagList[-2], unKnownLiNo=True)
         except Exception as e:
-            report(e)
+            diagnostics.add(operation, xpath, DIAG_EXCEPTION, repr(e))
             return
     elif operation in ['PatchOperationAdd', 'PatchOperationReplace']:
+        xpath = None
         if operation == 'PatchOperationReplace' and modDepend:
             try:
                 xpath = node.find('xpath').text
-                report(f'모드 의존성과 함께 노드를 변경하는 패치는 추출하지 않음, xpath: {xpath}')
+                diagnostics.add(operation, xpath, DIAG_MOD_DEPENDENT, ', '.join(map(str, modDepend)))
             except AttributeError:
-                report('모드 의존성과 함께 노드를 변경하는 패치는 추출하지 않음, xpath 존재하지 않음')
+                diagnostics.add(operation, None, DIAG_MOD_DEPENDENT, ', '.join(map(str, modDepend)))
                 return
         try:
             xpath = node.find('xpath').text
             if xpath.replace('/', '') == 'Defs':
-                yield from extractDefs(node.find('value'))
-            className, tagList = xpathAnalysis(xpath)
-            if not className:
-                report(f'다음 xpath는 {tagList}번 사유로 파싱할 수 없음: {xpath}')
+                yield from extractDefs(node.find('value'), named)
+                return
+            selector = compileXpath(xpath)
+            if not selector:
+                diagnostics.add(operation, xpath, selector.reason)
                 return
-            yield from parse_recursive(node.find('value'), className, '.'.join(tagList), lastTag=tagList[-1])
+            for tagList in selector.paths:
+                yield from parse_recursive(node.find('value'), selector.className, '.'.join(tagList),
+                                           lastTag=tagList[-1])
         except Exception as e:
-            report(e)
+            diagnostics.add(operation, xpath, DIAG_EXCEPTION, repr(e))
             return
     elif operation == 'PatchOperationRemove':
-        try:
-            xpath = node.find('xpath').text
-            report(f'노드를 제거하는 패치는 추출하지 않음, xpath: {xpath}')
-        except AttributeError:
-            report('노드를 제거하는 패치는 추출하지 않음, xpath 존재하지 않음')
-            return
+        xpathNode = node.find('xpath')
+        diagnostics.add(operation, xpathNode.text if xpathNode is not None else None, DIAG_REMOVE)
     else:
         return
 
 
-def extractPatches(root):
+def extractPatches(root, named=None):
     assert 'Patch' == root.tag, "첫 태그가 Patch가 아닙니다. 오류를 발생시킨 모드 이름을 Alpha에게 제보해주세요."
 
-    for item in list(root):
+    for item in root:
         assert 'Operation' == item.tag, "Patch 하위 태그가 Operation이 아닙니다. 오류를 발생시킨 모드 이름을 Alpha에게 제보해주세요."
-        yield from analysisOperation(item, [])
+        yield from analysisOperation(item, [], named)
+
+
+class StreamedRoot:
+    """
+    Stands in for the root of a huge Defs/Patch file, so memory depends on the largest top-level node, not the file.
+    Each iteration parses the file again with iterparse, one top-level node at a time, and drops every node
+    from the tree once the next one is requested. Named defs survive as their extracted nodes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as fin:
+            _, root = next(et.iterparse(fin, events=('start',)))
+        self.tag = root.tag
+        self.attrib = root.attrib
+
+    def __iter__(self):
+        with open(self.path, 'rb') as fin:
+            events = et.iterparse(fin, events=('start', 'end'))
+            _, root = next(events)
+            depth = 1
+            for event, elem in events:
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1:
+                    yield elem
+                    root.remove(elem)
+
+
+def openRoot(path):
+    if os.path.getsize(path) >= STREAM_MIN_BYTES:
+        return StreamedRoot(path)
+    return et.parse(path).getroot()
+
+
+def extractFile(path, isPatch, timed=False):
+    """
+    Extracts one Defs/Patches file.
+    Returns the extracted nodes, the exception that stopped the extraction if any, the Named defs of the file,
+    the diagnostics records of the patches it skipped and, if timed, its (phase, seconds, bytes) timings.
+    """
+    extracts = []
+    named = []
+    diagnostics.file = path
+    start = len(diagnostics.records)
+    stats = [] if timed else None
+    error = None
+    begin = time.perf_counter()
+    parsed = None
+    try:
+        root = openRoot(path)
+        parsed = time.perf_counter()
+        for extract in (extractPatches if isPatch else extractDefs)(root, named):
+            extracts.append(extract)
+    except Exception as e:
+        error = e
+    if timed and parsed is not None:
+        stats.append(('parse', parsed - begin, os.path.getsize(path)))
+        stats.append(('analysisPatches' if isPatch else 'extractDefs', time.perf_counter() - parsed, 0))
+    return extracts, error, named, diagnostics.take(start), stats
+
+
+def extractFiles(jobs, parallel=False, cache=None, progress=None, cancel=None):
+    """
+    Extracts (path, isPatch) jobs, across all cores if parallel is set. Results keep the order of jobs.
+    Each result is (extracts, error, named, records). Inheritance is left to InheritanceResolver,
+    so files do not depend on each other and files unchanged since the last run are served from the cache.
+    progress(path, extracts) is called as each file is done. Returns None once the cancel event is set.
+    """
+    results = [None] * len(jobs)
+    todo = []
+    for i, (path, _) in enumerate(jobs):
+        start = time.perf_counter()
+        entry = cache.get(path) if cache else None
+        if entry:
+            timings.record('cacheRead', start, path, size=0)
+            extracts, named, records = entry
+            results[i] = extracts, None, named, records
+            if progress:
+                progress(path, extracts)
+        else:
+            todo.append(i)
+
+    paths = [jobs[i][0] for i in todo]
+    isPatches = [jobs[i][1] for i in todo]
+    pool = None
+    if parallel and len(todo) >= PARALLEL_MIN_FILES:
+        workers = os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers)
+        fresh = pool.map(extractFile, paths, isPatches, repeat(timings.enabled),
+                         chunksize=max(1, len(todo) // (workers * 4)))
+    else:
+        fresh = map(extractFile, paths, isPatches, repeat(timings.enabled))
+
+    try:
+        for i, (extracts, error, named, records, stats) in zip(todo, fresh):
+            results[i] = extracts, error, named, records
+            for phase, seconds, size in stats or ():
+                timings.add(phase, seconds, size, jobs[i][0])
+            if cache and error is None:
+                cache.put(jobs[i][0], extracts, named, records)
+            if progress:
+                progress(jobs[i][0], extracts)
+            if cancel and cancel.is_set():
+                return None
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+    return results
+
+
+class ExtractionCache:
+    """
+    On-disk cache of what each Defs/Patches/Keyed file extracted, keyed on path, mtime, size and content hash.
+    Entries are (extracts, named, records): the extracted tuples, the Named defs and the diagnostics of the file.
+    The least recently used entries are evicted beyond maxBytes.
+    Several processes may share the file: it is in WAL mode, every write is committed at once,
+    and the use of the entries read is only stamped in close().
+    """
+    version = 3
+
+    def __init__(self, fileName='extract_cache.db', maxBytes=CACHE_MAX_BYTES):
+        self.maxBytes = maxBytes
+        self.used = {}  # path: (mtime, size, time used) of the entries read
+        self.db = sqlite3.connect(fileName, timeout=CACHE_TIMEOUT_S)
+        deadline = time.monotonic() + CACHE_TIMEOUT_S
+        while True:  # a new file may be switched to WAL by another process, which fails at once instead of waiting
+            try:
+                self.db.execute("PRAGMA journal_mode=WAL")
+                break
+            except sqlite3.OperationalError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")  # or another process may drop the table this one just made and filled
+            if self.db.execute("PRAGMA user_version").fetchone()[0] != self.version:
+                self.db.execute("DROP TABLE IF EXISTS files")
+                self.db.execute(f"PRAGMA user_version = {self.version}")
+            self.db.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+                            "hash BLOB, data BLOB, used INTEGER)")
+
+    @staticmethod
+    def hashFile(path):
+        with open(path, 'rb') as fin:
+            return hashlib.blake2b(fin.read(), digest_size=16).digest()
+
+    def get(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        row = self.db.execute("SELECT mtime, size, hash, data FROM files WHERE path = ?", (path,)).fetchone()
+        if not row:
+            return None
+        mtime, size, digest, data = row
+        if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+            if size != stat.st_size or digest != self.hashFile(path):
+                return None
+        self.used[path] = stat.st_mtime_ns, stat.st_size, time.time_ns()
+        return pickle.loads(data)
+
+    def put(self, path, extracts, named, records):
+        try:
+            stat = os.stat(path)
+            digest = self.hashFile(path)
+        except OSError:
+            return
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                            (path, stat.st_mtime_ns, stat.st_size, digest, pickle.dumps((extracts, named, records)),
+                             time.time_ns()))
+
+    def close(self):
+        try:
+            with self.db:
+                self.db.executemany("UPDATE files SET mtime = ?, size = ?, used = ? WHERE path = ?",
+                                    [(*stamp, path) for path, stamp in self.used.items()])
+                total = self.db.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM files").fetchone()[0]
+                if total > self.maxBytes:
+                    for path, length in self.db.execute("SELECT path, LENGTH(data) FROM files ORDER BY used").fetchall():
+                        self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                        total -= length
+                        if total <= self.maxBytes:
+                            break
+        finally:
+            self.db.close()
+
+
+class NodeStore:
+    """
+    Extracted nodes of Defs and Patches by class, in the order their tags were first found.
+    Every string is kept once in an interned table and a node is three ids (tag, lastTag, text) in array columns,
+    instead of a tuple and its own copies of the last tag and the text.
+    A later node with the same tag in the same class replaces the earlier one, as the dict it replaces did.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+        self.columns = {}  # className: (tag ids, lastTag ids, text ids)
+        self.rows = {}  # className: {tag id: row}
+
+    def __len__(self):
+        return sum(len(columns[0]) for columns in self.columns.values())
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def clear(self):
+        self.__init__()
+
+    def intern(self, string):
+        if self.ids is None:
+            self.ids = {string: i for i, string in enumerate(self.strings)}
+        try:
+            return self.ids[string]
+        except KeyError:
+            self.ids[string] = len(self.strings)
+            self.strings.append(string)
+            return len(self.strings) - 1
+
+    def add(self, className, tag, lastTag, text):
+        """Adds or replaces one node and returns the interned text."""
+        tagId, lastTagId, textId = self.intern(tag), self.intern(lastTag), self.intern(text)
+        if className not in self.columns:
+            self.columns[className] = (array('I'), array('I'), array('I'))
+            self.rows[className] = {}
+        tags, lastTags, texts = self.columns[className]
+        rows = self.rows.get(className)
+        if rows is None:
+            rows = self.rows[className] = {tag: row for row, tag in enumerate(tags)}
+
+        row = rows.get(tagId)
+        if row is None:
+            rows[tagId] = len(tags)
+            tags.append(tagId)
+            lastTags.append(lastTagId)
+            texts.append(textId)
+        else:
+            lastTags[row] = lastTagId
+            texts[row] = textId
+        return self.strings[textId]
+
+    def compact(self):
+        """Drops the lookup tables that are only needed while adding. They are rebuilt if a node is added again."""
+        self.ids = None
+        self.rows = {}
+
+    def lastTags(self, className):
+        return {self.strings[i] for i in set(self.columns[className][1])}
+
+    def items(self, className):
+        """Yields (tag, lastTag, text) of the nodes of className."""
+        strings = self.strings
+        for tagId, lastTagId, textId in zip(*self.columns[className]):
+            yield strings[tagId], strings[lastTagId], strings[textId]
+
+
+dict_class = NodeStore()
+
+
+def addExtracts(extracts, classes, tagsText):
+    for extract in extracts:
+        if extract:
+            className, lastTag, tag, text = extract
+        else:
+            continue
+        if className == 'ScenarioDef' and tag != lastTag and 'scenario' not in tag:
+            tag = tag.split('.')
+            tag.insert(1, 'scenario')
+            tag = '.'.join(tag)
+        text = classes.add(className, tag, lastTag, text)
+        if lastTag in tagsText:
+            tagsText[lastTag][text] += 1
+        else:
+            tagsText[lastTag] = collections.Counter({text: 1})
+
+
+def compilePrefilter(includes):
+    """Returns the byte pattern of an opening tag of the included tags, or None without included tags."""
+    names = sorted({tag.encode() for tag in includes if tag})
+    if not names:
+        return None
+    return re.compile(rb'<(?:' + b'|'.join(map(re.escape, names)) + rb')[\s/>]')
+
+
+def scanRawDefs(path, pattern):
+    """
+    Returns whether the raw bytes of the file at path match pattern, the Names and the ParentNames in them.
+    An empty or unreadable file matches, to be parsed and to fail as before.
+    """
+    try:
+        with open(path, 'rb') as fin, mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:2] in (b'\xff\xfe', b'\xfe\xff'):
+                data = data[:].decode('utf-16').encode()
+            names, parents = set(), set()
+            for parent, name in NAME_ATTRIBUTE.findall(data):
+                (parents if parent else names).add(name)
+            return pattern.search(data) is not None, names, parents
+    except (OSError, ValueError):
+        return True, set(), set()
+
+
+def prefilterDefs(paths, pattern):
+    """
+    Returns the set of paths that may give a node of an included tag: the files with an opening tag of pattern,
+    and every file linked to one of those by a Name it defines or inherits. A def takes the nodes of its parents
+    from any file, and a Name defined twice resolves to the later definition, so both are kept.
+    paths may hold Patches files too, for the defs of their values: a Name is looked for anywhere in the raw bytes.
+    """
+    scans = {path: scanRawDefs(path, pattern) for path in paths}
+    linked = collections.defaultdict(list)
+    for path, (_, names, parents) in scans.items():
+        for name in names | parents:
+            linked[name].append(path)
+
+    kept = {path for path, (matched, _, _) in scans.items() if matched}
+    pending = list(kept)
+    while pending:
+        for name in scans[pending.pop()][1]:
+            for path in linked.pop(name, ()):
+                if path not in kept:
+                    kept.add(path)
+                    pending.append(path)
+    return kept
+
+
+def extractNodes(extractPathList, parallel=False, useCache=False, progress=None, cancel=None, prefilter=None):
+    """
+    Extracts the selected folders into dict_class, dict_keyed, Config.dict_tags_text and Config.list_strings.
+    Config.dict_tags_text counts the occurrences of each text by last tag.
+    Returns (0, folders that cannot be extracted), (1, (file name, error message)) if a file stopped the extraction,
+    or (2, None) if the cancel event was set. Those are filled only when the extraction succeeds.
+    progress(files done, total files, nodes found, current file) is called from the calling thread.
+    With a prefilter pattern of compilePrefilter, the Defs files that prefilterDefs leaves out are not parsed,
+    and their number goes to Config.prefilteredFiles.
+    """
+    global dict_class
+    start = time.perf_counter()
+    extractLists = {}
+    stringsLists = {}
+    for extractPath in extractPathList:
+        if folderName(extractPath) in ['Defs', 'Patches']:
+            extractLists[extractPath] = walkFiles(extractPath, '.xml')
+        elif folderName(extractPath) == 'Languages':
+            extractLists[extractPath] = walkFiles(extractPath + "/English/Keyed", '.xml')
+            stringsLists[extractPath] = walkFiles(extractPath + "/English/Strings", '.txt')
+    timings.record('walk', start, size=0)
+
+    prefiltered = 0
+    if prefilter:
+        start = time.perf_counter()
+        defsPaths = [extractPath for extractPath in extractLists if folderName(extractPath) == 'Defs']
+        # Patches are always parsed, but the defs their PatchOperationAdd values define may be parents of Defs files
+        kept = prefilterDefs([path for extractPath in extractLists if folderName(extractPath) in ['Defs', 'Patches']
+                              for path in extractLists[extractPath]], prefilter)
+        for extractPath in defsPaths:
+            prefiltered += len(extractLists[extractPath])
+            extractLists[extractPath] = [path for path in extractLists[extractPath] if path in kept]
+            prefiltered -= len(extractLists[extractPath])
+        timings.record('prefilter', start, size=0)
+
+    jobs = [(path, folderName(extractPath) == 'Patches')
+            for extractPath, GoExtractLists in extractLists.items() if folderName(extractPath) != 'Languages'
+            for path in GoExtractLists]
+    keyedPaths = [path for extractPath, GoExtractLists in extractLists.items()
+                  if folderName(extractPath) == 'Languages' for path in GoExtractLists]
+
+    done = 0
+    found = 0
+
+    def onFile(path, nodes):
+        nonlocal done, found
+        done += 1
+        found += len(nodes)
+        if progress:
+            progress(done, len(jobs) + len(keyedPaths), found, path)
+
+    cache = ExtractionCache() if useCache else None
+    try:
+        fileResults = extractFiles(jobs, parallel=parallel, cache=cache, progress=onFile, cancel=cancel)
+        if fileResults is None:
+            return 2, None
+        results = dict(zip([path for path, _ in jobs], fileResults))
+
+        keyedResults = {}
+        for path in keyedPaths:
+            if cancel and cancel.is_set():
+                return 2, None
+            start = time.perf_counter()
+            if cache and (entry := cache.get(path)):
+                timings.record('cacheRead', start, path, size=0)
+                keyedResults[path] = entry[0], None
+                onFile(path, entry[0])
+                continue
+            try:
+                keyedResults[path] = [(node.tag, node.text if node.text else "")
+                                      for node in et.parse(path).getroot()], None
+            except ValueError as e:
+                keyedResults[path] = [], e
+                continue
+            if cache:
+                cache.put(path, keyedResults[path][0], [], [])
+            timings.record('keyed', start, path)
+            onFile(path, keyedResults[path][0])
+    finally:
+        if cache:
+            cache.close()
+
+    start = time.perf_counter()
+    resolver = InheritanceResolver()
+    for _, _, named, records in results.values():
+        resolver.add(named)
+        diagnostics.records.extend(records)
+
+    classes = NodeStore()
+    keyed = {}
+    tagsText = {}
+    strings = []
+    skipped = []
+    for extractPath in extractPathList:
+        if folderName(extractPath) in ['Defs', 'Patches']:
+            for path in extractLists[extractPath]:
+                extracts, error, _, _ = results[path]
+                addExtracts(resolver.resolve(extracts), classes, tagsText)
+                if isinstance(error, ValueError):
+                    diagnostics.flush()
+                    return 1, (path, str(error))
+                elif error:
+                    diagnostics.flush()
+                    raise error
+
+        elif folderName(extractPath) == 'Languages':
+            for path in extractLists[extractPath]:
+                nodes, error = keyedResults[path]
+                if error:
+                    diagnostics.flush()
+                    return 1, (path, str(error))
+                for tag, text in nodes:
+                    keyed[tag] = text
+            strings.extend(stringsLists[extractPath])
+
+        else:
+            skipped.append(extractPath)
+
+    if cancel and cancel.is_set():
+        diagnostics.records.clear()
+        return 2, None
+    timings.record('resolve', start, size=0)
+    diagnostics.flush()
+    classes.compact()
+    dict_class = classes
+    dict_keyed.clear()
+    dict_keyed.update(keyed)
+    Config.dict_tags_text = tagsText
+    Config.list_strings = strings
+    Config.prefilteredFiles = prefiltered
+    return 0, skipped
+
+
+def clearExtraction():
+    """Drops the extracted nodes, with the tags counted and classified from them and the mod they came from."""
+    Config.extractPathList = []
+    Config.modName = ""
+    Config.pakageID = ""
+    Config.exportDirName.set("")
+    Config.exportFileName.set("")
+    dict_class.clear()
+    dict_keyed.clear()
+    list_strings.clear()
+    Config.list_strings = []
+    Config.dict_tags_text = {}
+    Config.tagSort = TagClassification()
+    Config.prefilteredFiles = 0
+
+
+def classifyTags(definedExcludes, definedIncludes):
+    start = time.perf_counter()
+    excludes = []
+    defaults = sorted(Config.dict_tags_text.keys())
+    includes = []
+
+    while defaults:
+        candidate = defaults.pop(0)
+        try:
+            int(candidate)
+            excludes.append(candidate)
+        except ValueError:
+            defaults.insert(0, candidate)
+            break
+
+    Config.tagSort = TagClassification(excludes, defaults, includes)
+    Config.tagSort.reclassify(definedExcludes, definedIncludes, keep=excludes)
+    timings.record('classify', start, size=0)
+
+
+def readTagFile(fileName):
+    """Returns the excluded and included tags of a .tag file."""
+    with open(fileName, 'r') as fin:
+        reads = fin.read().split('\n')
+    return reads[1].split('/'), reads[3].split('/')
+
+
+class TagClassification:
+    """
+    Excluded / unclassified / included tags of the node classification screen.
+    Each tag's column is kept in a dict and each column keeps its visible tags as a sorted list,
+    so moving a tag costs a dict update and two bisects instead of re-sorting every list.
+    """
+
+    def __init__(self, excludes=(), defaults=(), includes=()):
+        self.columnOf = {}
+        for column, tags in enumerate([excludes, defaults, includes]):
+            for tag in tags:
+                self.columnOf[tag] = column
+        self.filtered = None
+        self.visible = [[], [], []]
+        self.refresh()
+
+    def tags(self, column):
+        return sorted(tag for tag, c in self.columnOf.items() if c == column)
+
+    def tagSet(self, column):
+        return {tag for tag, c in self.columnOf.items() if c == column}
+
+    def refresh(self):
+        self.visible = [[], [], []]
+        for tag in sorted(self.columnOf):
+            if self.filtered is None or tag in self.filtered:
+                self.visible[self.columnOf[tag]].append(tag)
+
+    def setFilter(self, filtered):
+        """Shows only the tags in filtered, or every tag if filtered is None."""
+        self.filtered = filtered
+        self.refresh()
+
+    def reclassify(self, excludes, includes, keep=()):
+        """Sorts every tag but those in keep again: excludes, includes, and unclassified for the rest."""
+        excludes, includes, keep = set(excludes), set(includes), set(keep)
+        for tag in self.columnOf:
+            if tag not in keep:
+                self.columnOf[tag] = TAG_EXCLUDE if tag in excludes else TAG_INCLUDE if tag in includes else TAG_DEFAULT
+        self.refresh()
+
+    def move(self, tags, destination):
+        """
+        Moves tags to the destination column.
+        Returns the changes of the visible lists in order, as (column, index, tag, isInsert).
+        """
+        changes = []
+        for tag in tags:
+            source = self.columnOf.get(tag)
+            if source is None or source == destination:
+                continue
+            self.columnOf[tag] = destination
+            if self.filtered is not None and tag not in self.filtered:
+                continue
+            index = bisect_left(self.visible[source], tag)
+            del self.visible[source][index]
+            changes.append((source, index, tag, False))
+            index = bisect_left(self.visible[destination], tag)
+            self.visible[destination].insert(index, tag)
+            changes.append((destination, index, tag, True))
+        return changes
+
+
+class TagFilter:
+    """
+    Search index of the node classification screen.
+    Every text is normalized once and the texts of each tag are joined into one string, so a keystroke costs
+    one substring search per tag instead of normalizing every text again.
+    A query that extends the previous one only searches the tags the previous one matched.
+    """
+
+    def __init__(self, dict_tags_text):
+        start = time.perf_counter()
+        self.tagNames = {tag: self.normalize(tag) for tag in dict_tags_text}
+        self.textBlobs = {tag: '\0'.join({self.normalize(text) for text in texts})
+                          for tag, texts in dict_tags_text.items()}
+        self.lastTextSearch = ""
+        self.lastTextMatches = set(dict_tags_text)
+        timings.record('tagFilter', start, size=0)
+
+    @staticmethod
+    def normalize(text):
+        return text.lower().replace(' ', '')
+
+    def search(self, tagSearch, textSearch):
+        """Returns the set of tags matching both filters, or None when both are empty."""
+        tagSearch = self.normalize(tagSearch)
+        textSearch = self.normalize(textSearch)
+        if not tagSearch and not textSearch:
+            return None
+
+        if textSearch:
+            candidates = self.lastTextMatches if self.lastTextSearch in textSearch else self.textBlobs.keys()
+            matches = {tag for tag in candidates if textSearch in self.textBlobs[tag]}
+            self.lastTextSearch = textSearch
+            self.lastTextMatches = matches
+        else:
+            matches = self.tagNames.keys()
+
+        return {tag for tag in matches if tagSearch in self.tagNames[tag]}
 
 
 def loadSelectTags(window):
@@ -772,10 +2182,11 @@ def loadSelectTags(window):
 
     def onDestroy():
         if Config.rememberTagSort.get():
-            Config.definedIncludes = list((set(Config.definedIncludes) | set(Config.includes))
-                                          - set(Config.defaults) - set(Config.excludes))
-            Config.definedExcludes = list((set(Config.definedExcludes) | set(Config.excludes))
-                                          - set(Config.defaults) - set(Config.includes))
+            excludes = Config.tagSort.tagSet(TAG_EXCLUDE)
+            defaults = Config.tagSort.tagSet(TAG_DEFAULT)
+            includes = Config.tagSort.tagSet(TAG_INCLUDE)
+            Config.definedIncludes = list((set(Config.definedIncludes) | includes) - defaults - excludes)
+            Config.definedExcludes = list((set(Config.definedExcludes) | excludes) - defaults - includes)
             Config.write()
 
         window.deiconify()
@@ -806,7 +2217,7 @@ def loadSelectTags(window):
         dialog = Toplevel(window)
         dialog.title(tag)
         text = Text(dialog)
-        text.insert(1.0, '\n'.join(sorted(list(set(Config.dict_tags_text[tag])))))
+        text.insert(1.0, '\n'.join(sorted(Config.dict_tags_text[tag])))
         text.configure(state='disabled')
         text.bind("<Escape>", lambda x: dialog.destroy())
         text.bind("<q>", lambda x: moveTag(tag, 0, dialog=dialog))
@@ -817,89 +2228,69 @@ def loadSelectTags(window):
         Grid.columnconfigure(dialog, 0, weight=1)
         text.grid(row=0, column=0, sticky='NSWE')
 
+    Config.tagSort.setFilter(None)
+
     Label(frame, text="추출 제외 태그").grid(row=0, column=0, sticky='NSWE')
-    excludeVar = StringVar(value=Config.excludes)
-    excludeList = Listbox(frame, listvariable=excludeVar)
+    excludeVar = StringVar(value=Config.tagSort.visible[TAG_EXCLUDE])
+    excludeList = Listbox(frame, listvariable=excludeVar, selectmode='extended')
     excludeList.grid(row=1, column=0, sticky='NSWE')
-    excludeList.bind("<w>", lambda x: moveTag(excludeList, 1))
-    excludeList.bind("<e>", lambda x: moveTag(excludeList, 2))
 
     Label(frame, text="미분류 태그\n(추출 제외)").grid(row=0, column=1, sticky='NSWE')
-    defaultVar = StringVar(value=Config.defaults)
-    defaultList = Listbox(frame, listvariable=defaultVar)
+    defaultVar = StringVar(value=Config.tagSort.visible[TAG_DEFAULT])
+    defaultList = Listbox(frame, listvariable=defaultVar, selectmode='extended')
     defaultList.grid(row=1, column=1, sticky='NSWE')
-    defaultList.bind("<q>", lambda x: moveTag(defaultList, 0))
-    defaultList.bind("<e>", lambda x: moveTag(defaultList, 2))
 
     Label(frame, text="추출 대상 태그").grid(row=0, column=2, sticky='NSWE')
-    includeVar = StringVar(value=Config.includes)
-    includeList = Listbox(frame, listvariable=includeVar)
+    includeVar = StringVar(value=Config.tagSort.visible[TAG_INCLUDE])
+    includeList = Listbox(frame, listvariable=includeVar, selectmode='extended')
     includeList.grid(row=1, column=2, sticky='NSWE')
-    includeList.bind("<q>", lambda x: moveTag(includeList, 0))
-    includeList.bind("<w>", lambda x: moveTag(includeList, 1))
+
+    listBoxes = [excludeList, defaultList, includeList]
+    listVars = [excludeVar, defaultVar, includeVar]
+
+    def showTags():
+        for listVar, tags in zip(listVars, Config.tagSort.visible):
+            listVar.set(tags)
+
+    def applyMove(tags, destination):
+        changes = Config.tagSort.move(tags, destination)
+        if len(changes) > 100:
+            showTags()
+        else:
+            for column, index, tag, isInsert in changes:
+                if isInsert:
+                    listBoxes[column].insert(index, tag)
+                else:
+                    listBoxes[column].delete(index)
+        if changes:
+            listBoxes[destination].see(bisect_left(Config.tagSort.visible[destination], changes[-1][2]))
 
     def moveTag(tag, destination, dialog=None):
-        if not isinstance(tag, str):
-            if not tag.curselection():
-                return
-            else:
-                tag = tag.get(tag.curselection()[0])
         if dialog:
             dialog.destroy()
-        try:
-            toMove = Config.defaults.pop(Config.defaults.index(tag))
-            if destination == 1:
-                return
-            if defaultList.get('end') == toMove:
-                defaultList.activate(defaultList.size() - 2)
-                defaultList.selection_set(defaultList.size() - 2)
-        except ValueError:
-            try:
-                toMove = Config.excludes.pop(Config.excludes.index(tag))
-                if destination == 0:
-                    return
-                if excludeList.get('end') == toMove:
-                    excludeList.activate(excludeList.size() - 2)
-                    excludeList.selection_set(excludeList.size() - 2)
-            except ValueError:
-                try:
-                    toMove = Config.includes.pop(Config.includes.index(tag))
-                    if destination == 2:
-                        return
-                    if includeList.get('end') == toMove:
-                        includeList.activate(includeList.size() - 2)
-                        includeList.selection_set(includeList.size() - 2)
-                except ValueError:
-                    return
-
-        [Config.excludes, Config.defaults, Config.includes][destination].append(toMove)
-
-        excludeVar.set(sorted(Config.excludes))
-        defaultVar.set(sorted(Config.defaults))
-        includeVar.set(sorted(Config.includes))
-
-        if destination == 0:
-            for i, v in enumerate(excludeList.get(0, 'end')):
-                if v == toMove:
-                    excludeList.see(i)
-                    break
-        elif destination == 0:
-            for i, v in enumerate(defaultList.get(0, 'end')):
-                if v == toMove:
-                    defaultList.see(i)
-                    break
-        elif destination == 0:
-            for i, v in enumerate(includeList.get(0, 'end')):
-                if v == toMove:
-                    includeList.see(i)
-                    break
-
-    excludeList.bind('<Double-Button-1>', showTexts)
-    defaultList.bind('<Double-Button-1>', showTexts)
-    includeList.bind('<Double-Button-1>', showTexts)
+        applyMove([tag], destination)
+
+    def moveSelected(listBox, destination, everything=False):
+        indices = range(listBox.size()) if everything else listBox.curselection()
+        if not indices:
+            return
+        applyMove([listBox.get(i) for i in indices], destination)
+
+        listBox.selection_clear(0, 'end')
+        if listBox.size():
+            index = min(indices[0], listBox.size() - 1)
+            listBox.selection_set(index)
+            listBox.activate(index)
+
+    for column, listBox in enumerate(listBoxes):
+        for destination, key in enumerate("qwe"):
+            if destination != column:
+                listBox.bind(f"<{key}>", lambda x, l=listBox, d=destination: moveSelected(l, d))
+                listBox.bind(f"<{key.upper()}>", lambda x, l=listBox, d=destination: moveSelected(l, d, everything=True))
+        listBox.bind('<Double-Button-1>', showTexts)
 
     Label(frame, text="[Q]를 입력해 추출 제외").grid(row=2, column=0)
-    Label(frame, text="[W]를 입력해 분류 취소").grid(row=2, column=1)
+    Label(frame, text="[W]를 입력해 분류 취소\n(Shift: 목록의 모든 태그, Ctrl/Shift+클릭: 여러 태그 선택)").grid(row=2, column=1)
     Label(frame, text="[E]를 입력해 추출 추가").grid(row=2, column=2)
 
     searchTag = EntryHint(frame, "[태그 필터]")
@@ -907,56 +2298,23 @@ def loadSelectTags(window):
     searchText = EntryHint(frame, "[원본 텍스트 필터]")
     searchText.grid(row=3, column=1, columnspan=2, sticky='EW')
 
-    dictTextTag = {}
-    for tag, texts in Config.dict_tags_text.items():
-        for text in texts:
-            try:
-                dictTextTag[text].append(tag)
-            except KeyError:
-                dictTextTag[text] = [tag]
+    tagFilter = TagFilter(Config.dict_tags_text)
 
-    # noinspection PyUnusedLocal
-    def onSearch(evt):
-        tagSearch = searchTag.get().lower().replace(' ', '')
-        tagFlag = (tagSearch != "")
-        textSearch = searchText.get().lower().replace(' ', '')
-        textFlag = (textSearch != "")
-
-        Config.excludes = Config.excludes + Config.excludeHide
-        Config.defaults = Config.defaults + Config.defaultHide
-        Config.includes = Config.includes + Config.includeHide
-
-        filteredTags = []
-        if textFlag:
-            for tags in [dictTextTag[text] for text in dictTextTag.keys() if
-                         textSearch in text.lower().replace(' ', '')]:
-                filteredTags.extend(tags)
-            if tagFlag:
-                filteredTags = [tag for tag in list(set(filteredTags)) if tagSearch in tag.lower().replace(' ', '')]
-        elif tagFlag:
-            filteredTags = [tag for tag in Config.dict_tags_text.keys() if tagSearch in tag.lower().replace(' ', '')]
-
-        if textFlag or tagFlag:
-            excludeIntersect = list(set(Config.excludes) & set(filteredTags))
-            Config.excludeHide = [tag for tag in Config.excludes if tag not in excludeIntersect]
-            Config.excludes = excludeIntersect
-            defaultIntersect = list(set(Config.defaults) & set(filteredTags))
-            Config.defaultHide = [tag for tag in Config.defaults if tag not in defaultIntersect]
-            Config.defaults = defaultIntersect
-            includeIntersect = list(set(Config.includes) & set(filteredTags))
-            Config.includeHide = [tag for tag in Config.includes if tag not in includeIntersect]
-            Config.includes = includeIntersect
-        else:
-            Config.excludeHide = []
-            Config.defaultHide = []
-            Config.includeHide = []
+    def onSearch():
+        Config.tagSort.setFilter(tagFilter.search(searchTag.get(), searchText.get()))
+        showTags()
+
+    searchJob = None
 
-        excludeVar.set(sorted(Config.excludes))
-        defaultVar.set(sorted(Config.defaults))
-        includeVar.set(sorted(Config.includes))
+    # noinspection PyUnusedLocal
+    def onKeyRelease(evt):
+        nonlocal searchJob
+        if searchJob:
+            frame.after_cancel(searchJob)
+        searchJob = frame.after(SEARCH_DEBOUNCE_MS, onSearch)
 
-    searchTag.bind("<KeyRelease>", onSearch)
-    searchText.bind("<KeyRelease>", onSearch)
+    searchTag.bind("<KeyRelease>", onKeyRelease)
+    searchText.bind("<KeyRelease>", onKeyRelease)
 
     Checkbutton(frame, text="이 태그 분류를 기억하기", variable=Config.rememberTagSort).grid(row=4, column=1, sticky='NSWE')
 
@@ -969,28 +2327,9 @@ def loadSelectTags(window):
         if fileName == "":
             return
         try:
-            with open(fileName, 'r') as fin:
-                reads = fin.read().split('\n')
-
-            customExcludes = reads[1].split('/')
-            customIncludes = reads[3].split('/')
-
-            Config.defaults = Config.excludes + Config.defaults + Config.includes
-            Config.excludes = []
-            Config.includes = []
-
-            for _ in range(len(Config.defaults)):
-                candidate = Config.defaults.pop(0)
-                if candidate in customExcludes:
-                    Config.excludes.append(candidate)
-                elif candidate in customIncludes:
-                    Config.includes.append(candidate)
-                else:
-                    Config.defaults.append(candidate)
-
-            excludeVar.set(sorted(Config.excludes))
-            defaultVar.set(sorted(Config.defaults))
-            includeVar.set(sorted(Config.includes))
+            customExcludes, customIncludes = readTagFile(fileName)
+            Config.tagSort.reclassify(customExcludes, customIncludes)
+            showTags()
             messagebox.showinfo("불러오기 완료", "태그 분류를 성공적으로 불러왔습니다. 기존 작업은 버려졌습니다.")
         except FileNotFoundError:
             messagebox.showerror("파일을 열 수 없습니다.", "파일을 여는 중 오류가 발생했습니다.\n파일이 삭제되었거나 이동되었을 수 있습니다.")
@@ -1007,8 +2346,10 @@ def loadSelectTags(window):
         if fileName[-4:].lower() != '.tag':
             fileName += '.tag'
         writings = '\n'.join(
-            ("Excludes tag list, split with [/], spacing ignored, case sensitive", '/'.join(Config.excludes),
-             "Includes tag list, split with [/], spacing ignored, case sensitive", '/'.join(Config.includes)))
+            ("Excludes tag list, split with [/], spacing ignored, case sensitive",
+             '/'.join(Config.tagSort.tags(TAG_EXCLUDE)),
+             "Includes tag list, split with [/], spacing ignored, case sensitive",
+             '/'.join(Config.tagSort.tags(TAG_INCLUDE))))
         with open(fileName, 'w') as fin:
             fin.write(writings)
         messagebox.showinfo("저장하기 완료", "태그 분류를 성공적으로 저장했습니다.")
@@ -1032,7 +2373,7 @@ def loadSelectExport(window):
 
     frame.protocol("WM_DELETE_WINDOW", onDestroy)
 
-    for i in range(8):
+    for i in range(9):
         Grid.rowconfigure(frame, i, weight=1)
     for i in range(1):
         Grid.columnconfigure(frame, i, weight=1)
@@ -1056,7 +2397,7 @@ def loadSelectExport(window):
     row7Frame.grid(row=7, column=0)
     btnTexts = ["중단하기", "덮어쓰기", "병합하기", "참조하기"]
     tooltips = ["파일 충돌이 발생할 경우, 파일 출력을 중단하고 알림을 표시합니다. " +
-                "이 경우, 파일 충돌이 발생할 때까지 작성된 파일은 남아 있음에 유의하십시오.",
+                "충돌하는 파일이 하나라도 있으면 어떤 파일도 작성하지 않습니다.",
                 "파일 충돌이 발생할 경우, 해당 파일을 내용을 삭제하고 새로 작성합니다. " +
                 "이 경우, 기존 파일을 복구할 수 없으므로 사전 백업이 권장됩니다.",
                 "파일 충돌이 발생할 경우, 해당 파일에 새로운 태그들을 추가해 병합합니다. " +
@@ -1068,9 +2409,558 @@ def loadSelectExport(window):
         CreateToolTip(tmp, tooltip)
         tmp.grid(row=0, column=i)
 
+    def onAddMemory():
+        path = filedialog.askdirectory(initialdir='./', title="번역된 Languages 폴더 또는 xlsx 파일이 있는 폴더")
+        if not path:
+            return
+        memory = TranslationMemory()
+        try:
+            added = memory.addPath(path)
+            total = len(memory.translations)
+        finally:
+            memory.close()
+        messagebox.showinfo("번역 메모리", f"번역 {added}개를 추가하였습니다. 번역 메모리의 원문은 총 {total}개입니다.")
+
+    row8Frame = Frame(frame)
+    row8Frame.grid(row=8, column=0)
+    tmp = Checkbutton(row8Frame, text="번역 메모리로 번역되지 않은 노드 미리 채우기", variable=Config.useTranslationMemory)
+    CreateToolTip(tmp, "같은 원문을 이전에 번역한 적이 있으면, 그 번역을 TODO 대신 채워 넣습니다. " +
+                       "기존 출력 파일에 있는 번역이 우선합니다.")
+    tmp.grid(row=0, column=0)
+    Button(row8Frame, text="번역 메모리에 기존 번역 추가", command=onAddMemory).grid(row=0, column=1, padx=10)
+
+
+def readLanguageData(fileName):
+    """
+    (tag, source, text) of the nodes of a LanguageData file, the text of a node with li being the list of their texts.
+    The source is the comment right before the node, as the annotated export writes it, without the "EN:" of
+    the game's translation files, or None. Raises et.ParseError or UnicodeDecodeError if the file cannot be read.
+    """
+    root = et.parse(fileName, et.XMLParser(target=et.TreeBuilder(insert_comments=True))).getroot()
+    nodes = []
+    source = None
+    for node in root:
+        if node.tag is et.Comment:
+            source = (node.text or "").strip()
+            if source.startswith("EN:"):
+                source = source[3:].strip()
+        else:
+            nodes.append((node.tag, source, [li.text or "" for li in node] if len(node) else node.text or ""))
+            source = None
+    return nodes
+
+
+def readCommentedPairs(filename):
+    """(source, translation) of every node preceded by a source comment in a LanguageData file."""
+    try:
+        nodes = readLanguageData(filename)
+    except (et.ParseError, UnicodeDecodeError):
+        return []
+    return [(source, text) for _, source, text in nodes if source is not None and isinstance(text, str) and text]
+
+
+def readXlsxPairs(filename):
+    """(source, translation) of the rows of an xlsx export, the translation unescaped like those of the xml files."""
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    try:
+        ws = load_workbook(filename, read_only=True).active
+    except (InvalidFileException, OSError, KeyError):
+        return []
+    return [(row[0], html.unescape(row[1])) for row in ws.iter_rows(min_row=2, min_col=4, max_col=5, values_only=True)
+            if isinstance(row[0], str) and isinstance(row[1], str)]
+
+
+class TranslationMemory:
+    """
+    Translations collected from translated Languages folders and past xlsx exports, by normalized source text:
+    entities unescaped and white space collapsed. Stored in an SQLite file and loaded into a dict,
+    so the exporters look a text up in O(1) instead of re-reading old outputs.
+    A source translated differently in several places keeps the translation added last.
+    """
+
+    def __init__(self, fileName='translation_memory.db'):
+        self.db = sqlite3.connect(fileName)
+        self.db.execute("CREATE TABLE IF NOT EXISTS memory (source TEXT PRIMARY KEY, translation TEXT) WITHOUT ROWID")
+        self.translations = dict(self.db.execute("SELECT source, translation FROM memory"))
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(html.unescape(text).split())
+
+    def get(self, text):
+        """The remembered translation of text, unescaped, or None."""
+        return self.translations.get(self.normalize(text))
+
+    def add(self, pairs):
+        """Adds (source, translation) pairs, skipping empty and TODO translations. Returns how many were added."""
+        rows = {}
+        for source, translation in pairs:
+            source = self.normalize(source)
+            if source and translation and translation.strip() and translation != "TODO":
+                rows[source] = translation
+        self.db.executemany("INSERT OR REPLACE INTO memory VALUES (?, ?)", rows.items())
+        self.db.commit()
+        self.translations.update(rows)
+        return len(rows)
+
+    def addPath(self, path):
+        """Adds the pairs of an xml or xlsx file, or of every one under a folder. Returns how many were added."""
+        if os.path.isdir(path):
+            fileNames = walkFiles(path.replace('\\', '/').rstrip('/'), ('.xml', '.xlsx'), {})
+        else:
+            fileNames = [path]
+        added = 0
+        for fileName in fileNames:
+            added += self.add(readXlsxPairs(fileName) if fileName.endswith('.xlsx') else readCommentedPairs(fileName))
+        return added
+
+    def close(self):
+        self.db.close()
+
+
+def readTranslations(filename):
+    """
+    Translations already in an output file by tag, escaped again for writing: the li texts of a node with li,
+    otherwise its text unless it is TODO. Empty if the file does not exist.
+    """
+    alreadyDefinedDict = {}
+    try:
+        for node in et.parse(filename).getroot():
+            if len(node):
+                alreadyDefinedDict[node.tag] = [escapeText(li.text or "") for li in node]
+            elif node.text != "TODO":
+                alreadyDefinedDict[node.tag] = escapeText(node.text or "")
+    except FileNotFoundError:
+        pass
+    return alreadyDefinedDict
+
+
+def writeAtomically(filename, write):
+    """Calls write(file) on a temporary file next to filename and renames it over filename once it is complete."""
+    Path(os.path.dirname(filename)).mkdir(parents=True, exist_ok=True)
+    temporary = filename + '.tmp'
+    try:
+        with open(temporary, 'w', encoding='UTF8') as fout:
+            write(fout)
+        os.replace(temporary, filename)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def writeLanguageData(filename, entries, exportType, collisionOption, memory=None):
+    """
+    Writes one LanguageData file of entries [(tag, escaped text)], keeping the existing translations on merge/refer
+    and filling the other nodes from the translation memory.
+    Returns True if the existing file had a node with child nodes.
+    """
+    start = time.perf_counter()
+    alreadyDefinedDict = readTranslations(filename) if collisionOption > 1 else {}
+    nested = any(type(text) == list for text in alreadyDefinedDict.values())
+
+    writingTextList = []
+    for tag, text in entries:
+        translation = alreadyDefinedDict.pop(tag, None)
+        if translation is None and memory and (remembered := memory.get(text)) is not None:
+            translation = escapeText(remembered)
+        if exportType == EXPORT_XML_ANNOTATION:
+            writingTextList.append(f"  <!-- {text} -->\n  <{tag}>{'TODO' if translation is None else translation}</{tag}>")
+        else:
+            writingTextList.append(f"  <{tag}>{text if translation is None else translation}</{tag}>")
+
+    def write(fout):
+        fout.write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
+        fout.write('\n'.join(writingTextList))
+        if collisionOption == 2 and alreadyDefinedDict:  # collision -> merge
+            fout.write("\n\n  <!-- 알파의 추출기는 추출하지 않았지만 이미 존재했던 노드들 \n\n")
+            for tag, text in alreadyDefinedDict.items():
+                if type(text) == list:
+                    fout.write(f"  <{tag}>\n")
+                    fout.write('\n'.join([f"    <li>{eachText}</li>" for eachText in text]))
+                    fout.write(f"\n  </{tag}>\n")
+                else:
+                    fout.write(f"  <{tag}>{text}</{tag}>\n")
+            fout.write("  -->")
+        fout.write("\n</LanguageData>")
+
+    writeAtomically(filename, write)
+    timings.record('exportXml', start, filename)
+    return nested
+
+
+def stringsPath(departure):
+    """Path of a Strings file under Languages/English, such as Strings/Names/First.txt."""
+    return departure.replace('\\', '/').rsplit('/Languages/English/', 1)[1]
+
+
+def copyAtomically(departure, destination):
+    start = time.perf_counter()
+    Path(os.path.dirname(destination)).mkdir(parents=True, exist_ok=True)
+    shutil.copy(departure, destination + '.tmp')
+    os.replace(destination + '.tmp', destination)
+    timings.record('exportStrings', start, destination)
+
+
+def exportXml(classes=None, keyed=None, strings=None):
+    """
+    Writes the DefInjected files of the classes with included tags, the Keyed file and the Strings files,
+    of dict_class, dict_keyed and Config.list_strings unless other classes, keyed or strings are given.
+    The nodes are grouped per output file in one pass, and the files are written by a pool of EXPORT_THREADS threads,
+    each through a temporary file renamed over the output, so a stopped export never leaves a half-written file.
+    Returns [3] for a bad file name, (1, (colliding folder, [])) if a file exists and collisions stop the export,
+    before anything is written, or (0, written folders).
+    """
+    for ch in "\\/:*?\"<>|":
+        if ch in Config.exportFileName.get():
+            return [3]
+    exportDir = Config.exportDirName.get()
+    exportFile = Config.exportFileName.get() + '.xml'
+    exportType = Config.exportType.get()
+    collisionOption = Config.collisionOption.get()
+    classes = dict_class if classes is None else classes
+    keyed = dict_keyed if keyed is None else keyed
+    strings = Config.list_strings if strings is None else strings
+
+    files = []  # (folder, file name, [(tag, escaped text)])
+    includes = Config.tagSort.tagSet(TAG_INCLUDE)
+    for className in classes:  # Defs / Patches
+        entries = [(tag, text) for tag, lastTag, text in classes.items(className) if lastTag in includes]
+        if entries:
+            files.append((className, f'{exportDir}/Languages/{LANGUAGE}/DefInjected/{className}/{exportFile}', entries))
+    if keyed:
+        files.append(("Keyed", f'{exportDir}/Languages/{LANGUAGE}/Keyed/{exportFile}',
+                      [(tag, escapeText(text)) for tag, text in keyed.items()]))
+    copies = [(departure, exportDir + f"/Languages/{LANGUAGE}/" + stringsPath(departure)) for departure in strings]
+
+    if collisionOption == 0:  # collision -> stop
+        for folder, filename, _ in files:
+            if os.path.exists(filename):
+                return 1, (folder, [])
+    if collisionOption != 1:  # collision -> not overwrite
+        for _, destination in copies:
+            if os.path.exists(destination):
+                return 1, ("Strings", [])
+
+    memory = TranslationMemory() if Config.useTranslationMemory.get() else None
+    try:
+        with ThreadPoolExecutor(max_workers=EXPORT_THREADS) as pool:
+            written = [pool.submit(writeLanguageData, filename, entries, exportType, collisionOption, memory)
+                       for _, filename, entries in files]
+            copied = [pool.submit(copyAtomically, departure, destination) for departure, destination in copies]
+            nested = [future.result() for future in written]
+            for future in copied:
+                future.result()
+    finally:
+        if memory:
+            memory.close()
+
+    if keyed and nested[-1]:
+        showError("기존 번역에서 내부 노드 발견됨",
+                  "본 프로그램은 Keyed 파일의 텍스트에 하위 노드(<>)가 없는 것으로 가정하였습니다. " +
+                  "해당 노드의 번역은 보존되지 않았을 수 있습니다.")
+    savedList = [folder for folder, _, _ in files]
+    if copies:
+        savedList.append("Strings")
+    return 0, savedList
+
+
+def iterXlsxRows(classes=None, keyed=None):
+    """(class, tag, text) of the nodes to export, of dict_class and dict_keyed unless other classes or keyed are given."""
+    includes = Config.tagSort.tagSet(TAG_INCLUDE)
+    classes = dict_class if classes is None else classes
+    for className in classes:
+        for tag, lastTag, text in classes.items(className):
+            if lastTag in includes:
+                yield className, tag, text
+    for tag, text in (dict_keyed if keyed is None else keyed).items():
+        yield 'Keyed', tag, text
+
+
+def buildWorkbook(alreadyDefinedDict, memory=None, rows=None):
+    from openpyxl import Workbook
+    from openpyxl.styles import PatternFill
+
+    wb = Workbook()
+    ws = wb.active
+
+    writingList = list(iterXlsxRows() if rows is None else rows)
+
+    fill = PatternFill(fill_type='solid', fgColor='ffffff')
+
+    ws.cell(row=1, column=1).value = "Class+Node [(Identifier (Key)]"
+    ws.cell(row=1, column=2).value = "Class [Not chosen]"
+    ws.cell(row=1, column=3).value = "Node [Not chosen]"
+    ws.cell(row=1, column=4).value = "EN [Source string]"
+    ws.cell(row=1, column=5).value = "KO [Translation]"
+    for j in range(1, 6):
+        ws.cell(row=1, column=j).fill = fill
+
+    ws.cell(row=1, column=6).value = "Configs [Not chosen]"
+    ws.cell(row=1, column=6).fill = PatternFill(fill_type='solid', fgColor='a6a6a6')
+    ws.cell(row=2, column=6).value = "pakageID"
+    ws.cell(row=2, column=6).fill = PatternFill(fill_type='solid', fgColor='f79646')
+    ws.cell(row=3, column=6).value = Config.pakageID
+    ws.cell(row=3, column=6).fill = PatternFill(fill_type='solid', fgColor='ffff00')
+    ws.cell(row=4, column=6).value = "modName (folderName)"
+    ws.cell(row=4, column=6).fill = PatternFill(fill_type='solid', fgColor='f79646')
+    ws.cell(row=5, column=6).value = Config.modName
+    ws.cell(row=5, column=6).fill = PatternFill(fill_type='solid', fgColor='ffff00')
+
+    for i, (className, tag, text) in enumerate(writingList):
+        ws.cell(row=i + 2, column=1).value = className + '+' + tag
+        ws.cell(row=i + 2, column=2).value = className
+        ws.cell(row=i + 2, column=3).value = tag
+        ws.cell(row=i + 2, column=4).value = text
+        for j in range(1, 6):
+            ws.cell(row=i + 2, column=j).fill = fill
+
+        if alreadyDefinedDict:
+            try:
+                ws.cell(row=i + 2, column=5).value = alreadyDefinedDict[className][tag]
+                ws.cell(row=i + 2, column=5).fill = fill
+                continue
+            except KeyError:
+                pass
+        if memory and (translation := memory.get(text)) is not None:
+            ws.cell(row=i + 2, column=5).value = escapeText(translation)
+
+    return wb
+
+
+def buildWriteOnlyWorkbook(alreadyDefinedDict, memory=None, rows=None):
+    """Same sheet as buildWorkbook, streamed row by row through writeOnlyWorkbook."""
+    def translatedRows():
+        for className, tag, text in iterXlsxRows() if rows is None else rows:
+            try:
+                translation = alreadyDefinedDict[className][tag]
+            except KeyError:
+                translation = memory.get(text) if memory else None
+                if translation is not None:
+                    translation = escapeText(translation)
+            yield className, tag, text, translation
+
+    return writeOnlyWorkbook(translatedRows(), Config.pakageID, Config.modName)
+
+
+def writeOnlyWorkbook(rows, pakageID, modName):
+    """
+    The sheet of buildWorkbook for rows of (class, tag, source text, translation), streamed row by row
+    through a write-only workbook. The cells of a color share one PatternFill instead of building it again.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+
+    def styler(color):
+        fill = PatternFill(fill_type='solid', fgColor=color)
+
+        def styled(value):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.fill = fill
+            return cell
+        return styled
+
+    white = styler('ffffff')
+    configColumn = [styler('a6a6a6')("Configs [Not chosen]"), styler('f79646')("pakageID"),
+                    styler('ffff00')(pakageID), styler('f79646')("modName (folderName)"), styler('ffff00')(modName)]
+
+    ws.append([white("Class+Node [(Identifier (Key)]"), white("Class [Not chosen]"), white("Node [Not chosen]"),
+               white("EN [Source string]"), white("KO [Translation]"), configColumn[0]])
+
+    i = 0
+    for i, (className, tag, text, translation) in enumerate(rows, 1):
+        row = [white(className + '+' + tag), white(className), white(tag), white(text), white(translation)]
+        if i < len(configColumn):
+            row.append(configColumn[i])
+        ws.append(row)
+
+    for j in range(i + 1, len(configColumn)):
+        ws.append([None] * 5 + [configColumn[j]])
+
+    return wb
+
+
+def exportXlsx(writeOnly=True, classes=None, keyed=None, strings=None):
+    """
+    Writes the xlsx of dict_class and dict_keyed, and the Strings files of Config.list_strings,
+    unless other classes, keyed or strings are given. Returns 0, or the error code of batchExtract.
+    """
+    filename = Config.exportDirName.get() + '/' + Config.exportFileName.get() + '.xlsx'
+
+    alreadyDefinedDict = {}
+    if os.path.exists(filename):
+        if Config.collisionOption.get() == 0:  # collision -> stop
+            return 1
+        if Config.collisionOption.get() > 1:
+            from openpyxl import load_workbook
+
+            start = time.perf_counter()
+            with open(filename, "rb") as f:
+                ioFile = io.BytesIO(f.read())
+            ws = load_workbook(ioFile, read_only=True).active
+            for row in ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True):
+                if any(row):
+                    try:
+                        alreadyDefinedDict[row[0]][row[1]] = row[3]
+                    except KeyError:
+                        alreadyDefinedDict[row[0]] = {row[1]: row[3]}
+            timings.record('xlsxRead', start, filename)
+
+    try:
+        Path('/'.join(filename.split('/')[:-1])).mkdir(parents=True, exist_ok=True)
+    except NotADirectoryError:
+        return 4
+
+    start = time.perf_counter()
+    memory = TranslationMemory() if Config.useTranslationMemory.get() else None
+    try:
+        rows = iterXlsxRows(classes, keyed)
+        wb = buildWriteOnlyWorkbook(alreadyDefinedDict, memory, rows) if writeOnly else \
+            buildWorkbook(alreadyDefinedDict, memory, rows)
+    finally:
+        if memory:
+            memory.close()
+    timings.record('xlsxBuild', start, size=0)
+
+    start = time.perf_counter()
+    try:
+        wb.save(filename)
+    except PermissionError:
+        return 2
+    except OSError:
+        return 3
+    timings.record('xlsxSave', start, filename)
+
+    # Strings
+    for departure in Config.list_strings if strings is None else strings:
+        destination = Config.exportDirName.get() + '/' + stringsPath(departure)
+        if Config.collisionOption.get() != 1:  # collision -> not overwrite
+            try:
+                with open(destination, 'r', encoding='UTF8') as _:
+                    return 1
+            except FileNotFoundError:
+                pass
+
+        start = time.perf_counter()
+        Path(os.path.dirname(destination)).mkdir(parents=True, exist_ok=True)
+        shutil.copy(departure, destination)
+        timings.record('exportStrings', start, destination)
+
+    return 0
+
+
+def readPreviousExport(path):
+    """
+    Source texts of a previous export by (class, tag): the EN column of an xlsx export, or the source comments
+    (readLanguageData) of the DefInjected and Keyed files under a folder. The source of a node without one is None,
+    as its text is a translation. Returns None if nothing could be read.
+    """
+    previous = {}
+    if path.endswith('.xlsx'):
+        from openpyxl import load_workbook
+        from openpyxl.utils.exceptions import InvalidFileException
+
+        try:
+            ws = load_workbook(path, read_only=True).active
+        except (InvalidFileException, OSError, KeyError):
+            return None
+        for className, tag, text in ws.iter_rows(min_row=2, min_col=2, max_col=4, values_only=True):
+            if className and tag:
+                previous[(className, tag)] = text if isinstance(text, str) and text else None
+        return previous or None
+
+    for className, fileName in languageFiles(path.replace('\\', '/').rstrip('/')):
+        try:
+            nodes = readLanguageData(fileName)
+        except (et.ParseError, UnicodeDecodeError):
+            continue
+        for tag, source, text in nodes:
+            if isinstance(text, str):
+                previous[(className, tag)] = source
+    return previous or None
+
+
+def sourceDigest(text):
+    return hashlib.blake2b(TranslationMemory.normalize(text).encode(), digest_size=8).digest()
+
+
+def exportDelta(previousPath):
+    """
+    Compares the extracted nodes that would be exported with a previous export (readPreviousExport), by (class, tag)
+    and a digest of the normalized source text, and exports only the added and changed nodes, in the current
+    export type, to <export folder>_delta. <export file name>.delta.json there lists the added, changed and removed
+    nodes, and the unknown ones: those the previous export has without their source, which cannot be compared
+    and are not exported. The last delta is overwritten, but not a folder without a *.delta.json.
+    Returns (0, manifest), (4, None) without an export folder, (5, None) if the previous export cannot be read,
+    (6, None) if the delta folder is another folder, or (code of the exporter, manifest).
+    """
+    if not Config.exportDirName.get().strip('/ '):
+        return 4, None  # the delta folder would be _delta in the working folder
+    deltaDir = os.path.abspath(Config.exportDirName.get().rstrip('/')).replace('\\', '/') + '_delta'
+    if os.path.isdir(deltaDir) and os.listdir(deltaDir) and not glob.glob(glob.escape(deltaDir) + '/*.delta.json'):
+        return 6, None
+    previous = readPreviousExport(previousPath)
+    if previous is None:
+        return 5, None
+    previousIndex = {key: None if text is None else sourceDigest(text) for key, text in previous.items()}
+
+    includes = Config.tagSort.tagSet(TAG_INCLUDE)
+    current = [(className, tag, lastTag, text) for className in dict_class
+               for tag, lastTag, text in dict_class.items(className) if lastTag in includes]
+    current += [("Keyed", tag, None, text) for tag, text in dict_keyed.items()]
+
+    classes = NodeStore()
+    keyed = {}
+    manifest = {'previous': previousPath, 'mod': Config.modName, 'packageId': Config.pakageID,
+                'added': [], 'changed': [], 'removed': [], 'unknown': []}
+    for className, tag, lastTag, text in current:
+        if (className, tag) in previousIndex and previousIndex[(className, tag)] is None:
+            del previousIndex[(className, tag)]
+            manifest['unknown'].append({'class': className, 'tag': tag, 'text': text})
+            continue
+        digest = previousIndex.pop((className, tag), None)
+        if digest == sourceDigest(text):
+            continue
+        if digest is None:
+            manifest['added'].append({'class': className, 'tag': tag, 'text': text})
+        else:
+            manifest['changed'].append({'class': className, 'tag': tag, 'text': text,
+                                        'previous': previous[(className, tag)]})
+        if className == "Keyed":
+            keyed[tag] = text
+        else:
+            classes.add(className, tag, lastTag, text)
+    manifest['removed'] = [{'class': className, 'tag': tag, 'previous': previous[(className, tag)]}
+                           for className, tag in previousIndex]
+
+    saved = Config.exportDirName.get(), Config.collisionOption.get()
+    Config.exportDirName.set(deltaDir)
+    Config.collisionOption.set(1)
+    try:
+        if os.path.isdir(deltaDir):
+            shutil.rmtree(deltaDir)
+        if Config.exportType.get() != EXPORT_XLSX:
+            result = exportXml(classes, keyed, strings=[])[0]
+        else:
+            result = exportXlsx(classes=classes, keyed=keyed, strings=[])
+    finally:
+        Config.exportDirName.set(saved[0])
+        Config.collisionOption.set(saved[1])
+
+    Path(deltaDir).mkdir(parents=True, exist_ok=True)
+    with open(f"{deltaDir}/{Config.exportFileName.get()}.delta.json", 'w', encoding='UTF8') as fout:
+        json.dump(manifest, fout, ensure_ascii=False, indent=1)
+    return result, manifest
+
 
 def updateText():
     global mainTextVar
+    prefiltered = f"빠른 추출로 읽지 않은 Defs 파일: {Config.prefilteredFiles}개\n" if Config.prefilteredFiles else ""
     mainText = f"""림월드, 혹은 림월드 모드의 텍스트를 추출 * 분류 * 출력할 수 있는 알파추출기입니다.
 
 version = {EXTRACTOR_VERSION}
@@ -1087,21 +2977,220 @@ version = {EXTRACTOR_VERSION}
 
 파일 충돌 시: {"파일 출력을 중단하고 경고창을 표시함" if Config.collisionOption.get() == 0 else "기존 파일을 삭제하고 덮어씀" if Config.collisionOption.get() == 1 else "기존 파일의 노드와 추출한 노드를 함께 출력" if Config.collisionOption.get() == 2 else "기존 파일의 노드는 번역만 참고하고 추출한 노드만 출력"}
 
-"""
+{prefiltered}"""
 
     mainTextVar.set(mainText)
 
 
+def fetchServerVersion(fileName='update_check.dat'):
+    """
+    Returns the latest extractor version, or None if it cannot be known.
+    The answer of the server is kept in fileName for UPDATE_CHECK_INTERVAL_S, and the request gives up after UPDATE_TIMEOUT_S.
+    """
+    try:
+        with open(fileName, 'r', encoding='UTF8') as fin:
+            cached = json.load(fin)
+        if time.time() - cached['checked'] < UPDATE_CHECK_INTERVAL_S:
+            return cached['version']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    import urllib.request
+
+    try:
+        versionURL = "https://raw.githubusercontent.com/dlgks224/AlphaExtractor/master/CURRENT_VERSION"
+        with urllib.request.urlopen(versionURL, timeout=UPDATE_TIMEOUT_S) as response:
+            serverVersion = response.read().decode("utf-8").replace('\n', '')
+    except (OSError, ValueError):  # URLError, HTTPError and timeouts are OSErrors
+        return None
+
+    try:
+        with open(fileName, 'w', encoding='UTF8') as fout:
+            json.dump({'checked': time.time(), 'version': serverVersion}, fout)
+    except OSError:
+        pass
+    return serverVersion
+
+
+def checkUpdate(window):
+    """Asks the server for the latest version on a worker thread and offers the download page when it is newer."""
+    answer = queue.Queue()
+    threading.Thread(target=lambda: answer.put(fetchServerVersion()), daemon=True).start()
+
+    def poll():
+        try:
+            serverVersion = answer.get_nowait()
+        except queue.Empty:
+            window.after(200, poll)
+            return
+        if serverVersion and EXTRACTOR_VERSION != serverVersion:
+            if messagebox.askyesno("업데이트 가능",
+                                   "새로운 버전의 추출기가 발견되었습니다.\n\n" +
+                                   f"업데이트 버전 : {EXTRACTOR_VERSION} -> {serverVersion}\n\n다운로드 페이지를 열까요?"):
+                import webbrowser
+
+                webbrowser.open_new('https://github.com/dlgks224/AlphaExtractor/releases')
+                exit(0)
+
+    window.after(200, poll)
+
+
+def batchExtract(modPath, outDir, tagFile=None, exportType=None, collisionOption=None, useCache=True, timed=False,
+                 useMemory=True, deltaFrom=None, prefilter=False):
+    """
+    Extracts, classifies and exports one mod without a window. Runs in a worker process of batchMain.
+    Returns the export name, the number of nodes, the number of diagnosed patches, the number of Defs files
+    skipped by the prefilter, the elapsed seconds and the error message if the mod failed.
+    If timed, the timings of the run go to <outDir>/<export name>.timings.json.
+    With deltaFrom, only the changes since the export of the mod under deltaFrom are exported, by exportDelta.
+    """
+    global Config
+    start = time.perf_counter()
+    timings.enabled = timed
+    timings.reset()
+    Config = Configures(headless=True)
+    if exportType is not None:
+        Config.exportType.set(exportType)
+    if collisionOption is not None:
+        Config.collisionOption.set(collisionOption)
+    Config.useTranslationMemory.set(int(useMemory))
+    dict_class.clear()
+    dict_keyed.clear()
+
+    modPath = modPath.replace('\\', '/').rstrip('/')
+    _, _, Config.modName, Config.pakageID = readModInfo(modPath, isCore=modPath.split('/')[-2:-1] == ['Data'])
+    pathList, _, autoSelectIndices = findExtractableDirs(modPath)
+    Config.extractPathList = [pathList[idx] for idx in autoSelectIndices]
+    if not Config.extractPathList:
+        return Config.modName, 0, 0, 0, time.perf_counter() - start, "추출할 폴더가 없습니다."
+
+    excludes, includes = readTagFile(tagFile) if tagFile else (Config.definedExcludes, Config.definedIncludes)
+    result = extractNodes(Config.extractPathList, useCache=useCache,
+                          prefilter=compilePrefilter(includes) if prefilter else None)
+    diagnosedPatches = sum(diagnostics.lastCounts.values())
+    if result[0] == 1:
+        return Config.modName, 0, diagnosedPatches, 0, time.perf_counter() - start, \
+            f"{result[1][1]} (파일명: {result[1][0]})"
+    classifyTags(excludes, includes)
+
+    exportName = "".join(filter(lambda ch: ch not in "\\/:*?\"<>|", Config.modName))
+    Config.exportDirName.set(f"{outDir}/{exportName}")
+    Config.exportFileName.set(exportName)
+    if deltaFrom:
+        previousPath = f"{deltaFrom}/{exportName}"
+        result = exportDelta(previousPath + f"/{exportName}.xlsx" if Config.exportType.get() == EXPORT_XLSX
+                             else previousPath)[0]
+    elif Config.exportType.get() != EXPORT_XLSX:
+        result = exportXml()[0]
+    else:
+        result = exportXlsx()
+
+    if timed:
+        timings.write(f"{outDir}/{exportName}.timings.json", mod=Config.modName, packageId=Config.pakageID)
+
+    nodes = len(dict_class) + len(dict_keyed)
+    error = ["", "출력 파일이 이미 존재하여 작업을 중단하였습니다.", "엑셀 파일이 열려있어(혹은 쓰기 금지되어) 저장에 실패하였습니다.",
+             "출력 파일의 이름에 사용할 수 없는 문자가 있습니다.", "출력 폴더의 이름에 사용할 수 없는 문자가 있습니다.",
+             "비교할 이전 출력을 읽을 수 없습니다.",
+             "변경분 출력 폴더(_delta)와 같은 이름의 다른 폴더가 있습니다."][result]
+    return exportName, nodes, diagnosedPatches, Config.prefilteredFiles, time.perf_counter() - start, error
+
+
+def batchExtractAll(modPaths, outDir, jobs, cancel=None, **options):
+    """
+    Runs batchExtract for every mod in a pool of jobs worker processes and yields (mod path, result) as each finishes.
+    An exception in a worker becomes the error message of its result. Once cancel is set, the mods not started
+    are dropped and the running ones are still reported.
+    """
+    return runInPool(batchExtract, modPaths, jobs, cancel, outDir, **options)
+
+
+def runInPool(function, items, jobs, cancel=None, *args, **options):
+    """
+    Yields (item, function(item, *args, **options)) from a pool of jobs worker processes, as each finishes.
+    A result is (name, three counts, elapsed seconds, error message), and an exception in a worker becomes one.
+    """
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(items)))) as pool:
+        futures = {pool.submit(function, item, *args, **options): item for item in items}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                result = futures[future], 0, 0, 0, 0, repr(e)
+            yield futures[future], result
+            if cancel and cancel.is_set():
+                for pending in futures:
+                    pending.cancel()
+
+
+def formatBatchResult(exportName, nodes, diagnosedPatches, prefilteredFiles, seconds, error):
+    if error:
+        return f"실패 {exportName}: {error}"
+    return (f"{exportName}: 노드 {nodes}개, {seconds:.2f}초 ({nodes / seconds if seconds else 0:.0f} 노드/초)" +
+            (f", 읽지 않은 Defs 파일 {prefilteredFiles}개" if prefilteredFiles else "") +
+            (f", 진단된 패치 {diagnosedPatches}개 (error_report.txt)" if diagnosedPatches else ""))
+
+
+def batchMain(argv):
+    """Command line entry point: AlphaExtractor --batch MOD [MOD ...]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="AlphaExtractor --batch", fromfile_prefix_chars='@',
+                                     description="창 없이 여러 모드의 노드를 추출 * 분류 * 출력합니다. " +
+                                                 "@파일명으로 모드 폴더 목록 파일을 넘길 수 있습니다.")
+    parser.add_argument('mods', nargs='+', help="추출할 모드 폴더")
+    parser.add_argument('-o', '--out', default='.', help="모드별 출력 폴더를 만들 위치 (기본값: 현재 폴더)")
+    parser.add_argument('-t', '--tags', help="config.dat 대신 적용할 태그 분류 작업 파일 (*.tag)")
+    parser.add_argument('--type', type=int, choices=[EXPORT_XML_PLAIN, EXPORT_XML_ANNOTATION, EXPORT_XLSX],
+                        help="출력 형식, 0: xml [원문], 1: xml [원문 주석 + TODO], 2: xlsx [림왈도 서식] (기본값: config.dat)")
+    parser.add_argument('--collision', type=int, choices=range(4),
+                        help="파일 충돌 시, 0: 중단하기, 1: 덮어쓰기, 2: 병합하기, 3: 참조하기 (기본값: config.dat)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="동시에 처리할 모드 수")
+    parser.add_argument('--no-cache', action='store_true', help="추출 캐시를 사용하지 않음")
+    parser.add_argument('--no-memory', action='store_true', help="번역 메모리로 번역되지 않은 노드를 채우지 않음")
+    parser.add_argument('--delta-from', metavar='DIR',
+                        help="이전에 -o DIR로 출력한 결과와 비교해, 추가 * 변경된 노드와 목록만 <출력 위치>/<모드>_delta에 출력")
+    parser.add_argument('--prefilter', action='store_true',
+                        help="포함으로 분류된 태그도, Name * ParentName 속성도 없는 Defs 파일은 읽지 않음 (빠른 추출)")
+    parser.add_argument('--timings', action='store_true',
+                        help="단계별 * 파일별 소요 시간을 <출력 위치>/<모드>.timings.json 파일로 기록")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    failures = []
+    try:
+        Configures(headless=True)  # a missing config.dat is written here, not by every worker at once
+    except ValueError as e:  # an outdated config.dat
+        print(e, file=sys.stderr)
+        return 1
+    results = batchExtractAll(args.mods, args.out.replace('\\', '/').rstrip('/') or '.', args.jobs,
+                              tagFile=args.tags, exportType=args.type, collisionOption=args.collision,
+                              useCache=not args.no_cache, timed=args.timings, useMemory=not args.no_memory,
+                              prefilter=args.prefilter, deltaFrom=args.delta_from and (args.delta_from.replace('\\', '/').rstrip('/') or '.'))
+    for i, (modPath, result) in enumerate(results):
+        if result[-1]:
+            failures.append(modPath)
+        print(f"[{i + 1}/{len(args.mods)}] {formatBatchResult(*result)}", flush=True)
+
+    print(f"{len(args.mods) - len(failures)}/{len(args.mods)}개 모드 출력 완료, {time.perf_counter() - start:.2f}초")
+    return 1 if failures else 0
+
+
 if __name__ == '__main__':
+    freeze_support()
 
     with open("error_report.txt", 'w') as fout:
         pass
 
-    parentDefs = {}
+    if sys.argv[1:2] == ['--batch']:
+        sys.exit(batchMain(sys.argv[2:]))
 
-    dict_class = {}
-    dict_keyed = {}
-    list_strings = []
+    timingsFile = None
+    if sys.argv[1:2] == ['--timings'] and sys.argv[2:3]:  # the timings of each extraction and export, as JSON
+        timingsFile = sys.argv[2]
+        timings.enabled = True
 
     window = Tk()
     window.title("Alpha의 림월드 모드 언어 추출기")
@@ -1115,7 +3204,7 @@ if __name__ == '__main__':
     frame = Frame(window)
     frame.grid(row=0, column=0, sticky='NSWE')
 
-    for i in range(6):
+    for i in range(7):
         Grid.rowconfigure(frame, i, weight=1)
     for i in range(4):
         Grid.columnconfigure(frame, i, weight=1)
@@ -1151,253 +3240,6 @@ if __name__ == '__main__':
     btn4.grid(row=4, column=3, sticky='NSWE', padx=10, pady=5)
 
 
-    def exportXml():
-        for ch in "\\/:*?\"<>|":
-            if ch in Config.exportFileName.get():
-                return [3]
-        savedList = []
-        for className, tag_dict in dict_class.items():  # Defs / Patches
-            isThereNoIncludes = True
-            for lastTag, _ in tag_dict.values():  # check existence of include tag
-                if lastTag in Config.includes:
-                    isThereNoIncludes = False
-                    break
-            if isThereNoIncludes:
-                continue  # pass the class
-
-            filename = Config.exportDirName.get() + f'/Languages/{LANGUAGE}/DefInjected/' + className + '/' + Config.exportFileName.get() + '.xml'
-            Path('/'.join(filename.split('/')[:-1])).mkdir(parents=True, exist_ok=True)
-
-            if Config.collisionOption.get() == 0:  # collision -> stop
-                try:
-                    with open(filename, 'r', encoding='UTF8') as _:
-                        return 1, (className, WORD_NEWLINE.join(savedList))
-                except FileNotFoundError:
-                    pass
-
-            alreadyDefinedDict = {}
-            if Config.collisionOption.get() > 1:  # collision -> merge/refer
-                try:
-                    for node in list(et.parse(filename).getroot()):
-                        if list(node):
-                            alreadyDefinedDict[node.tag] = [li.text for li in list(node)]
-                        elif node.text != "TODO":
-                            alreadyDefinedDict[node.tag] = node.text
-                except FileNotFoundError:
-                    pass
-
-            writingTextList = []
-            for tag, (lastTag, text) in tag_dict.items():
-                if lastTag in Config.includes:
-                    if type(text) == list:
-                        try:
-                            for i, v in enumerate(alreadyDefinedDict[tag]):
-                                if alreadyDefinedDict[tag][i] != "TODO":
-                                    text[i] = alreadyDefinedDict[tag][i]
-                            del alreadyDefinedDict[tag]
-                        except TypeError:
-                            pass
-                        tmp = [f'    <!-- {text_i} -->{WORD_NEWLINE}    <li>TODO</li>' for text_i in text]
-                        writingTextList.append(
-                            f"  <{tag}>\n{WORD_NEWLINE.join(tmp)}\n  </{tag}>"
-                            if Config.exportType.get() == 1
-                            else f"  <{tag}>\n{WORD_NEWLINE.join([f'    <li>{t}</li>' for t in text])}\n  </{tag}>")
-                    else:
-                        try:
-                            writingTextList.append(f"  <!-- {text} -->\n  <{tag}>{alreadyDefinedDict[tag]}</{tag}>"
-                                                   if Config.exportType.get() == 1
-                                                   else f"  <{tag}>{alreadyDefinedDict[tag]}</{tag}>")
-                            del alreadyDefinedDict[tag]
-                        except KeyError:
-                            writingTextList.append(f"  <!-- {text} -->\n  <{tag}>TODO</{tag}>"
-                                                   if Config.exportType.get() == 1
-                                                   else f"  <{tag}>{text}</{tag}>")
-
-            with open(filename, 'w', encoding='UTF8') as fin:
-                fin.write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
-                fin.write('\n'.join(writingTextList))
-                if Config.collisionOption.get() == 2 and alreadyDefinedDict:  # collision -> merge
-                    fin.write("\n\n  <!-- 알파의 추출기는 추출하지 않았지만 이미 존재했던 노드들 \n\n")
-                    for tag, text in alreadyDefinedDict.items():
-                        if type(text) == list:
-                            fin.write(f"  <{tag}>\n")
-                            fin.write('\n'.join([f"    <li>{eachText}</li>" for eachText in text]))
-                            fin.write(f"\n  </{tag}>\n")
-                        else:
-                            fin.write(f"  <{tag}>{text}</{tag}>\n")
-                    fin.write("  -->")
-                fin.write("\n</LanguageData>")
-
-            savedList.append(className)
-
-        # Keyed
-        if len(dict_keyed) > 0:
-            filename = Config.exportDirName.get() + f'/Languages/{LANGUAGE}/Keyed/' + Config.exportFileName.get() + '.xml'
-            Path('/'.join(filename.split('/')[:-1])).mkdir(parents=True, exist_ok=True)
-
-            if Config.collisionOption.get() == 0:  # collision -> stop
-                try:
-                    with open(filename, 'r', encoding='UTF8') as _:
-                        return 1, ("Keyed", WORD_NEWLINE.join(savedList))
-                except FileNotFoundError:
-                    pass
-
-            alreadyDefinedDict = {}
-            if Config.collisionOption.get() > 1:  # collision -> merge/refer
-                try:
-                    for node in list(et.parse(filename).getroot()):
-                        if list(node):
-                            messagebox.showerror("기존 번역에서 내부 노드 발견됨",
-                                                 "본 프로그램은 Keyed 파일의 텍스트에 하위 노드(<>)가 없는 것으로 가정하였습니다. " +
-                                                 "해당 노드의 번역은 보존되지 않았을 수 있습니다.")
-                            alreadyDefinedDict[node.tag] = [li.text for li in list(node)]
-                        elif node.text != "TODO":
-                            alreadyDefinedDict[node.tag] = node.text
-                except FileNotFoundError:
-                    pass
-
-            writingTextList = []
-            for tag, text in dict_keyed.items():
-                text = text.replace('<', '&lt;')
-                try:
-                    writingTextList.append(f"  <!-- {text} -->\n  <{tag}>{alreadyDefinedDict[tag]}</{tag}>"
-                                           if Config.exportType.get() == 1
-                                           else f"  <{tag}>{alreadyDefinedDict[tag]}</{tag}>")
-                    del alreadyDefinedDict[tag]
-                except KeyError:
-                    writingTextList.append(f"  <!-- {text} -->\n  <{tag}>TODO</{tag}>"
-                                           if Config.exportType.get() == 1
-                                           else f"  <{tag}>{text}</{tag}>")
-
-            with open(filename, 'w', encoding='UTF8') as fin:
-                fin.write("""<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n""")
-                fin.write('\n'.join(writingTextList))
-                if Config.collisionOption.get() == 2 and alreadyDefinedDict:  # collision -> merge
-                    fin.write("\n\n  <!-- 알파의 추출기는 추출하지 않았지만 이미 존재했던 노드들 \n\n")
-                    for tag, text in alreadyDefinedDict.items():
-                        if type(text) == list:
-                            fin.write(f"  <{tag}>\n")
-                            fin.write('\n'.join([f"    <li>{eachText}</li>" for eachText in text]))
-                            fin.write(f"\n  </{tag}>\n")
-                        else:
-                            fin.write(f"  <{tag}>{text}</{tag}>\n")
-                    fin.write("  -->")
-                fin.write("\n</LanguageData>")
-
-            savedList.append("Keyed")
-
-        # Strings
-        for departure in Config.list_strings:
-            destination = Config.exportDirName.get() + f"/Languages/{LANGUAGE}/" + \
-                          departure.split('Languages\\English')[1]
-            if Config.collisionOption.get() != 1:  # collision -> not overwrite
-                try:
-                    with open(destination, 'r', encoding='UTF8') as _:
-                        return 1, ("Strings", WORD_NEWLINE.join(savedList))
-                except FileNotFoundError:
-                    pass
-
-            Path('\\'.join(destination.split('\\')[:-1])).mkdir(parents=True, exist_ok=True)
-            shutil.copy(departure, destination)
-
-        if Config.list_strings:
-            savedList.append("Strings")
-
-        return 0, savedList
-
-
-    def exportXlsx():
-        filename = Config.exportDirName.get() + '/' + Config.exportFileName.get() + '.xlsx'
-
-        alreadyDefinedDict = {}
-        if os.path.exists(filename):
-            if Config.collisionOption.get() == 0:  # collision -> stop
-                return 1
-            if Config.collisionOption.get() > 1:
-                with open(filename, "rb") as f:
-                    ioFile = io.BytesIO(f.read())
-                ws = load_workbook(ioFile, read_only=True).active
-                for row in ws.iter_rows(min_row=2, min_col=2, max_col=5, values_only=True):
-                    if any(row):
-                        try:
-                            alreadyDefinedDict[row[0]][row[1]] = row[3]
-                        except KeyError:
-                            alreadyDefinedDict[row[0]] = {row[1]: row[3]}
-
-        try:
-            Path('/'.join(filename.split('/')[:-1])).mkdir(parents=True, exist_ok=True)
-        except NotADirectoryError:
-            return 4
-
-        wb = Workbook()
-        ws = wb.active
-
-        writingList = [(className, tag, text)
-                       for className, tag_dict in dict_class.items()
-                       for tag, (lastTag, text) in tag_dict.items()
-                       if lastTag in Config.includes]
-
-        writingList += [('Keyed', tag, text) for tag, text in dict_keyed.items()]
-
-        fill = PatternFill(fill_type='solid', fgColor='ffffff')
-
-        ws.cell(row=1, column=1).value = "Class+Node [(Identifier (Key)]"
-        ws.cell(row=1, column=2).value = "Class [Not chosen]"
-        ws.cell(row=1, column=3).value = "Node [Not chosen]"
-        ws.cell(row=1, column=4).value = "EN [Source string]"
-        ws.cell(row=1, column=5).value = "KO [Translation]"
-        for j in range(1, 6):
-            ws.cell(row=1, column=j).fill = fill
-
-        ws.cell(row=1, column=6).value = "Configs [Not chosen]"
-        ws.cell(row=1, column=6).fill = PatternFill(fill_type='solid', fgColor='a6a6a6')
-        ws.cell(row=2, column=6).value = "pakageID"
-        ws.cell(row=2, column=6).fill = PatternFill(fill_type='solid', fgColor='f79646')
-        ws.cell(row=3, column=6).value = Config.pakageID
-        ws.cell(row=3, column=6).fill = PatternFill(fill_type='solid', fgColor='ffff00')
-        ws.cell(row=4, column=6).value = "modName (folderName)"
-        ws.cell(row=4, column=6).fill = PatternFill(fill_type='solid', fgColor='f79646')
-        ws.cell(row=5, column=6).value = Config.modName
-        ws.cell(row=5, column=6).fill = PatternFill(fill_type='solid', fgColor='ffff00')
-
-        for i, (className, tag, text) in enumerate(writingList):
-            ws.cell(row=i + 2, column=1).value = className + '+' + tag
-            ws.cell(row=i + 2, column=2).value = className
-            ws.cell(row=i + 2, column=3).value = tag
-            ws.cell(row=i + 2, column=4).value = text
-            for j in range(1, 6):
-                ws.cell(row=i + 2, column=j).fill = fill
-
-            if alreadyDefinedDict:
-                try:
-                    ws.cell(row=i + 2, column=5).value = alreadyDefinedDict[className][tag]
-                    ws.cell(row=i + 2, column=5).fill = fill
-                except KeyError:
-                    pass
-
-        try:
-            wb.save(filename)
-        except PermissionError:
-            return 2
-        except OSError:
-            return 3
-
-        # Strings
-        for departure in Config.list_strings:
-            destination = Config.exportDirName.get() + departure.split('Languages\\English')[1]
-            if Config.collisionOption.get() != 1:  # collision -> not overwrite
-                try:
-                    with open(destination, 'r', encoding='UTF8') as _:
-                        return 1
-                except FileNotFoundError:
-                    pass
-
-            Path('\\'.join(destination.split('\\')[:-1])).mkdir(parents=True, exist_ok=True)
-            shutil.copy(departure, destination)
-
-        return 0
-
-
     def export():
         if not Config.modName:
             messagebox.showerror("추출 모드가 선택되지 않음", "하! 이럴 인간이 있을 줄 알았지.")
@@ -1431,40 +3273,91 @@ if __name__ == '__main__':
             return
 
 
-    btn = Button(frame, text="5. 추출한 노드 출력하기", command=export)
+    def exportWithTimings():
+        export()
+        if timingsFile:
+            timings.write(timingsFile, mod=Config.modName, packageId=Config.pakageID)
+
+
+    btn = Button(frame, text="5. 추출한 노드 출력하기", command=exportWithTimings)
     btn.grid(row=5, column=1, columnspan=2, padx=10, pady=5, sticky='NSWE')
 
 
+    def exportChanges():
+        if not Config.modName:
+            messagebox.showerror("추출 모드가 선택되지 않음", "하! 이럴 인간이 있을 줄 알았지.")
+            return
+        if Config.exportType.get() == EXPORT_XLSX:
+            previousPath = filedialog.askopenfilename(initialdir='./', title="이전에 출력한 xlsx 파일",
+                                                      filetypes=[("xlsx", "*.xlsx")])
+        else:
+            previousPath = filedialog.askdirectory(initialdir='./', title="이전에 출력한 폴더 (DefInjected / Keyed)")
+        if not previousPath:
+            return
+        result, manifest = exportDelta(previousPath)
+        if result == 5:
+            messagebox.showerror("이전 출력 없음", "선택한 위치에서 이전에 출력한 노드를 읽을 수 없습니다.")
+        elif result == 6:
+            messagebox.showerror("폴더 충돌", f"{Config.exportDirName.get()}_delta 폴더가 이미 있지만 변경분을 출력한 폴더가 아닙니다.\n" +
+                                 "폴더를 옮기거나 지운 뒤 다시 시도해 주세요.")
+        elif result != 0:
+            messagebox.showerror("파일 저장 오류", "변경분을 저장하지 못했습니다. 출력 파일 / 폴더의 이름과 엑셀 파일이 열려있는지 확인해 주세요.")
+        else:
+            messagebox.showinfo("변경분 저장 완료",
+                                f"추가 {len(manifest['added'])}개, 변경 {len(manifest['changed'])}개, " +
+                                f"삭제 {len(manifest['removed'])}개의 노드를 찾았습니다.\n" +
+                                (f"이전 출력에 원문(EN 주석 / 열)이 없어 비교하지 못한 노드 {len(manifest['unknown'])}개는 " +
+                                 "출력하지 않고 목록에만 적었습니다.\n" if manifest['unknown'] else "") +
+                                f"추가 * 변경된 노드와 목록(.delta.json)을 {Config.exportDirName.get()}_delta 폴더에 저장하였습니다.")
+
+
+    deltaBtn = Button(frame, text="(이전 출력과 비교해 변경분만 출력)", command=exportChanges)
+    deltaBtn.grid(row=6, column=1, columnspan=2, padx=10, pady=5, sticky='NSWE')
+
+
     def convert_xlsx_2_xml():
-        if filename := filedialog.askopenfilename(initialdir='./'):
-            convertXLSX2XML(filename)
+        if filenames := filedialog.askopenfilenames(initialdir='./', filetypes=[("xlsx", "*.xlsx")]):
+            convertXLSX2XML(window, list(filenames))
 
 
     convert_xlsx_2_xml_Btn = Button(frame, text="(XLSX -> XML)", command=convert_xlsx_2_xml)
     convert_xlsx_2_xml_Btn.grid(row=5, column=3, padx=10, pady=5, sticky='NSWE')
 
 
+    def convert_xlsx_dir_2_xml():
+        if not (dirname := filedialog.askdirectory(initialdir='./', title="변환할 xlsx 파일들이 있는 폴더")):
+            return
+        dirListings.pop(dirname, None)
+        filenames = [f"{dirname}/{name}" for name in scanDir(dirname)[1]
+                     if name.lower().endswith('.xlsx') and not name.startswith('~$')]  # ~$: lock files of Excel
+        if not filenames:
+            messagebox.showerror("xlsx 파일 없음", "선택한 폴더에 xlsx 파일이 없습니다.")
+            return
+        convertXLSX2XML(window, filenames)
+
+
+    convert_xlsx_dir_2_xml_Btn = Button(frame, text="(폴더의 모든 XLSX -> XML)", command=convert_xlsx_dir_2_xml)
+    convert_xlsx_dir_2_xml_Btn.grid(row=6, column=3, padx=10, pady=5, sticky='NSWE')
+
+
     def convert_xml_2_xlsx():
-        if dirname := filedialog.askdirectory(initialdir='./'):
-            convertXML2XLSX(dirname)
+        if not (dirname := filedialog.askdirectory(initialdir='./', title=f"번역된 언어 폴더 (Languages/{LANGUAGE})")):
+            return
+        modName = dirname.rstrip('/').split('/Languages')[0].split('/')[-1]
+        if os.path.exists(f"{modName}.xlsx") and not messagebox.askyesno(
+                "파일 충돌", f"{modName}.xlsx 파일이 이미 존재합니다. 덮어쓸까요?"):
+            return
+        convertXML2XLSX(window, dirname)
 
 
     convert_xml_2_xlsx_Btn = Button(frame, text="(XML -> XLSX)", command=convert_xml_2_xlsx)
     convert_xml_2_xlsx_Btn.grid(row=5, column=0, padx=10, pady=5, sticky='NSWE')
-    convert_xml_2_xlsx_Btn['state'] = 'disabled'
 
-    try:
-        versionURL = "https://raw.githubusercontent.com/dlgks224/AlphaExtractor/master/CURRENT_VERSION"
-        serverVersion = urllib.request.urlopen(versionURL).read().decode("utf-8").replace('\n', '')
-        if EXTRACTOR_VERSION != serverVersion:
-            if messagebox.askyesno("업데이트 가능",
-                                   "새로운 버전의 추출기가 발견되었습니다.\n\n" +
-                                   f"업데이트 버전 : {EXTRACTOR_VERSION} -> {serverVersion}\n\n다운로드 페이지를 열까요?"):
-                import webbrowser
+    if timingsFile:  # the time from the import to the first drawn window, which benchmarks/bench_startup.py waits for
+        window.update()
+        timings.add('firstWindow', time.time() - timings.started)
+        timings.write(timingsFile)
 
-                webbrowser.open_new('https://github.com/dlgks224/AlphaExtractor/releases')
-                exit(0)
-    except (urllib.error.HTTPError, urllib.error.URLError):
-        pass
+    checkUpdate(window)
 
     window.mainloop()
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS, '..', 'src'))
+sys.path.insert(0, os.path.join(TESTS, '..', 'benchmarks'))  # genmod
+
+import AlphaExtractor  # noqa: E402
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """
+    A headless Config of tmp_path/config.dat with nothing extracted. tmp_path is the working folder,
+    where the extraction cache and the translation memory go.
+    """
+    monkeypatch.chdir(tmp_path)
+    AlphaExtractor.Config = AlphaExtractor.Configures(str(tmp_path / 'config.dat'), headless=True)
+    AlphaExtractor.clearExtraction()
+    return AlphaExtractor.Config
@@ -0,0 +1,40 @@
+import os
+
+import AlphaExtractor
+from genmod import generateMod
+
+
+def readTree(folder):
+    files = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            with open(os.path.join(root, name), 'rb') as fin:
+                files[os.path.relpath(os.path.join(root, name), folder)] = fin.read()
+    return files
+
+
+def test_parallel_jobs_share_the_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mods = []
+    for i in range(3):
+        mods.append(f"mod{i}")
+        generateMod(mods[-1], defs=200 + i, seed=i)
+
+    args = ['--collision', '1', '--type', '1', '--no-memory', '-j', str(len(mods))]
+    assert AlphaExtractor.batchMain(mods + args + ['-o', 'cold']) == 0
+    assert os.path.exists('extract_cache.db')
+    assert AlphaExtractor.batchMain(mods + args + ['-o', 'warm']) == 0  # every file read from the cache
+    assert AlphaExtractor.batchMain(mods + args + ['-o', 'nocache', '--no-cache']) == 0
+
+    assert readTree('cold') == readTree('warm') == readTree('nocache')
+    assert len(readTree('cold')) > len(mods)
+
+
+def test_outdated_config_stops_the_batch(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.dat').write_text('\n'.join(["Alpha's Extractor Configure file", "", "", "0"]) + '\n',
+                                         encoding='UTF8')
+    generateMod('mod0', defs=10)
+    assert AlphaExtractor.batchMain(['mod0', '-o', 'out']) == 1
+    assert 'config.dat' in capsys.readouterr().err
+    assert not (tmp_path / 'out').exists()
@@ -0,0 +1,17 @@
+import os
+
+import AlphaExtractor
+
+
+def test_new_config_is_written_where_it_is_read(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fileName = str(tmp_path / 'settings' / 'config.dat')
+    os.mkdir(tmp_path / 'settings')
+    config = AlphaExtractor.Configures(fileName, headless=True)
+    assert os.path.exists(fileName)
+    assert not os.path.exists(tmp_path / 'config.dat')
+
+    config.collisionOption.set(2)
+    config.write()
+    assert AlphaExtractor.Configures(fileName, headless=True).collisionOption.get() == 2
+    assert not os.path.exists(tmp_path / 'config.dat')
@@ -0,0 +1,51 @@
+import pytest
+
+import AlphaExtractor
+
+
+def writeLanguage(modPath, language, label):
+    folder = modPath / 'Languages' / language / 'DefInjected' / 'ThingDef'
+    folder.mkdir(parents=True)
+    (folder / 'Things.xml').write_text(f'<LanguageData>\n  <!-- EN: thing -->\n  <Thing.label>{label}</Thing.label>\n'
+                                       '</LanguageData>', encoding='UTF8')
+
+
+def sheetRows(filename):
+    from openpyxl import load_workbook
+
+    ws = load_workbook(filename, read_only=True).active
+    return [row[:5] for row in ws.iter_rows(min_row=2, values_only=True) if row[0]]
+
+
+@pytest.fixture
+def mod(tmp_path):
+    modPath = tmp_path / 'Mod'
+    writeLanguage(modPath, 'English', 'thing')
+    writeLanguage(modPath, AlphaExtractor.LANGUAGE, '물건')
+    return modPath
+
+
+@pytest.mark.parametrize('picked', ['', '/Languages', f'/Languages/{AlphaExtractor.LANGUAGE}'])
+def test_only_the_target_language_is_converted(mod, tmp_path, picked):
+    filename, nodes, classes, unreadFiles, _, error = AlphaExtractor.convertLanguageTree(
+        str(mod) + picked, str(tmp_path / 'out'), jobs=1)
+    assert (nodes, classes, unreadFiles, error) == (1, 1, 0, "")
+    assert sheetRows(filename) == [('ThingDef+Thing.label', 'ThingDef', 'Thing.label', 'thing', '물건')]
+
+
+def test_languages_without_the_target_language_are_refused(tmp_path):
+    writeLanguage(tmp_path / 'Mod', 'English', 'thing')
+    writeLanguage(tmp_path / 'Mod', 'Japanese', '物')
+    result = AlphaExtractor.convertLanguageTree(str(tmp_path / 'Mod/Languages'), str(tmp_path / 'out'), jobs=1)
+    assert result[1] == 0 and AlphaExtractor.LANGUAGE in result[-1]
+    assert not (tmp_path / 'out').exists()
+
+
+def test_unwritable_output_is_reported(mod, tmp_path):
+    (tmp_path / 'out').write_text('a file, not a folder')
+    assert AlphaExtractor.convertLanguageTree(str(mod), str(tmp_path / 'out'), jobs=1)[-1]
+
+
+def test_unsavable_sheet_is_reported(mod, tmp_path):
+    (tmp_path / 'out' / 'Mod.xlsx').mkdir(parents=True)
+    assert AlphaExtractor.convertLanguageTree(str(mod), str(tmp_path / 'out'), jobs=1)[-1]
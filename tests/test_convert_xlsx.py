@@ -0,0 +1,53 @@
+import os
+
+import AlphaExtractor
+
+
+def writeSheet(filename, modName, rows):
+    """rows of (class, node, translation)"""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    configColumn = ["Configs [Not chosen]", "pakageID", f"test.{modName}", "modName (folderName)", modName]
+    ws.append(["Class+Node [(Identifier (Key)]", "Class [Not chosen]", "Node [Not chosen]", "EN [Source string]",
+               "KO [Translation]", configColumn[0]])
+    for i in range(1, max(len(rows) + 1, len(configColumn))):
+        row = [f"{rows[i - 1][0]}+{rows[i - 1][1]}", rows[i - 1][0], rows[i - 1][1], "source", rows[i - 1][2]] \
+            if i <= len(rows) else [None] * 5
+        ws.append(row + [configColumn[i]] if i < len(configColumn) else row)
+    wb.save(filename)
+
+
+def readClass(outDir, modName, className):
+    with open(f"{outDir}/{modName}/Languages/{AlphaExtractor.LANGUAGE}/DefInjected/{className}/{modName}.xml",
+              encoding='UTF8') as fin:
+        return fin.read()
+
+
+def test_files_of_one_mod_are_not_converted_together(tmp_path):
+    filenames = [str(tmp_path / name) for name in ('A.xlsx', 'B.xlsx', 'C.xlsx')]
+    writeSheet(filenames[0], 'Mod', [('ThingDef', 'Thing.label', '첫째')])
+    writeSheet(filenames[1], 'Other', [('ThingDef', 'Thing.label', '둘째')])
+    writeSheet(filenames[2], 'mod', [('ThingDef', 'Thing.label', '셋째')])
+    outDir = str(tmp_path / 'out')
+    results = dict(AlphaExtractor.convertXlsxFiles(filenames, outDir, jobs=3))
+
+    assert results[filenames[1]][1:4] == (1, 1, 0) and not results[filenames[1]][-1]
+    converted, failed = sorted((filenames[0], filenames[2]), key=lambda filename: bool(results[filename][-1]))
+    assert results[converted][1:4] == (1, 1, 0) and not results[converted][-1]
+    assert os.path.basename(converted) in results[failed][-1]
+    translation = '첫째' if converted == filenames[0] else '셋째'
+    assert f'<Thing.label>{translation}</Thing.label>' in readClass(outDir, results[converted][0], 'ThingDef')
+    assert not any(name.endswith('.tmp') for _, _, names in os.walk(outDir) for name in names)
+
+
+def test_repeated_node_takes_its_last_translation(tmp_path):
+    filename = str(tmp_path / 'Mod.xlsx')
+    writeSheet(filename, 'Mod', [('ThingDef', 'A.label', '옛 번역'), ('ThingDef', 'B.label', '나'),
+                                 ('ThingDef', 'A.label', '고친 번역'), ('HediffDef', 'C.label', '다')])
+    outDir = str(tmp_path / 'out')
+    assert AlphaExtractor.convertXlsxFile(filename, outDir)[1:4] == (3, 2, 1)
+    text = readClass(outDir, 'Mod', 'ThingDef')
+    assert '고친 번역' in text and '옛 번역' not in text and text.count('<B.label>') == 1
+    assert '<C.label>다</C.label>' in readClass(outDir, 'Mod', 'HediffDef')
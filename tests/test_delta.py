@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+import AlphaExtractor
+
+
+@pytest.fixture
+def workDir(config, tmp_path):
+    config.exportDirName.set('out')
+    config.exportFileName.set('Mod')
+    config.modName = 'Mod'
+    AlphaExtractor.dict_class.add('ThingDef', 'Thing.label', 'label', 'thing')
+    AlphaExtractor.dict_class.add('ThingDef', 'Other.label', 'label', 'new text')
+    config.tagSort = AlphaExtractor.TagClassification(includes=['label'])
+    return tmp_path
+
+
+def writePrevious(workDir):
+    """A translation of the game's layout, with "EN:" source comments."""
+    folder = workDir / 'previous' / 'DefInjected' / 'ThingDef'
+    folder.mkdir(parents=True)
+    (folder / 'Things.xml').write_text('<LanguageData>\n  <!-- EN: thing -->\n  <Thing.label>물건</Thing.label>\n'
+                                       '  <!-- EN: old text -->\n  <Other.label>옛 글</Other.label>\n'
+                                       '</LanguageData>', encoding='UTF8')
+    return str(workDir / 'previous')
+
+
+def test_source_comment_is_read_without_prefix(workDir):
+    assert AlphaExtractor.readPreviousExport(writePrevious(workDir)) == {
+        ('ThingDef', 'Thing.label'): 'thing', ('ThingDef', 'Other.label'): 'old text'}
+    assert AlphaExtractor.readCommentedPairs(str(workDir / 'previous/DefInjected/ThingDef/Things.xml')) == [
+        ('thing', '물건'), ('old text', '옛 글')]
+
+
+def test_delta_holds_only_changed_nodes(workDir):
+    result, manifest = AlphaExtractor.exportDelta(writePrevious(workDir))
+    assert result == 0
+    assert manifest['added'] == [] and manifest['removed'] == []
+    assert [node['tag'] for node in manifest['changed']] == ['Other.label']
+    with open(workDir / 'out_delta' / 'Mod.delta.json', encoding='UTF8') as fin:
+        assert json.load(fin) == manifest
+    # the full export keeps its own folder and both nodes
+    assert not (workDir / 'out').exists()
+    assert sorted(tag for tag, _, _ in AlphaExtractor.dict_class.items('ThingDef')) == ['Other.label', 'Thing.label']
+
+
+def test_delta_needs_an_export_folder(workDir):
+    previous = writePrevious(workDir)
+    (workDir / '_delta').mkdir()
+    (workDir / '_delta' / 'keep.txt').write_text('keep')
+    for exportDirName in ('', '/', ' '):
+        AlphaExtractor.Config.exportDirName.set(exportDirName)
+        assert AlphaExtractor.exportDelta(previous) == (4, None)
+    assert (workDir / '_delta' / 'keep.txt').exists()
+
+
+def test_nodes_without_source_are_not_compared(workDir):
+    folder = workDir / 'previous' / 'DefInjected' / 'ThingDef'
+    folder.mkdir(parents=True)
+    (folder / 'Things.xml').write_text('<LanguageData>\n  <Thing.label>물건</Thing.label>\n'
+                                       '  <Other.label>옛 글</Other.label>\n</LanguageData>', encoding='UTF8')
+    result, manifest = AlphaExtractor.exportDelta(str(workDir / 'previous'))
+    assert result == 0
+    assert manifest['changed'] == [] and manifest['added'] == [] and manifest['removed'] == []
+    assert sorted(node['tag'] for node in manifest['unknown']) == ['Other.label', 'Thing.label']
+    assert not (workDir / 'out_delta' / 'DefInjected').exists()
+
+
+def test_delta_overwrites_only_its_own_folder(workDir):
+    previous = writePrevious(workDir)
+    (workDir / 'out_delta').mkdir()
+    (workDir / 'out_delta' / 'notes.txt').write_text('mine')
+    assert AlphaExtractor.exportDelta(previous) == (6, None)
+    assert (workDir / 'out_delta' / 'notes.txt').read_text() == 'mine'
+
+    (workDir / 'out_delta' / 'notes.txt').unlink()
+    assert AlphaExtractor.exportDelta(previous)[0] == 0
+    (workDir / 'out_delta' / 'stale.txt').write_text('from the last delta')
+    assert AlphaExtractor.exportDelta(previous)[0] == 0
+    assert not (workDir / 'out_delta' / 'stale.txt').exists()
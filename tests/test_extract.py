@@ -0,0 +1,24 @@
+import threading
+
+import AlphaExtractor
+
+
+def test_cancelled_extraction_leaves_nothing_stale(config, tmp_path):
+    (tmp_path / 'Defs').mkdir()
+    (tmp_path / 'Defs' / 'Things.xml').write_text(
+        '<Defs><ThingDef><defName>A</defName><label>thing</label></ThingDef></Defs>', encoding='UTF8')
+    defsPath = str(tmp_path / 'Defs').replace('\\', '/')
+
+    assert AlphaExtractor.extractNodes([defsPath])[0] == 0
+    AlphaExtractor.classifyTags([], ['label'])
+    assert 'label' in config.dict_tags_text
+
+    config.modName = 'Mod'
+    config.exportDirName.set('Mod')
+    cancel = threading.Event()
+    cancel.set()
+    AlphaExtractor.clearExtraction()  # as the extraction of another mod does, once confirmed
+    assert AlphaExtractor.extractNodes([defsPath], cancel=cancel) == (2, None)
+    assert not list(AlphaExtractor.dict_class) and not config.dict_tags_text
+    assert not config.tagSort.tagSet(AlphaExtractor.TAG_INCLUDE)
+    assert not config.modName and not config.exportDirName.get()
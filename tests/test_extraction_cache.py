@@ -0,0 +1,104 @@
+import multiprocessing
+import time
+
+import AlphaExtractor
+
+
+def fillCache(cacheFile, paths):
+    """Holds the cache open like a long extraction, putting and reading an entry now and then."""
+    cache = AlphaExtractor.ExtractionCache(cacheFile)
+    try:
+        for path in paths:
+            cache.put(path, [('ThingDef', 'label', path, 'text')], [], [])
+            time.sleep(0.05)
+            assert cache.get(path)
+    finally:
+        cache.close()
+
+
+def test_processes_share_the_cache(tmp_path):
+    cacheFile = str(tmp_path / 'extract_cache.db')
+    jobs = []
+    for worker in range(3):
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"{worker}_{i}.xml"
+            path.write_text('<Defs />')
+            paths.append(str(path))
+        jobs.append(paths)
+
+    with multiprocessing.get_context('spawn').Pool(len(jobs)) as pool:
+        pool.starmap(fillCache, [(cacheFile, paths) for paths in jobs])
+
+    cache = AlphaExtractor.ExtractionCache(cacheFile)
+    try:
+        assert all(cache.get(path) for paths in jobs for path in paths)
+    finally:
+        cache.close()
+
+
+def putOne(cacheFile, path, barrier):
+    barrier.wait()
+    cache = AlphaExtractor.ExtractionCache(cacheFile)
+    try:
+        cache.put(path, [path], [], [])
+    finally:
+        cache.close()
+
+
+def test_processes_create_the_cache_at_once(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"{i}.xml"
+        path.write_text('<Defs />')
+        paths.append(str(path))
+
+    context = multiprocessing.get_context('spawn')
+    for attempt in range(3):  # the first opening of a new file is the racy one
+        cacheFile = str(tmp_path / f'extract_cache{attempt}.db')
+        barrier = context.Barrier(len(paths))
+        workers = [context.Process(target=putOne, args=(cacheFile, path, barrier)) for path in paths]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert [worker.exitcode for worker in workers] == [0] * len(paths)
+
+        cache = AlphaExtractor.ExtractionCache(cacheFile)
+        try:
+            assert all(cache.get(path) == ([path], [], []) for path in paths)
+        finally:
+            cache.close()
+
+
+def test_open_cache_does_not_lock_out_another(tmp_path):
+    cacheFile = str(tmp_path / 'extract_cache.db')
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"{i}.xml"
+        path.write_text('<Defs />')
+        paths.append(str(path))
+
+    first = AlphaExtractor.ExtractionCache(cacheFile)
+    second = AlphaExtractor.ExtractionCache(cacheFile)
+    try:
+        first.put(paths[0], ['first'], [], [])
+        assert first.get(paths[0])
+        second.put(paths[1], ['second'], [], [])  # while first is still open
+        assert second.get(paths[0]) == (['first'], [], [])
+    finally:
+        second.close()
+        first.close()
+
+
+def test_entry_of_a_changed_file_is_dropped(tmp_path):
+    path = tmp_path / 'a.xml'
+    path.write_text('<Defs />')
+    cache = AlphaExtractor.ExtractionCache(str(tmp_path / 'extract_cache.db'))
+    try:
+        cache.put(str(path), ['extract'], [], [])
+        assert cache.get(str(path)) == (['extract'], [], [])
+        path.write_text('<Defs></Defs>')
+        assert cache.get(str(path)) is None
+    finally:
+        cache.close()
@@ -0,0 +1,42 @@
+import pytest
+
+import AlphaExtractor
+
+INCLUDES = ['label', 'description']
+
+
+@pytest.fixture
+def mod(config, tmp_path):
+    (tmp_path / 'Defs').mkdir()
+    (tmp_path / 'Patches').mkdir()
+    (tmp_path / 'Defs' / 'Child.xml').write_text(
+        '<Defs><ThingDef ParentName="PatchBase"><defName>Child</defName><stackLimit>75</stackLimit></ThingDef></Defs>',
+        encoding='UTF8')
+    (tmp_path / 'Defs' / 'Plain.xml').write_text(
+        '<Defs><ThingDef><defName>Plain</defName><stackLimit>75</stackLimit></ThingDef></Defs>', encoding='UTF8')
+    (tmp_path / 'Patches' / 'Base.xml').write_text(
+        '<Patch><Operation Class="PatchOperationAdd"><xpath>Defs</xpath><value>'
+        '<ThingDef Name="PatchBase" Abstract="True"><label>from a patch</label></ThingDef>'
+        '</value></Operation></Patch>', encoding='UTF8')
+    return str(tmp_path).replace('\\', '/')
+
+
+def extract(mod, prefilter):
+    AlphaExtractor.dict_class.clear()
+    assert AlphaExtractor.extractNodes([f"{mod}/Defs", f"{mod}/Patches"], prefilter=prefilter)[0] == 0
+    AlphaExtractor.classifyTags([], INCLUDES)
+    includes = AlphaExtractor.Config.tagSort.tagSet(AlphaExtractor.TAG_INCLUDE)
+    return sorted((className, tag, text) for className in AlphaExtractor.dict_class
+                  for tag, lastTag, text in AlphaExtractor.dict_class.items(className) if lastTag in includes)
+
+
+def test_parent_defined_in_patches_keeps_its_children(mod):
+    nodes = extract(mod, None)
+    assert ('ThingDef', 'Child.label', 'from a patch') in nodes
+    assert extract(mod, AlphaExtractor.compilePrefilter(INCLUDES)) == nodes
+    assert AlphaExtractor.Config.prefilteredFiles == 1  # Plain.xml only
+
+
+def test_pattern_matches_whole_tags():
+    pattern = AlphaExtractor.compilePrefilter(INCLUDES)
+    assert pattern.search(b'<label>') and not pattern.search(b'<labelShort>')
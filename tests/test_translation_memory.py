@@ -0,0 +1,88 @@
+import xml.etree.ElementTree as et
+
+import pytest
+
+import AlphaExtractor
+
+SOURCE = "x &amp; y &lt;z"  # escaped, as the extractor keeps texts
+TRANSLATION = "가 & 나 <다"
+
+
+@pytest.fixture
+def workDir(config, tmp_path):  # translation_memory.db goes to the working folder, tmp_path
+    config.collisionOption.set(1)
+    config.useTranslationMemory.set(1)
+    config.exportDirName.set('out')
+    config.exportFileName.set('Mod')
+    config.modName = 'Mod'
+    AlphaExtractor.dict_class.add('ThingDef', 'Thing.label', 'label', SOURCE)
+    config.tagSort = AlphaExtractor.TagClassification(includes=['label'])
+    return tmp_path
+
+
+def remember(path):
+    memory = AlphaExtractor.TranslationMemory()
+    try:
+        assert memory.addPath(str(path)) == 1
+    finally:
+        memory.close()
+
+
+def rememberXml(workDir):
+    path = workDir / 'Old.xml'
+    path.write_text(f'<LanguageData>\n  <!-- EN: {SOURCE} -->\n  <Thing.label>가 &amp; 나 &lt;다</Thing.label>\n'
+                    '</LanguageData>', encoding='UTF8')
+    remember(path)
+
+
+def rememberXlsx(workDir):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.active.append(["Class+Node", "Class", "Node", "EN", "KO"])
+    wb.active.append(["ThingDef+Thing.label", "ThingDef", "Thing.label", SOURCE, "가 &amp; 나 &lt;다"])
+    wb.save(workDir / 'Old.xlsx')
+    remember(workDir / 'Old.xlsx')
+
+
+def exportedXmlText():
+    AlphaExtractor.Config.exportType.set(AlphaExtractor.EXPORT_XML_PLAIN)
+    assert AlphaExtractor.exportXml()[0] == 0
+    root = et.parse(f"out/Languages/{AlphaExtractor.LANGUAGE}/DefInjected/ThingDef/Mod.xml").getroot()
+    return root.find('Thing.label').text
+
+
+def convertedXlsxText(writeOnly):
+    AlphaExtractor.Config.exportType.set(AlphaExtractor.EXPORT_XLSX)
+    assert AlphaExtractor.exportXlsx(writeOnly=writeOnly) == 0
+    result = AlphaExtractor.convertXlsxFile('out/Mod.xlsx', 'converted')
+    assert not result[-1], result
+    root = et.parse(f"converted/Mod/Languages/{AlphaExtractor.LANGUAGE}/DefInjected/ThingDef/Mod.xml").getroot()
+    return root.find('Thing.label').text
+
+
+@pytest.mark.parametrize('rememberFrom', [rememberXml, rememberXlsx])
+def test_xml_export_escapes_a_remembered_translation_once(workDir, rememberFrom):
+    rememberFrom(workDir)
+    assert exportedXmlText() == TRANSLATION
+
+
+@pytest.mark.parametrize('writeOnly', [True, False])
+@pytest.mark.parametrize('rememberFrom', [rememberXml, rememberXlsx])
+def test_xlsx_export_round_trips_a_remembered_translation(workDir, rememberFrom, writeOnly):
+    rememberFrom(workDir)
+    assert convertedXlsxText(writeOnly) == TRANSLATION
+
+
+def test_folder_is_walked_for_xml_and_xlsx(workDir):
+    folder = workDir / 'Languages' / 'Korean' / 'DefInjected' / 'ThingDef'
+    folder.mkdir(parents=True)
+    (folder / 'A.XML').write_text('<LanguageData>\n  <!-- EN: one -->\n  <A.label>하나</A.label>\n</LanguageData>',
+                                  encoding='UTF8')
+    (folder / 'notes.txt').write_text('<!-- EN: two -->')
+    memory = AlphaExtractor.TranslationMemory()
+    try:
+        assert memory.addPath(str(workDir / 'Languages')) == 1
+        assert memory.get('one') == '하나'
+    finally:
+        memory.close()
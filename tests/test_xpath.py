@@ -0,0 +1,44 @@
+import pytest
+
+import AlphaExtractor
+
+
+@pytest.mark.parametrize('xpath, className, paths', [
+    ('Defs/ThingDef[defName="A"]/label', 'ThingDef', (('A', 'label'),)),
+    ('/Defs/ThingDef[defName="A" or defName="B"]/description', 'ThingDef',
+     (('A', 'description'), ('B', 'description'))),
+    ('Defs/ThingDef[defName="A"]/comps/li[1]/label', 'ThingDef', (('A', 'comps', '1', 'label'),)),
+    ('Defs/ThingDef[defName="A"]/comps/li[@Class="X"]/label', 'ThingDef', (('A', 'comps', 'X', 'label'),)),
+    ('Defs/ThingDef[defName="A"]/rules/li[text()="r->x"]', 'ThingDef', (('A', 'rules', 'r->x'),)),
+])
+def test_compiled_paths(xpath, className, paths):
+    selector = AlphaExtractor.compileXpath(xpath)
+    assert selector and (selector.className, selector.paths) == (className, paths)
+
+
+@pytest.mark.parametrize('xpath, reason', [
+    ('Defs/ThingDef[defName="A"]/../label', 1),
+    ('Defs/ThingDef[defName="A"]/comps/li[last()]/label', 2),
+    ('Defs/ThingDef[defName="A"]/comps/li[position()=1]/label', 2),
+    ('Defs/ThingDef[contains(defName, "A")]/label', 2),
+    ('Defs/*[starts-with(@Name, "Base")]/label', 2),
+    ('Defs/ThingDef[defName="A"]/label/text()', 2),
+    ('Defs/ThingDef[defName="A"]/label[text()="x"]', 2),
+    ('Defs/ThingDef[defName="A"]/label$', 2),
+    ('Defs/ThingDef[defName!="A"]/label', 3),
+    ('Defs/ThingDef[defName="A"][defName="B"]/label', 3),
+    ('Defs/ThingDef[defName="A"="B"]/label', 3),
+    ('Defs/ThingDef[defName="A" and label="B"]/label', 4),
+    ('Defs/ThingDef[label="A" or defName="B"]/label', 4),
+    ('Defs/ThingDef[defName=""]/label', 4),
+    ('Defs/ThingDef[defName="A"]/comps/li[@Class!="X"]/label', 5),
+    ('Defs/ThingDef[defName="A"]/comps/li[1][2]/label', 5),
+    ('Defs/ThingDef[defName="A"]//label', 6),
+    ('Defs/ThingDef[defName="A"]/*/label', 6),
+    ('Defs/ThingDef[defName="A"]/comps[1]/label', 6),
+    ('Defs/ThingDef/label', 7),
+    ('Defs/*[defName="A"]/label', -1),
+])
+def test_reasons(xpath, reason):
+    selector = AlphaExtractor.compileXpath(xpath)
+    assert not selector and selector.reason == reason